@@ -0,0 +1,155 @@
+"""
+チャンク単位のプロセス並列実行
+
+selfplay.py・simulate.py・parallel_reversi.py で共通に使う。
+仕事をチャンクに分けて ProcessPoolExecutor で実行し、結果をチャンクの順に返す。
+実行中のチャンクはワーカー数の数倍までに抑えるので、数百万局を指定しても
+全チャンクを一度に投入せず、結果も先頭から順に受け取って手放せる。
+
+対局のチャンクの乱数の種は (seed, チャンク番号) で決まるので、
+ワーカー数によらず同じ設定なら同じ結果になる。
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+R = TypeVar('R')
+
+
+# 実行中にしておくチャンクの数（ワーカー1つあたり）
+MAX_PENDING_PER_WORKER: int = 4
+
+
+def resolve_workers(workers: int | None) -> int:
+    """
+    ワーカープロセス数を決める
+
+    Args:
+        workers: 指定されたワーカー数（None または 0 なら CPU 数）
+
+    Returns:
+        1以上のワーカー数
+
+    Raises:
+        ValueError: workers が負の場合
+    """
+    if workers is not None and workers < 0:
+        raise ValueError(f"ワーカー数は0以上を指定してください（{workers}）")
+    return workers or os.cpu_count() or 1
+
+
+def workers_argument(text: str) -> int:
+    """
+    --workers の値を解析する（argparse の type に渡す）
+
+    Args:
+        text: コマンドラインの値
+
+    Returns:
+        0以上のワーカー数（0 なら CPU 数）
+
+    Raises:
+        argparse.ArgumentTypeError: 整数でない、または負の場合
+    """
+    try:
+        workers = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"整数を指定してください: {text!r}") from None
+    if workers < 0:
+        raise argparse.ArgumentTypeError(f"0以上を指定してください: {workers}")
+    return workers
+
+
+def game_chunks(games: int, chunk_games: int, seed: int) -> Iterator[tuple[int, int, int]]:
+    """
+    games 局を chunk_games 局ずつのチャンクに分ける
+
+    Args:
+        games: 対局数
+        chunk_games: 1チャンクあたりの対局数
+        seed: 乱数の種
+
+    Returns:
+        (乱数の種, チャンク番号, そのチャンクの対局数) を順に返すイテレータ
+        （チャンクの数だけのリストは作らない）
+
+    Raises:
+        ValueError: chunk_games が1未満の場合（呼び出した時点で送出する）
+    """
+    if chunk_games < 1:
+        raise ValueError("chunk_games は1以上を指定してください")
+    return (
+        (seed, 番号, min(chunk_games, games - 開始))
+        for 番号, 開始 in enumerate(range(0, games, chunk_games))
+    )
+
+
+def chunk_rng(seed: int, chunk_index: int) -> random.Random:
+    """
+    チャンクの乱数生成器を作る（(seed, chunk_index) だけで決まる）
+
+    Args:
+        seed: 乱数の種
+        chunk_index: チャンク番号
+
+    Returns:
+        乱数生成器
+    """
+    return random.Random(f"{seed}:{chunk_index}")
+
+
+def map_chunks(
+    function: Callable[..., R],
+    chunks: Iterable[tuple[Any, ...]],
+    workers: int | None = None
+) -> Iterator[R]:
+    """
+    チャンクごとに function(*引数) を実行し、結果をチャンクの順に返す
+
+    ワーカーが1つならこのプロセスで順に実行する。複数なら ProcessPoolExecutor で実行し、
+    実行中のチャンクをワーカー数 × MAX_PENDING_PER_WORKER までに抑えて、
+    先頭のチャンクから順に結果を待つ。chunks は必要になった分だけ読む。
+
+    Args:
+        function: ワーカープロセスで実行する関数（モジュールの最上位で定義したもの）
+        chunks: 各チャンクの引数のタプル
+        workers: ワーカープロセス数（None なら CPU 数）
+
+    Yields:
+        各チャンクの結果
+    """
+    ワーカー数 = resolve_workers(workers)
+    if ワーカー数 == 1:
+        for 引数 in chunks:
+            yield function(*引数)
+        return
+
+    最大実行数 = ワーカー数 * MAX_PENDING_PER_WORKER
+    with ProcessPoolExecutor(max_workers=ワーカー数) as executor:
+        実行中: deque[Future[R]] = deque()
+        for 引数 in chunks:
+            実行中.append(executor.submit(function, *引数))
+            if len(実行中) >= 最大実行数:
+                yield 実行中.popleft().result()
+        while 実行中:
+            yield 実行中.popleft().result()
+
+
+def per_sec(count: float, seconds: float) -> float:
+    """
+    1秒あたりの数を求める（seconds が 0 なら 0）
+
+    Args:
+        count: 数
+        seconds: 経過時間（秒）
+
+    Returns:
+        count / seconds
+    """
+    return count / seconds if seconds else 0.0
@@ -0,0 +1,75 @@
+"""
+局面ファイルの形式変換
+
+テキスト形式（9行ずつ）とバイナリ形式（1局面17バイト、io/binary_format.py）を相互に変換する。
+
+使い方:
+    python convert_positions.py to-binary positions.txt positions.bin
+    python convert_positions.py to-text positions.bin positions.txt
+"""
+
+import argparse
+import os
+import sys
+
+# io パッケージは標準ライブラリと名前が競合するため、io ディレクトリ自体を
+# sys.path に加えて通常の import で読み込む
+_IO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'io')
+if _IO_DIR not in sys.path:
+    sys.path.append(_IO_DIR)
+
+from binary_format import binary_to_text, text_to_binary
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    メイン処理
+
+    Returns:
+        終了コード（入力が不正なら 1）
+    """
+    parser = argparse.ArgumentParser(
+        description="局面ファイルをテキスト形式とバイナリ形式（17バイト/局面）の間で変換する"
+    )
+    parser.add_argument(
+        'direction', choices=['to-binary', 'to-text'],
+        help="to-binary: テキスト → バイナリ、to-text: バイナリ → テキスト"
+    )
+    parser.add_argument('input', help="入力ファイル（'-' なら標準入力）")
+    parser.add_argument('output', help="出力ファイル（'-' なら標準出力）")
+    args = parser.parse_args(argv)
+
+    バイナリ入力 = args.direction == 'to-text'
+    入力 = _open(args.input, 'rb' if バイナリ入力 else 'r', sys.stdin)
+    出力 = _open(args.output, 'w' if バイナリ入力 else 'wb', sys.stdout)
+    try:
+        if バイナリ入力:
+            件数 = binary_to_text(入力, 出力)
+        else:
+            件数 = text_to_binary(入力, 出力)
+    except ValueError as e:
+        print(f"エラー: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if 入力 is not sys.stdin and 入力 is not sys.stdin.buffer:
+            入力.close()
+        if 出力 is not sys.stdout and 出力 is not sys.stdout.buffer:
+            出力.close()
+        else:
+            出力.flush()
+
+    print(f"{件数} 局面を変換しました", file=sys.stderr)
+    return 0
+
+
+def _open(path: str, mode: str, standard):
+    """ファイルを開く。'-' なら標準入出力（バイナリモードならその buffer）を返す"""
+    if path == '-':
+        return standard.buffer if 'b' in mode else standard
+    if 'b' in mode:
+        return open(path, mode)
+    return open(path, mode, encoding='ascii', newline='\n')
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+ビットボード
+
+盤面を黒・白それぞれ64ビットの整数（ビットボード）で表し、
+シフトとマスクによる一括処理で合法手を求める関数群。
+
+ビット番号は row * 8 + col とする（(0, 0) が最下位ビット）。
+"""
+
+from __future__ import annotations
+
+
+# 全マスが立ったマスク
+FULL: int = 0xFFFFFFFFFFFFFFFF
+
+# 左端（col=0）と右端（col=7）を除いたマスク
+# 横・斜め方向のシフトで行をまたいで回り込むのを防ぐ
+_NOT_EDGE_COLUMNS: int = 0x7E7E7E7E7E7E7E7E
+
+# (シフト量, 相手のコマに掛けるマスク) の組
+# 左シフトと右シフトの両方に使うので、4組で8方向をカバーする
+_DIRECTION_SHIFTS: tuple[tuple[int, int], ...] = (
+    (1, _NOT_EDGE_COLUMNS),  # 左右
+    (8, FULL),               # 上下
+    (7, _NOT_EDGE_COLUMNS),  # 右上・左下
+    (9, _NOT_EDGE_COLUMNS),  # 左上・右下
+)
+
+
+def legal_moves_mask(player: int, opponent: int) -> int:
+    """
+    合法手のビットボードを求める
+
+    8方向それぞれについて、自分のコマから相手のコマが連続する範囲を
+    シフトで伸ばしていき（最大6個）、その先の空マスを合法手とする。
+
+    Args:
+        player: 手番側のビットボード
+        opponent: 相手側のビットボード
+
+    Returns:
+        合法手の位置のビットが立ったビットボード
+    """
+    empty = ~(player | opponent) & FULL
+    moves = 0
+
+    for shift, edge_mask in _DIRECTION_SHIFTS:
+        masked_opponent = opponent & edge_mask
+
+        # 左シフト方向（行・列の番号が増える向き）
+        x = (player << shift) & masked_opponent
+        x |= (x << shift) & masked_opponent
+        x |= (x << shift) & masked_opponent
+        x |= (x << shift) & masked_opponent
+        x |= (x << shift) & masked_opponent
+        x |= (x << shift) & masked_opponent
+        moves |= (x << shift) & empty
+
+        # 右シフト方向（行・列の番号が減る向き）
+        x = (player >> shift) & masked_opponent
+        x |= (x >> shift) & masked_opponent
+        x |= (x >> shift) & masked_opponent
+        x |= (x >> shift) & masked_opponent
+        x |= (x >> shift) & masked_opponent
+        x |= (x >> shift) & masked_opponent
+        moves |= (x >> shift) & empty
+
+    return moves
+
+
+def has_legal_move(player: int, opponent: int) -> bool:
+    """
+    合法手が1つでもあるかを判定する
+
+    legal_moves_mask と同じシフトを方向ごとに行うが、
+    相手のコマの並びが途切れた方向はそこで打ち切り、
+    空マスに届いた時点で残りの方向を調べずに True を返す。
+    パスの判定のように有無だけが必要な場合に使う。
+
+    Args:
+        player: 手番側のビットボード
+        opponent: 相手側のビットボード
+
+    Returns:
+        合法手があれば True、なければ False
+    """
+    empty = ~(player | opponent) & FULL
+
+    for shift, edge_mask in _DIRECTION_SHIFTS:
+        masked_opponent = opponent & edge_mask
+
+        # 左シフト方向
+        x = (player << shift) & masked_opponent
+        while x:
+            x <<= shift
+            if x & empty:
+                return True
+            x &= masked_opponent
+
+        # 右シフト方向
+        x = (player >> shift) & masked_opponent
+        while x:
+            x >>= shift
+            if x & empty:
+                return True
+            x &= masked_opponent
+
+    return False
+
+
+def is_game_over(black: int, white: int) -> bool:
+    """
+    両者とも合法手がない（終局）かを判定する
+
+    Args:
+        black: 黒のビットボード
+        white: 白のビットボード
+
+    Returns:
+        終局なら True
+    """
+    return not has_legal_move(black, white) and not has_legal_move(white, black)
+
+
+def legal_moves_masks_both(black: int, white: int) -> tuple[int, int]:
+    """
+    黒と白の合法手のビットボードを1回のループで求める
+
+    legal_moves_mask を2回呼ぶのと同じ結果で、空マスと方向ごとのマスクを共有する。
+
+    Args:
+        black: 黒のビットボード
+        white: 白のビットボード
+
+    Returns:
+        (黒の合法手, 白の合法手) のビットボード
+    """
+    empty = ~(black | white) & FULL
+    black_moves = 0
+    white_moves = 0
+
+    for shift, edge_mask in _DIRECTION_SHIFTS:
+        masked_black = black & edge_mask
+        masked_white = white & edge_mask
+
+        # 左シフト方向
+        b = (black << shift) & masked_white
+        w = (white << shift) & masked_black
+        b |= (b << shift) & masked_white
+        w |= (w << shift) & masked_black
+        b |= (b << shift) & masked_white
+        w |= (w << shift) & masked_black
+        b |= (b << shift) & masked_white
+        w |= (w << shift) & masked_black
+        b |= (b << shift) & masked_white
+        w |= (w << shift) & masked_black
+        b |= (b << shift) & masked_white
+        w |= (w << shift) & masked_black
+        black_moves |= (b << shift) & empty
+        white_moves |= (w << shift) & empty
+
+        # 右シフト方向
+        b = (black >> shift) & masked_white
+        w = (white >> shift) & masked_black
+        b |= (b >> shift) & masked_white
+        w |= (w >> shift) & masked_black
+        b |= (b >> shift) & masked_white
+        w |= (w >> shift) & masked_black
+        b |= (b >> shift) & masked_white
+        w |= (w >> shift) & masked_black
+        b |= (b >> shift) & masked_white
+        w |= (w >> shift) & masked_black
+        b |= (b >> shift) & masked_white
+        w |= (w >> shift) & masked_black
+        black_moves |= (b >> shift) & empty
+        white_moves |= (w >> shift) & empty
+
+    return black_moves, white_moves
+
+
+def popcount(mask: int) -> int:
+    """
+    ビットボードの立っているビットの数を返す
+
+    Args:
+        mask: ビットボード
+
+    Returns:
+        ビットの数
+    """
+    return bin(mask).count('1')
+
+
+def flips_mask(player: int, opponent: int, square: int) -> int:
+    """
+    指定マスに置いたときにひっくり返る相手のコマをビットボードで求める
+
+    8方向それぞれについて、置いたマスから相手のコマが続く範囲をたどり、
+    その先に自分のコマがあればその範囲を返す対象に加える。
+
+    置くマスが空であることは呼び出し側で確認する。
+
+    Args:
+        player: 手番側のビットボード
+        opponent: 相手側のビットボード
+        square: 置くマスのビット番号（row * 8 + col）
+
+    Returns:
+        ひっくり返るコマのビットボード（合法手でなければ 0）
+    """
+    move = 1 << square
+    flips = 0
+
+    for shift, edge_mask in _DIRECTION_SHIFTS:
+        masked_opponent = opponent & edge_mask
+
+        # 左シフト方向
+        line = 0
+        x = (move << shift) & masked_opponent
+        while x:
+            line |= x
+            x <<= shift
+            if x & player:
+                flips |= line
+                break
+            x &= masked_opponent
+
+        # 右シフト方向
+        line = 0
+        x = (move >> shift) & masked_opponent
+        while x:
+            line |= x
+            x >>= shift
+            if x & player:
+                flips |= line
+                break
+            x &= masked_opponent
+
+    return flips
+
+
+def make_move(player: int, opponent: int, square: int) -> tuple[int, int, int]:
+    """
+    指定マスに置いて相手のコマをひっくり返した後のビットボードを求める
+
+    合法手であることは呼び出し側で確認する。
+
+    Args:
+        player: 手番側のビットボード
+        opponent: 相手側のビットボード
+        square: 置くマスのビット番号（row * 8 + col）
+
+    Returns:
+        (着手後の手番側, 着手後の相手側, ひっくり返したコマ) のビットボード
+    """
+    flips = flips_mask(player, opponent, square)
+    return player | flips | (1 << square), opponent ^ flips, flips
+
+
+def turn_moves(player: int, opponent: int) -> tuple[int, bool]:
+    """
+    次に着手する側の合法手を求める（手番側に合法手がなければ相手側）
+
+    対局を進めるときのパスと終局の判定に使う。
+
+    Args:
+        player: 手番側のビットボード
+        opponent: 相手側のビットボード
+
+    Returns:
+        (合法手, 手番側がパスするか)。両者とも合法手がなければ (0, True)（終局）
+    """
+    moves = legal_moves_mask(player, opponent)
+    if moves:
+        return moves, False
+    return legal_moves_mask(opponent, player), True
+
+
+# 各桁の 0 / 1 / 2 を盤面の文字に変換する表（to_cells 用）
+_DIGIT_TO_CELL = str.maketrans('012', '.BW')
+
+
+def to_cells(black: int, white: int) -> str:
+    """
+    黒・白のビットボードを64文字の盤面（行優先、'.' / 'B' / 'W'）に変換する
+
+    2進表記の文字列を10進数として読むと各桁が 0 か 1 の整数になるので、
+    黒 + 2 * 白 を計算すると各桁が 0（空）/ 1（黒）/ 2（白）になる（繰り上がりはない）。
+    マスごとのループを行わずに変換できる。
+
+    Args:
+        black: 黒のビットボード
+        white: 白のビットボード
+
+    Returns:
+        64文字の文字列（先頭が (0, 0)）
+
+    Raises:
+        ValueError: 黒と白のビットボードが重なっている場合
+    """
+    if black & white:
+        raise ValueError("黒と白のビットボードが重なっている")
+    桁 = int(format(black, '064b')) + 2 * int(format(white, '064b'))
+    # 最下位ビットが (0, 0) なので、逆順にして先頭を (0, 0) にする
+    return format(桁, '064d')[::-1].translate(_DIGIT_TO_CELL)
+
+
+def mask_to_positions(mask: int) -> list[tuple[int, int]]:
+    """
+    ビットボードを位置のリストに変換する
+
+    下位ビットから順に取り出すので、結果は行優先の昇順になる。
+
+    Args:
+        mask: ビットボード
+
+    Returns:
+        位置のリスト [(row, col), ...]
+    """
+    positions: list[tuple[int, int]] = []
+    while mask:
+        lowest = mask & -mask
+        positions.append(divmod(lowest.bit_length() - 1, 8))
+        mask ^= lowest
+    return positions
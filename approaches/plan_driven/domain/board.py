@@ -5,7 +5,19 @@ Board クラス
 盤面の状態を管理し、セルへのアクセスと基本操作を提供する。
 """
 
-from typing import List
+from __future__ import annotations
+
+# typing は起動時間を抑えるため型チェック時だけ読み込む
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable
+
+from domain import bitboard
+
+
+# ビットボード変換用の変換表（対象のコマを '1'、それ以外を '0' にする）
+_BLACK_BITS = str.maketrans({'B': '1', 'W': '0', '.': '0'})
+_WHITE_BITS = str.maketrans({'B': '0', 'W': '1', '.': '0'})
 
 
 class Board:
@@ -22,7 +34,7 @@ class Board:
     WHITE: str = 'W'
     SIZE: int = 8
 
-    def __init__(self, grid: List[List[str]]) -> None:
+    def __init__(self, grid: list[list[str]]) -> None:
         """
         盤面を初期化する
 
@@ -32,6 +44,24 @@ class Board:
         # 盤面をディープコピーして保持
         self._grid = [row[:] for row in grid]
 
+    @classmethod
+    def from_bitboards(cls, black: int, white: int) -> Board:
+        """
+        黒・白のビットボードから盤面を作る（to_bitboards の逆変換）
+
+        Args:
+            black: 黒のビットボード（ビット番号は row * 8 + col）
+            white: 白のビットボード
+
+        Returns:
+            盤面
+
+        Raises:
+            ValueError: 黒と白のビットボードが重なっている場合
+        """
+        セル列 = bitboard.to_cells(black, white)
+        return cls([list(セル列[i:i + 8]) for i in range(0, 64, 8)])
+
     def get_cell(self, row: int, col: int) -> str:
         """
         指定位置のセルの値を取得する
@@ -71,7 +101,65 @@ class Board:
         """
         return self._grid[row][col] == self.EMPTY
 
-    def to_grid(self) -> List[List[str]]:
+    def set_cell(self, row: int, col: int, value: str) -> None:
+        """
+        指定位置のセルの値を設定する
+
+        Args:
+            row: 行番号（0-7）
+            col: 列番号（0-7）
+            value: セルの値（'.', 'B', 'W' のいずれか）
+        """
+        self._grid[row][col] = value
+
+    def place_stone(
+        self,
+        row: int,
+        col: int,
+        player: str,
+        flipped: Iterable[tuple[int, int]]
+    ) -> None:
+        """
+        コマを置き、指定されたコマをひっくり返す（盤面をその場で変更する）
+
+        合法かどうかの判定は行わない（GameRules の責任）。
+
+        Args:
+            row: 置く行（0-7）
+            col: 置く列（0-7）
+            player: 置くプレイヤー（'B' または 'W'）
+            flipped: ひっくり返すコマの位置 [(row, col), ...]
+        """
+        grid = self._grid
+        grid[row][col] = player
+        for r, c in flipped:
+            grid[r][c] = player
+
+    def remove_stone(
+        self,
+        row: int,
+        col: int,
+        player: str,
+        flipped: Iterable[tuple[int, int]]
+    ) -> None:
+        """
+        place_stone を取り消す（盤面をその場で変更する）
+
+        置いたマスを空に戻し、ひっくり返したコマを相手の色に戻す。
+
+        Args:
+            row: 置いた行（0-7）
+            col: 置いた列（0-7）
+            player: 置いたプレイヤー（'B' または 'W'）
+            flipped: ひっくり返したコマの位置 [(row, col), ...]
+        """
+        grid = self._grid
+        opponent = Board.get_opponent(player)
+        grid[row][col] = Board.EMPTY
+        for r, c in flipped:
+            grid[r][c] = opponent
+
+    def to_grid(self) -> list[list[str]]:
         """
         内部の盤面データを取得する
 
@@ -80,6 +168,24 @@ class Board:
         """
         return [row[:] for row in self._grid]
 
+    def to_bitboards(self) -> tuple[int, int]:
+        """
+        盤面を黒・白のビットボードに変換する
+
+        ビット番号は row * 8 + col（(0, 0) が最下位ビット）。
+        文字列の変換表と int(..., 2) でまとめて変換するため、
+        マスごとのループは行わない。
+
+        Returns:
+            (黒のビットボード, 白のビットボード)
+        """
+        # 最下位ビットが (0, 0) になるように逆順にする
+        セル列 = ''.join(map(''.join, self._grid))[::-1]
+        return (
+            int(セル列.translate(_BLACK_BITS), 2),
+            int(セル列.translate(_WHITE_BITS), 2),
+        )
+
     @staticmethod
     def get_opponent(player: str) -> str:
         """
@@ -0,0 +1,247 @@
+"""
+CompactBoard クラス
+
+Board と同じ公開メソッドを持つ、省メモリ版の盤面クラス。
+64マスを1つの bytearray（1マス1バイト、'.' / 'B' / 'W' の文字コード）で保持する。
+"""
+
+from typing import Iterable, List, Tuple
+from domain import bitboard
+
+
+# ビットボード変換用の変換表（対象のコマを '1'、それ以外を '0' にする）
+_BLACK_BITS = bytes.maketrans(b'.BW', b'010')
+_WHITE_BITS = bytes.maketrans(b'.BW', b'001')
+
+
+class CompactBoard:
+    """
+    bytearray で盤面を保持するクラス
+
+    Board と同じ公開メソッド（get_cell, is_valid_position, is_empty,
+    to_grid, to_bitboards, set_cell, place_stone, remove_stone,
+    get_opponent）を持つので、GameRules や OutputWriter からは
+    Board と同じように扱える。
+    __slots__ を使い、インスタンスは bytearray 1つだけを持つ。
+    """
+
+    __slots__ = ('_cells',)
+
+    # クラス定数
+    EMPTY: str = '.'
+    BLACK: str = 'B'
+    WHITE: str = 'W'
+    SIZE: int = 8
+
+    # 空マスの文字コード
+    _EMPTY_CODE: int = ord('.')
+
+    def __init__(self, grid: List[List[str]]) -> None:
+        """
+        盤面を初期化する
+
+        Args:
+            grid: 8x8の盤面データ（各要素は '.', 'B', 'W' のいずれか）
+
+        Raises:
+            ValueError: 盤面が64マスでない場合
+        """
+        cells = bytearray(''.join(map(''.join, grid)), 'ascii')
+        if len(cells) != self.SIZE * self.SIZE:
+            raise ValueError(f"盤面は64マス必要です（{len(cells)}マス）")
+        self._cells = cells
+
+    @classmethod
+    def from_bytes(cls, cells: bytes) -> 'CompactBoard':
+        """
+        64バイトの列（行優先、'.' / 'B' / 'W' の文字コード）から盤面を作る
+
+        Args:
+            cells: 64バイトの列
+
+        Returns:
+            CompactBoard
+
+        Raises:
+            ValueError: 64バイトでない場合
+        """
+        if len(cells) != cls.SIZE * cls.SIZE:
+            raise ValueError(f"盤面は64マス必要です（{len(cells)}マス）")
+        board = cls.__new__(cls)
+        board._cells = bytearray(cells)
+        return board
+
+    @classmethod
+    def from_bitboards(cls, black: int, white: int) -> 'CompactBoard':
+        """
+        黒・白のビットボードから盤面を作る（to_bitboards の逆変換）
+
+        Args:
+            black: 黒のビットボード（ビット番号は row * 8 + col）
+            white: 白のビットボード
+
+        Returns:
+            CompactBoard
+
+        Raises:
+            ValueError: 黒と白のビットボードが重なっている場合
+        """
+        return cls.from_bytes(bitboard.to_cells(black, white).encode('ascii'))
+
+    def copy(self) -> 'CompactBoard':
+        """
+        盤面のコピーを作る
+
+        64バイトのバッファを1回コピーするだけで、行ごとのリストは作らない。
+
+        Returns:
+            同じ内容の新しい CompactBoard
+        """
+        board = CompactBoard.__new__(CompactBoard)
+        board._cells = self._cells[:]
+        return board
+
+    def to_bytes(self) -> bytes:
+        """
+        盤面を64バイトの列（行優先）で返す
+
+        Returns:
+            64バイトの列
+        """
+        return bytes(self._cells)
+
+    def get_cell(self, row: int, col: int) -> str:
+        """
+        指定位置のセルの値を取得する
+
+        Args:
+            row: 行番号（0-7）
+            col: 列番号（0-7）
+
+        Returns:
+            セルの値（'.', 'B', 'W' のいずれか）
+        """
+        return chr(self._cells[row * 8 + col])
+
+    def is_valid_position(self, row: int, col: int) -> bool:
+        """
+        指定位置が盤面内かどうかを判定する
+
+        Args:
+            row: 行番号
+            col: 列番号
+
+        Returns:
+            盤面内なら True、範囲外なら False
+        """
+        return 0 <= row < self.SIZE and 0 <= col < self.SIZE
+
+    def is_empty(self, row: int, col: int) -> bool:
+        """
+        指定位置が空マスかどうかを判定する
+
+        Args:
+            row: 行番号（0-7）
+            col: 列番号（0-7）
+
+        Returns:
+            空マスなら True、それ以外なら False
+        """
+        return self._cells[row * 8 + col] == self._EMPTY_CODE
+
+    def set_cell(self, row: int, col: int, value: str) -> None:
+        """
+        指定位置のセルの値を設定する
+
+        Args:
+            row: 行番号（0-7）
+            col: 列番号（0-7）
+            value: セルの値（'.', 'B', 'W' のいずれか）
+        """
+        self._cells[row * 8 + col] = ord(value)
+
+    def place_stone(
+        self,
+        row: int,
+        col: int,
+        player: str,
+        flipped: Iterable[Tuple[int, int]]
+    ) -> None:
+        """
+        コマを置き、指定されたコマをひっくり返す（盤面をその場で変更する）
+
+        Args:
+            row: 置く行（0-7）
+            col: 置く列（0-7）
+            player: 置くプレイヤー（'B' または 'W'）
+            flipped: ひっくり返すコマの位置 [(row, col), ...]
+        """
+        cells = self._cells
+        code = ord(player)
+        cells[row * 8 + col] = code
+        for r, c in flipped:
+            cells[r * 8 + c] = code
+
+    def remove_stone(
+        self,
+        row: int,
+        col: int,
+        player: str,
+        flipped: Iterable[Tuple[int, int]]
+    ) -> None:
+        """
+        place_stone を取り消す（盤面をその場で変更する）
+
+        Args:
+            row: 置いた行（0-7）
+            col: 置いた列（0-7）
+            player: 置いたプレイヤー（'B' または 'W'）
+            flipped: ひっくり返したコマの位置 [(row, col), ...]
+        """
+        cells = self._cells
+        code = ord(CompactBoard.get_opponent(player))
+        cells[row * 8 + col] = self._EMPTY_CODE
+        for r, c in flipped:
+            cells[r * 8 + c] = code
+
+    def to_grid(self) -> List[List[str]]:
+        """
+        盤面データを2次元リストで取得する
+
+        Returns:
+            8x8の盤面データ（新しいリスト）
+        """
+        text = self._cells.decode('ascii')
+        return [list(text[i:i + 8]) for i in range(0, 64, 8)]
+
+    def to_bitboards(self) -> Tuple[int, int]:
+        """
+        盤面を黒・白のビットボードに変換する
+
+        ビット番号は row * 8 + col（(0, 0) が最下位ビット）。
+
+        Returns:
+            (黒のビットボード, 白のビットボード)
+        """
+        # 最下位ビットが (0, 0) になるように逆順にする
+        セル列 = bytes(self._cells[::-1])
+        return (
+            int(セル列.translate(_BLACK_BITS), 2),
+            int(セル列.translate(_WHITE_BITS), 2),
+        )
+
+    @staticmethod
+    def get_opponent(player: str) -> str:
+        """
+        相手プレイヤーを取得する
+
+        Args:
+            player: プレイヤー（'B' または 'W'）
+
+        Returns:
+            相手プレイヤー（'B' なら 'W'、'W' なら 'B'）
+        """
+        if player == CompactBoard.BLACK:
+            return CompactBoard.WHITE
+        else:
+            return CompactBoard.BLACK
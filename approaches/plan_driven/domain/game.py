@@ -0,0 +1,276 @@
+"""
+Game クラス
+
+Board と GameRules の上で、着手・パス・終局の判定を行って1局を進める。
+黒・白のビットボードと石の数は着手ごとに差分で更新し、盤面を変換し直したり数え直したりしない。
+合法手・着手・パスの判定は selfplay.py と同じ domain/bitboard.py の関数
+（turn_moves / make_move）で行い、Board には place_stone で同じ着手を反映する。
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Callable, Tuple
+
+from domain import bitboard
+from domain.board import Board
+from domain.game_rules import GameRules
+from domain.move_record import MoveRecord
+
+
+# 四隅の位置
+CORNERS: frozenset[tuple[int, int]] = frozenset({(0, 0), (0, 7), (7, 0), (7, 7)})
+
+# 方策: 対局中の Game と乱数生成器から着手 (row, col) を選ぶ関数
+Policy = Callable[['Game', random.Random], Tuple[int, int]]
+
+
+class Game:
+    """
+    1局の対局を進めるクラス
+
+    手番側に合法手がなければ自動でパスし、両者とも合法手がなくなったら終局とする。
+    盤面は Board をその場で変更する（コピーしない）。
+    """
+
+    def __init__(self, board: Board | None = None, player: str = Board.BLACK) -> None:
+        """
+        Game を初期化する
+
+        Args:
+            board: 開始局面（省略時は初期配置）。この盤面をその場で変更する
+            player: 開始局面の手番（'B' または 'W'）
+        """
+        self._board = board if board is not None else Game.initial_board()
+        self._rules = GameRules(self._board)
+        self._player = player
+        self._black, self._white = self._board.to_bitboards()
+        self._black_count = bitboard.popcount(self._black)
+        self._white_count = bitboard.popcount(self._white)
+        self._records: list[MoveRecord] = []
+        self._passes = 0
+        self._legal_moves = 0
+        self._over = False
+        self._advance()
+
+    @staticmethod
+    def initial_board() -> Board:
+        """
+        初期配置の盤面を作る
+
+        Returns:
+            (3,3) と (4,4) が白、(3,4) と (4,3) が黒の盤面
+        """
+        grid = [[Board.EMPTY] * Board.SIZE for _ in range(Board.SIZE)]
+        grid[3][3] = grid[4][4] = Board.WHITE
+        grid[3][4] = grid[4][3] = Board.BLACK
+        return Board(grid)
+
+    @property
+    def board(self) -> Board:
+        """対局中の盤面"""
+        return self._board
+
+    @property
+    def rules(self) -> GameRules:
+        """対局中の盤面に対する GameRules"""
+        return self._rules
+
+    @property
+    def player(self) -> str:
+        """手番（終局後は最後に手番だったプレイヤー）"""
+        return self._player
+
+    @property
+    def black_count(self) -> int:
+        """黒のコマの数"""
+        return self._black_count
+
+    @property
+    def white_count(self) -> int:
+        """白のコマの数"""
+        return self._white_count
+
+    @property
+    def records(self) -> list[MoveRecord]:
+        """これまでの着手の記録（パスは含まない）"""
+        return self._records
+
+    @property
+    def passes(self) -> int:
+        """これまでのパスの回数"""
+        return self._passes
+
+    @property
+    def is_over(self) -> bool:
+        """終局していれば True"""
+        return self._over
+
+    def legal_moves(self) -> list[tuple[int, int]]:
+        """
+        手番側の合法手を列挙する
+
+        Returns:
+            合法手の位置のリスト [(row, col), ...]（行優先の昇順、終局後は空）
+        """
+        return bitboard.mask_to_positions(self._legal_moves)
+
+    def legal_moves_mask(self) -> int:
+        """
+        手番側の合法手をビットボードで返す
+
+        Returns:
+            合法手の位置（row * 8 + col）のビットが立った整数（終局後は 0）
+        """
+        return self._legal_moves
+
+    def count_flips(self, row: int, col: int) -> int:
+        """
+        手番側が指定位置に置いたときにひっくり返るコマの数を求める（盤面は変更しない）
+
+        Args:
+            row: 行（0-7）
+            col: 列（0-7）
+
+        Returns:
+            ひっくり返るコマの数（合法手でなければ 0）
+        """
+        マス = row * Board.SIZE + col
+        if not (0 <= row < Board.SIZE and 0 <= col < Board.SIZE) \
+                or not (self._legal_moves >> マス) & 1:
+            return 0
+        if self._player == Board.BLACK:
+            自分, 相手側 = self._black, self._white
+        else:
+            自分, 相手側 = self._white, self._black
+        return bitboard.popcount(bitboard.flips_mask(自分, 相手側, マス))
+
+    def play(self, row: int, col: int) -> MoveRecord:
+        """
+        手番側が指定位置に着手し、手番を進める
+
+        次の手番側に合法手がなければパスし、両者とも合法手がなければ終局にする。
+
+        Args:
+            row: 行（0-7）
+            col: 列（0-7）
+
+        Returns:
+            着手の記録
+
+        Raises:
+            ValueError: 終局後、または合法手でない場合
+        """
+        マス = row * Board.SIZE + col
+        if self._over or not (0 <= row < Board.SIZE and 0 <= col < Board.SIZE) \
+                or not (self._legal_moves >> マス) & 1:
+            raise ValueError(f"({row}, {col}) は {self._player} の合法手ではない")
+
+        手番 = self._player
+        if 手番 == Board.BLACK:
+            self._black, self._white, 返すコマ = bitboard.make_move(self._black, self._white, マス)
+        else:
+            self._white, self._black, 返すコマ = bitboard.make_move(self._white, self._black, マス)
+
+        返す位置 = tuple(bitboard.mask_to_positions(返すコマ))
+        self._board.place_stone(row, col, 手番, 返す位置)
+        増分 = len(返す位置)
+        if 手番 == Board.BLACK:
+            self._black_count += 増分 + 1
+            self._white_count -= 増分
+        else:
+            self._white_count += 増分 + 1
+            self._black_count -= 増分
+        記録 = MoveRecord(row, col, 手番, 返す位置)
+        self._records.append(記録)
+
+        self._player = Board.get_opponent(手番)
+        self._advance()
+        return 記録
+
+    def winner(self) -> str | None:
+        """
+        コマの多い方を返す
+
+        Returns:
+            'B' または 'W'、同数なら None
+        """
+        if self._black_count > self._white_count:
+            return Board.BLACK
+        if self._white_count > self._black_count:
+            return Board.WHITE
+        return None
+
+    def _advance(self) -> None:
+        """手番側の合法手を求め、なければパスまたは終局にする"""
+        if self._player == Board.BLACK:
+            自分, 相手側 = self._black, self._white
+        else:
+            自分, 相手側 = self._white, self._black
+        合法手, パス = bitboard.turn_moves(自分, 相手側)
+        if not 合法手:
+            self._over = True
+        elif パス:
+            self._player = Board.get_opponent(self._player)
+            self._passes += 1
+        self._legal_moves = 合法手
+
+
+def random_policy(game: Game, rng: random.Random) -> tuple[int, int]:
+    """合法手から一様に選ぶ"""
+    return rng.choice(game.legal_moves())
+
+
+def greedy_policy(game: Game, rng: random.Random) -> tuple[int, int]:
+    """ひっくり返るコマが最も多い手を選ぶ（同数なら乱数で選ぶ）"""
+    候補: list[tuple[int, int]] = []
+    最大 = 0
+    for row, col in game.legal_moves():
+        数 = game.count_flips(row, col)
+        if 数 > 最大:
+            候補 = [(row, col)]
+            最大 = 数
+        elif 数 == 最大:
+            候補.append((row, col))
+    return rng.choice(候補)
+
+
+def corner_policy(game: Game, rng: random.Random) -> tuple[int, int]:
+    """角が取れれば角から、取れなければ合法手から一様に選ぶ"""
+    合法手 = game.legal_moves()
+    角 = [move for move in 合法手 if move in CORNERS]
+    return rng.choice(角 or 合法手)
+
+
+# 方策の名前から関数への対応表
+POLICIES: dict[str, Policy] = {
+    'random': random_policy,
+    'greedy': greedy_policy,
+    'corner': corner_policy,
+}
+
+
+def play_game(
+    black: Policy,
+    white: Policy,
+    rng: random.Random,
+    game: Game | None = None
+) -> Game:
+    """
+    終局まで対局する
+
+    Args:
+        black: 黒の方策
+        white: 白の方策
+        rng: 乱数生成器（方策に渡す）
+        game: 対局を続ける Game（省略時は初期配置から）
+
+    Returns:
+        終局した Game
+    """
+    if game is None:
+        game = Game()
+    while not game.is_over:
+        方策 = black if game.player == Board.BLACK else white
+        game.play(*方策(game, rng))
+    return game
@@ -5,8 +5,11 @@ GameRules クラス
 合法手の判定と全合法手の列挙を行う。
 """
 
-from typing import List, Tuple
+from __future__ import annotations
+
 from domain.board import Board
+from domain.move_record import MoveRecord
+from domain import bitboard
 
 
 class GameRules:
@@ -14,11 +17,16 @@ class GameRules:
     リバーシのゲームルールを実装するクラス
 
     盤面を受け取り、合法手の判定と列挙を行う。
-    盤面の状態は変更せず、純粋な判定のみを行う。
+    判定系のメソッドは盤面の状態を変更しない。
+    盤面を変更するのは apply_move / undo_move だけで、
+    盤面をコピーせずにその場で着手・取り消しを行う。
+
+    1マスの判定は方向ごとの走査で、全合法手の列挙は
+    ビットボード（domain/bitboard.py）による一括計算で行う。
     """
 
     # 8方向のベクトル（上下左右斜め）
-    DIRECTIONS: List[Tuple[int, int]] = [
+    DIRECTIONS: list[tuple[int, int]] = [
         (-1, -1), (-1, 0), (-1, 1),  # 上方向3つ
         (0, -1),           (0, 1),    # 左右
         (1, -1),  (1, 0),  (1, 1)     # 下方向3つ
@@ -114,25 +122,151 @@ class GameRules:
 
         return False
 
-    def find_all_legal_moves(self, player: str) -> List[Tuple[int, int]]:
+    def legal_moves_mask(self, player: str) -> int:
+        """
+        指定プレイヤーの合法手をビットボードで求める
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手の位置（row * 8 + col）のビットが立った整数
+        """
+        黒, 白 = self._board.to_bitboards()
+        if player == Board.BLACK:
+            return bitboard.legal_moves_mask(黒, 白)
+        return bitboard.legal_moves_mask(白, 黒)
+
+    def has_any_legal_move(self, player: str) -> bool:
+        """
+        指定プレイヤーに合法手が1つでもあるかを判定する
+
+        合法手を列挙せず、最初に見つかった時点で打ち切る。
+        パスの判定に使う。
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手があれば True、なければ False（パス）
+        """
+        黒, 白 = self._board.to_bitboards()
+        if player == Board.BLACK:
+            return bitboard.has_legal_move(黒, 白)
+        return bitboard.has_legal_move(白, 黒)
+
+    def is_game_over(self) -> bool:
+        """
+        両者とも合法手がない（終局）かを判定する
+
+        Returns:
+            終局なら True
+        """
+        黒, 白 = self._board.to_bitboards()
+        return bitboard.is_game_over(黒, 白)
+
+    def mobility(self, player: str) -> tuple[int, int]:
+        """
+        指定プレイヤーの合法手の数と合法手のビットボードを求める
+
+        合法手のリストを作らないので、数だけが必要な評価に使う。
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            (合法手の数, 合法手のビットボード)
+        """
+        合法手 = self.legal_moves_mask(player)
+        return bitboard.popcount(合法手), 合法手
+
+    def mobility_both(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        黒と白の合法手の数とビットボードを、盤面を1回変換するだけで求める
+
+        Returns:
+            ((黒の合法手の数, 黒の合法手), (白の合法手の数, 白の合法手))
+        """
+        黒, 白 = self._board.to_bitboards()
+        黒の合法手, 白の合法手 = bitboard.legal_moves_masks_both(黒, 白)
+        return (
+            (bitboard.popcount(黒の合法手), 黒の合法手),
+            (bitboard.popcount(白の合法手), 白の合法手),
+        )
+
+    def find_all_legal_moves(self, player: str) -> list[tuple[int, int]]:
         """
         指定プレイヤーの全合法手を列挙する
 
-        盤面上のすべてのマスをチェックし、
-        合法手となる位置のリストを返す。
+        盤面をビットボードに変換し、8方向のシフトで
+        全マスの合法手を一括で求める。
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手の位置のリスト [(row, col), ...]（行優先の昇順）
+        """
+        return bitboard.mask_to_positions(self.legal_moves_mask(player))
+
+    def find_flips(self, row: int, col: int, player: str) -> list[tuple[int, int]]:
+        """
+        指定位置に置いたときにひっくり返るコマを求める
+
+        8方向をまとめてビットボードで調べ、1回の計算で全方向の
+        ひっくり返るコマを求める。
+
+        Args:
+            row: 行（0-7）
+            col: 列（0-7）
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            ひっくり返るコマの位置のリスト [(row, col), ...]（合法手でなければ空）
+        """
+        if not self._board.is_empty(row, col):
+            return []
+
+        黒, 白 = self._board.to_bitboards()
+        if player == Board.BLACK:
+            返すコマ = bitboard.flips_mask(黒, 白, row * Board.SIZE + col)
+        else:
+            返すコマ = bitboard.flips_mask(白, 黒, row * Board.SIZE + col)
+        return bitboard.mask_to_positions(返すコマ)
+
+    def apply_move(self, row: int, col: int, player: str) -> MoveRecord:
+        """
+        指定位置にコマを置き、挟んだコマをひっくり返す
+
+        盤面をその場で変更し、取り消し用の記録を返す。
 
         Args:
+            row: 行（0-7）
+            col: 列（0-7）
             player: 手番（'B' または 'W'）
 
         Returns:
-            合法手の位置のリスト [(row, col), ...]
+            undo_move に渡す着手の記録
+
+        Raises:
+            ValueError: 合法手でない場合
+        """
+        返すコマ = self.find_flips(row, col, player)
+        if not 返すコマ:
+            raise ValueError(f"({row}, {col}) は {player} の合法手ではない")
+
+        self._board.place_stone(row, col, player, 返すコマ)
+        return MoveRecord(row, col, player, tuple(返すコマ))
+
+    def undo_move(self, record: MoveRecord) -> None:
         """
-        合法手リスト: List[Tuple[int, int]] = []
+        apply_move で適用した手を取り消す
 
-        # 盤面のすべてのマスをチェック
-        for row in range(Board.SIZE):
-            for col in range(Board.SIZE):
-                if self.is_legal_move(row, col, player):
-                    合法手リスト.append((row, col))
+        手は適用した順と逆の順に取り消すこと。
 
-        return 合法手リスト
+        Args:
+            record: apply_move が返した着手の記録
+        """
+        self._board.remove_stone(
+            record.row, record.col, record.player, record.flipped
+        )
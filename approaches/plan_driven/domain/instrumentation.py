@@ -0,0 +1,252 @@
+"""
+計測用の GameRules
+
+is_legal_move / can_flip_in_direction の中でどこに時間がかかっているかを調べるため、
+調べたマスの数・走査した方向の数・方向ごとに進んだマスの数・途中で打ち切った回数を数える。
+
+reversi.py --stats のときだけ読み込む。通常の実行では GameRules がそのまま使われ、
+このモジュールも読み込まれないので、計測しないときの負荷はない。
+"""
+
+from __future__ import annotations
+
+import time
+
+from domain.board import Board
+from domain.game_rules import GameRules
+
+
+class HotPathCounters:
+    """
+    is_legal_move / can_flip_in_direction の計測値
+
+    - squares_examined: is_legal_move で調べたマスの数
+    - rays_probed: can_flip_in_direction で調べた方向の数
+    - ray_steps: 方向ごとに進んだマスの数の合計（盤面外に出た1歩は含めない）
+    - ray_lengths: 進んだマスの数ごとの方向の数 {マス数: 方向の数}
+    - exit_occupied: マスが空でなく、方向を調べずに終えた回数
+    - exit_no_opponent: 隣が相手のコマでない（盤面外を含む）ため1歩で終えた方向の数
+    - exit_blocked: 相手のコマの先が空マスか盤面外だった方向の数
+    - exit_flippable: ひっくり返せる方向が見つかり、残りの方向を調べずに終えた回数
+    - rays_skipped: exit_flippable で調べずに済んだ方向の数
+    """
+
+    __slots__ = (
+        'squares_examined', 'rays_probed', 'ray_steps', 'ray_lengths',
+        'exit_occupied', 'exit_no_opponent', 'exit_blocked',
+        'exit_flippable', 'rays_skipped',
+    )
+
+    def __init__(self) -> None:
+        self.squares_examined = 0
+        self.rays_probed = 0
+        self.ray_steps = 0
+        self.ray_lengths: dict[int, int] = {}
+        self.exit_occupied = 0
+        self.exit_no_opponent = 0
+        self.exit_blocked = 0
+        self.exit_flippable = 0
+        self.rays_skipped = 0
+
+    def record_ray(self, steps: int) -> None:
+        """
+        1方向の走査を記録する
+
+        Args:
+            steps: 盤面上で進んだマスの数
+        """
+        self.rays_probed += 1
+        self.ray_steps += steps
+        self.ray_lengths[steps] = self.ray_lengths.get(steps, 0) + 1
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        JSON に書き出せる辞書にする
+
+        Returns:
+            計測値の辞書（方向あたりの平均マス数 mean_ray_length を含む）
+        """
+        return {
+            'squares_examined': self.squares_examined,
+            'rays_probed': self.rays_probed,
+            'ray_steps': self.ray_steps,
+            'mean_ray_length': self.ray_steps / self.rays_probed if self.rays_probed else 0.0,
+            'ray_lengths': {str(k): v for k, v in sorted(self.ray_lengths.items())},
+            'early_exits': {
+                'occupied': self.exit_occupied,
+                'no_opponent': self.exit_no_opponent,
+                'blocked': self.exit_blocked,
+                'flippable': self.exit_flippable,
+                'rays_skipped': self.rays_skipped,
+            },
+        }
+
+
+class InstrumentedGameRules(GameRules):
+    """
+    計測値を数える GameRules
+
+    判定の結果は GameRules と同じ。find_all_legal_moves はビットボードではなく
+    64マスそれぞれに is_legal_move を呼ぶので、方向ごとの走査がすべて計測される。
+    """
+
+    def __init__(self, board: Board, counters: HotPathCounters | None = None) -> None:
+        """
+        InstrumentedGameRules を初期化する
+
+        Args:
+            board: 判定対象の盤面
+            counters: 計測値の記録先（省略時は新しく作る）
+        """
+        super().__init__(board)
+        self.counters = counters if counters is not None else HotPathCounters()
+
+    def can_flip_in_direction(
+        self,
+        row: int,
+        col: int,
+        dr: int,
+        dc: int,
+        player: str
+    ) -> bool:
+        """
+        特定の方向にコマをひっくり返せるかを判定し、進んだマスの数を記録する
+
+        Args:
+            row: 配置する行（0-7）
+            col: 配置する列（0-7）
+            dr: 行方向の移動量（-1, 0, 1）
+            dc: 列方向の移動量（-1, 0, 1）
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            この方向にひっくり返せる場合 True、それ以外 False
+        """
+        counters = self.counters
+        opponent = Board.get_opponent(player)
+        steps = 0
+        r, c = row + dr, col + dc
+
+        if not self._board.is_valid_position(r, c):
+            counters.record_ray(steps)
+            counters.exit_no_opponent += 1
+            return False
+        steps += 1
+        if self._board.get_cell(r, c) != opponent:
+            counters.record_ray(steps)
+            counters.exit_no_opponent += 1
+            return False
+
+        r, c = r + dr, c + dc
+        while self._board.is_valid_position(r, c):
+            steps += 1
+            cell = self._board.get_cell(r, c)
+            if cell == Board.EMPTY:
+                break
+            if cell == player:
+                counters.record_ray(steps)
+                return True
+            r, c = r + dr, c + dc
+
+        counters.record_ray(steps)
+        counters.exit_blocked += 1
+        return False
+
+    def is_legal_move(self, row: int, col: int, player: str) -> bool:
+        """
+        指定位置が合法手かどうかを判定し、途中で打ち切った回数を記録する
+
+        Args:
+            row: 行（0-7）
+            col: 列（0-7）
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手なら True、それ以外 False
+        """
+        counters = self.counters
+        counters.squares_examined += 1
+        if not self._board.is_empty(row, col):
+            counters.exit_occupied += 1
+            return False
+
+        for i, (dr, dc) in enumerate(self.DIRECTIONS):
+            if self.can_flip_in_direction(row, col, dr, dc, player):
+                counters.exit_flippable += 1
+                counters.rays_skipped += len(self.DIRECTIONS) - i - 1
+                return True
+
+        return False
+
+    def find_all_legal_moves(self, player: str) -> list[tuple[int, int]]:
+        """
+        64マスそれぞれに is_legal_move を呼んで全合法手を列挙する
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手の位置のリスト [(row, col), ...]（行優先の昇順）
+        """
+        return [
+            (row, col)
+            for row in range(Board.SIZE)
+            for col in range(Board.SIZE)
+            if self.is_legal_move(row, col, player)
+        ]
+
+
+class PhaseTimer:
+    """
+    フェーズ（parse / compute / render など）ごとの経過時間を記録する
+
+    使い方:
+        タイマー = PhaseTimer()
+        with タイマー.phase('parse'):
+            ...
+        タイマー.to_dict()  # {'parse': 秒, ...}
+    """
+
+    def __init__(self) -> None:
+        self._seconds: dict[str, float] = {}
+
+    def phase(self, name: str) -> _Phase:
+        """
+        name のフェーズを計測するコンテキストマネージャを返す
+
+        同じ名前を複数回計測した場合は合計する。
+
+        Args:
+            name: フェーズ名
+
+        Returns:
+            with 文で使うコンテキストマネージャ
+        """
+        return _Phase(self._seconds, name)
+
+    def to_dict(self) -> dict[str, float]:
+        """
+        フェーズ名から経過時間（秒）への辞書を返す（計測した順）
+
+        Returns:
+            {フェーズ名: 秒}
+        """
+        return dict(self._seconds)
+
+
+class _Phase:
+    """PhaseTimer.phase が返すコンテキストマネージャ"""
+
+    __slots__ = ('_seconds', '_name', '_start')
+
+    def __init__(self, seconds: dict[str, float], name: str) -> None:
+        self._seconds = seconds
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        経過 = time.perf_counter() - self._start
+        self._seconds[self._name] = self._seconds.get(self._name, 0.0) + 経過
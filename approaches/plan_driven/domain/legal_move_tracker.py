@@ -0,0 +1,173 @@
+"""
+LegalMoveTracker クラス
+
+黒・白のコマを着手の記録から差分で更新し、
+両プレイヤーの合法手をビットボードでキャッシュする。
+"""
+
+from typing import FrozenSet, List, Tuple
+from domain import bitboard
+from domain.board import Board
+from domain.game_rules import GameRules
+from domain.move_record import MoveRecord
+
+
+class LegalMoveTracker:
+    """
+    両プレイヤーの合法手をキャッシュするクラス
+
+    盤面への着手・取り消しはこのクラスを通して行う。
+    黒・白のコマは着手の記録から差分で更新し、両者の合法手は着手・取り消しのたびに
+    bitboard.legal_moves_masks_both で盤面全体から求め直す（マスごとの判定は行わない）。
+    合法手の参照は保持したビットボードを読むだけで済む。
+    """
+
+    def __init__(self, board: Board) -> None:
+        """
+        LegalMoveTracker を初期化する
+
+        初期化時だけ盤面全体から黒・白のビットボードを作る。
+
+        Args:
+            board: 対象の盤面（以降の着手はこのクラスを通して行うこと）
+        """
+        self._board = board
+        self._rules = GameRules(board)
+        self._black, self._white = board.to_bitboards()
+        self._legal_black, self._legal_white = bitboard.legal_moves_masks_both(
+            self._black, self._white
+        )
+
+    @property
+    def board(self) -> Board:
+        """対象の盤面"""
+        return self._board
+
+    def legal_moves_mask(self, player: str) -> int:
+        """
+        現在の合法手をビットボードで返す
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手の位置（row * 8 + col）のビットが立った整数
+        """
+        return self._legal_black if player == Board.BLACK else self._legal_white
+
+    def legal_moves(self, player: str) -> List[Tuple[int, int]]:
+        """
+        現在の合法手を返す
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手の位置のリスト [(row, col), ...]（行優先の昇順）
+        """
+        return bitboard.mask_to_positions(self.legal_moves_mask(player))
+
+    def legal_move_set(self, player: str) -> FrozenSet[Tuple[int, int]]:
+        """
+        現在の合法手を集合で返す
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手の位置の集合
+        """
+        return frozenset(self.legal_moves(player))
+
+    def is_legal_move(self, row: int, col: int, player: str) -> bool:
+        """
+        指定位置が現在の合法手かどうかを返す（ビットの参照のみ）
+
+        Args:
+            row: 行（0-7）
+            col: 列（0-7）
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手なら True
+        """
+        if not (0 <= row < Board.SIZE and 0 <= col < Board.SIZE):
+            return False
+        return bool((self.legal_moves_mask(player) >> (row * Board.SIZE + col)) & 1)
+
+    def has_legal_move(self, player: str) -> bool:
+        """
+        指定プレイヤーに合法手が1つ以上あるかを返す
+
+        Args:
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            合法手があれば True
+        """
+        return self.legal_moves_mask(player) != 0
+
+    def apply_move(self, row: int, col: int, player: str) -> MoveRecord:
+        """
+        着手を適用し、合法手を求め直す
+
+        Args:
+            row: 行（0-7）
+            col: 列（0-7）
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            undo_move に渡す着手の記録
+
+        Raises:
+            ValueError: 合法手でない場合
+        """
+        record = self._rules.apply_move(row, col, player)
+        置くコマ, 返すコマ = self._changed_masks(record)
+        if player == Board.BLACK:
+            self._black |= 置くコマ | 返すコマ
+            self._white ^= 返すコマ
+        else:
+            self._white |= 置くコマ | 返すコマ
+            self._black ^= 返すコマ
+        self._refresh()
+        return record
+
+    def undo_move(self, record: MoveRecord) -> None:
+        """
+        着手を取り消し、合法手を求め直す
+
+        Args:
+            record: apply_move が返した着手の記録
+        """
+        self._rules.undo_move(record)
+        置くコマ, 返すコマ = self._changed_masks(record)
+        if record.player == Board.BLACK:
+            self._black ^= 置くコマ | 返すコマ
+            self._white |= 返すコマ
+        else:
+            self._white ^= 置くコマ | 返すコマ
+            self._black |= 返すコマ
+        self._refresh()
+
+    @staticmethod
+    def _changed_masks(record: MoveRecord) -> Tuple[int, int]:
+        """
+        着手の記録から、置いたコマとひっくり返したコマのビットボードを作る
+
+        Args:
+            record: 着手の記録
+
+        Returns:
+            (置いたコマ, ひっくり返したコマ) のビットボード
+        """
+        返すコマ = 0
+        for r, c in record.flipped:
+            返すコマ |= 1 << (r * Board.SIZE + c)
+        return 1 << (record.row * Board.SIZE + record.col), 返すコマ
+
+    def _refresh(self) -> None:
+        """黒・白のビットボードから両プレイヤーの合法手を求め直す"""
+        self._legal_black, self._legal_white = bitboard.legal_moves_masks_both(
+            self._black, self._white
+        )
@@ -0,0 +1,401 @@
+"""
+モンテカルロ木探索（MCTS）
+
+UCT で探索木をたどり、終局まで乱数で打ち合うプレイアウトの勝敗で手を評価する。
+
+盤面は黒・白のビットボード2つだけを持つ PlayoutBoard を1つだけ作って使い回す。
+反復のたびに探索開始局面に戻し、木をたどる着手・展開・プレイアウトのすべてで
+その場でコマを置いてひっくり返す（1手ごとに Board を作らない）。
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from typing import NamedTuple
+
+# domain.game は型注釈にだけ使う
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from domain.game import Game, Policy
+
+from domain import bitboard
+from domain.board import Board
+
+
+# パスを表す着手
+PASS: int = -1
+
+# UCT の探索項の係数の既定値
+DEFAULT_EXPLORATION: float = math.sqrt(2)
+
+
+class PlayoutBoard:
+    """
+    プレイアウト用の盤面（黒・白のビットボード）
+
+    play と playout は盤面をその場で変更する。
+    """
+
+    __slots__ = ('black', 'white')
+
+    def __init__(self, black: int, white: int) -> None:
+        """
+        PlayoutBoard を初期化する
+
+        Args:
+            black: 黒のビットボード
+            white: 白のビットボード
+        """
+        self.black = black
+        self.white = white
+
+    def reset(self, black: int, white: int) -> None:
+        """
+        指定した局面に戻す
+
+        Args:
+            black: 黒のビットボード
+            white: 白のビットボード
+        """
+        self.black = black
+        self.white = white
+
+    def legal_moves(self, black_to_move: bool) -> list[int]:
+        """
+        手番側の着手を列挙する
+
+        Args:
+            black_to_move: 黒番なら True
+
+        Returns:
+            着手のビット番号のリスト。合法手がなく相手にあれば [PASS]、
+            両者とも合法手がなければ（終局）空リスト
+        """
+        if black_to_move:
+            自分, 相手 = self.black, self.white
+        else:
+            自分, 相手 = self.white, self.black
+        合法手 = bitboard.legal_moves_mask(自分, 相手)
+        if 合法手:
+            マス = []
+            while 合法手:
+                最下位 = 合法手 & -合法手
+                マス.append(最下位.bit_length() - 1)
+                合法手 ^= 最下位
+            return マス
+        if bitboard.has_legal_move(相手, 自分):
+            return [PASS]
+        return []
+
+    def play(self, black_to_move: bool, square: int) -> None:
+        """
+        手番側が着手する（PASS なら何もしない）
+
+        合法手かどうかは確認しない（legal_moves の着手を渡すこと）。
+
+        Args:
+            black_to_move: 黒番なら True
+            square: 着手のビット番号（row * 8 + col）または PASS
+        """
+        if square == PASS:
+            return
+        if black_to_move:
+            self.black, self.white, _ = bitboard.make_move(self.black, self.white, square)
+        else:
+            self.white, self.black, _ = bitboard.make_move(self.white, self.black, square)
+
+    def playout(self, black_to_move: bool, rng: random.Random) -> int:
+        """
+        終局まで両者とも合法手から一様に選んで打ち合う
+
+        ループの中ではビットボードをローカル変数で持ち、終局の局面を盤面に書き戻す。
+
+        Args:
+            black_to_move: 黒番なら True
+            rng: 乱数生成器
+
+        Returns:
+            終局時の黒のコマの数 - 白のコマの数
+        """
+        legal_moves_mask = bitboard.legal_moves_mask
+        flips_mask = bitboard.flips_mask
+        randrange = rng.randrange
+        if black_to_move:
+            自分, 相手 = self.black, self.white
+        else:
+            自分, 相手 = self.white, self.black
+        黒番 = black_to_move
+        直前がパス = False
+
+        while True:
+            合法手 = legal_moves_mask(自分, 相手)
+            if 合法手:
+                直前がパス = False
+                # k 番目に小さい合法手を選ぶ（下位のビットを k 個消す）
+                for _ in range(randrange(bin(合法手).count('1'))):
+                    合法手 &= 合法手 - 1
+                置くコマ = 合法手 & -合法手
+                返すコマ = flips_mask(自分, 相手, 置くコマ.bit_length() - 1)
+                自分 |= 返すコマ | 置くコマ
+                相手 ^= 返すコマ
+            elif 直前がパス:
+                break
+            else:
+                直前がパス = True
+            自分, 相手 = 相手, 自分
+            黒番 = not 黒番
+
+        if 黒番:
+            self.black, self.white = 自分, 相手
+        else:
+            self.black, self.white = 相手, 自分
+        return bitboard.popcount(self.black) - bitboard.popcount(self.white)
+
+
+class MCTSNode:
+    """
+    探索木のノード
+
+    wins / visits は、このノードへの着手をしたプレイヤーから見た勝率（引き分けは 0.5 勝）。
+    """
+
+    __slots__ = ('move', 'parent', 'black_moved', 'children', 'untried', 'visits', 'wins')
+
+    def __init__(
+        self,
+        move: int,
+        parent: MCTSNode | None,
+        black_moved: bool,
+        untried: list[int]
+    ) -> None:
+        """
+        MCTSNode を初期化する
+
+        Args:
+            move: このノードへの着手（ビット番号または PASS）
+            parent: 親ノード（ルートなら None）
+            black_moved: このノードへの着手をしたのが黒なら True
+            untried: まだ展開していない着手
+        """
+        self.move = move
+        self.parent = parent
+        self.black_moved = black_moved
+        self.children: list[MCTSNode] = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+
+class MCTSResult(NamedTuple):
+    """探索の結果"""
+
+    move: tuple[int, int] | None
+    win_rate: float
+    playouts: int
+    seconds: float
+    candidates: tuple[tuple[tuple[int, int] | None, int, float], ...]
+
+    @property
+    def playouts_per_sec(self) -> float:
+        return self.playouts / self.seconds if self.seconds else 0.0
+
+
+def _to_position(square: int) -> tuple[int, int] | None:
+    """ビット番号を (row, col) にする（PASS なら None）"""
+    if square == PASS:
+        return None
+    return divmod(square, Board.SIZE)
+
+
+class MCTS:
+    """
+    UCT によるモンテカルロ木探索
+
+    プレイアウトの回数か制限時間（両方指定したら先に尽きた方）まで反復し、
+    最も多く訪問した手を選ぶ。
+    """
+
+    def __init__(
+        self,
+        exploration: float = DEFAULT_EXPLORATION,
+        rng: random.Random | None = None
+    ) -> None:
+        """
+        MCTS を初期化する
+
+        Args:
+            exploration: UCT の探索項の係数
+            rng: 乱数生成器（省略時は新しく作る）
+        """
+        self.exploration = exploration
+        self.rng = rng if rng is not None else random.Random()
+
+    def search(
+        self,
+        board: Board,
+        player: str,
+        playouts: int | None = None,
+        time_limit: float | None = None
+    ) -> MCTSResult:
+        """
+        盤面から最善手を探索する（盤面は変更しない）
+
+        Args:
+            board: 探索する局面
+            player: 手番（'B' または 'W'）
+            playouts: プレイアウトの回数
+            time_limit: 制限時間（秒）
+
+        Returns:
+            MCTSResult（合法手がなければ move は None）
+
+        Raises:
+            ValueError: playouts と time_limit のどちらも指定しない場合、playouts が1未満の場合
+        """
+        黒, 白 = board.to_bitboards()
+        return self.search_bitboards(黒, 白, player, playouts, time_limit)
+
+    def search_bitboards(
+        self,
+        black: int,
+        white: int,
+        player: str,
+        playouts: int | None = None,
+        time_limit: float | None = None
+    ) -> MCTSResult:
+        """
+        ビットボードの局面から最善手を探索する
+
+        Args:
+            black: 黒のビットボード
+            white: 白のビットボード
+            player: 手番（'B' または 'W'）
+            playouts: プレイアウトの回数
+            time_limit: 制限時間（秒）
+
+        Returns:
+            MCTSResult（合法手がなければ move は None）
+
+        Raises:
+            ValueError: playouts と time_limit のどちらも指定しない場合、playouts が1未満の場合
+        """
+        if playouts is None and time_limit is None:
+            raise ValueError("playouts か time_limit を指定してください")
+        if playouts is not None and playouts < 1:
+            raise ValueError("playouts は1以上を指定してください")
+
+        開始時刻 = time.perf_counter()
+        盤面 = PlayoutBoard(black, white)
+        黒番 = player == Board.BLACK
+        ルート = MCTSNode(PASS, None, not 黒番, 盤面.legal_moves(黒番))
+
+        # 合法手がない（パスか終局）なら探索しない
+        if ルート.untried == [PASS] or not ルート.untried:
+            return MCTSResult(None, 0.0, 0, time.perf_counter() - 開始時刻, ())
+
+        締め切り = 開始時刻 + time_limit if time_limit is not None else None
+        回数 = 0
+        while playouts is None or 回数 < playouts:
+            if 締め切り is not None and 回数 and time.perf_counter() >= 締め切り:
+                break
+            盤面.reset(black, white)
+            self._iterate(ルート, 盤面, 黒番)
+            回数 += 1
+
+        経過 = time.perf_counter() - 開始時刻
+        候補 = sorted(ルート.children, key=lambda node: node.visits, reverse=True)
+        最善 = 候補[0]
+        return MCTSResult(
+            move=_to_position(最善.move),
+            win_rate=最善.wins / 最善.visits,
+            playouts=回数,
+            seconds=経過,
+            candidates=tuple(
+                (_to_position(node.move), node.visits, node.wins / node.visits)
+                for node in 候補
+            ),
+        )
+
+    def _iterate(self, root: MCTSNode, board: PlayoutBoard, black_to_move: bool) -> None:
+        """
+        選択・展開・プレイアウト・逆伝播を1回行う
+
+        Args:
+            root: ルートノード
+            board: ルートの局面に戻した盤面（その場で変更する）
+            black_to_move: ルートの手番が黒なら True
+        """
+        rng = self.rng
+        ノード = root
+        黒番 = black_to_move
+
+        # 選択: 展開しきったノードは UCT 値が最大の子へ進む
+        while not ノード.untried and ノード.children:
+            ノード = self._select(ノード)
+            board.play(黒番, ノード.move)
+            黒番 = not 黒番
+
+        # 展開: 未展開の着手を1つ選んで子を作る
+        if ノード.untried:
+            未展開 = ノード.untried
+            着手 = 未展開.pop(rng.randrange(len(未展開)))
+            board.play(黒番, 着手)
+            子 = MCTSNode(着手, ノード, 黒番, board.legal_moves(not 黒番))
+            ノード.children.append(子)
+            ノード = 子
+            黒番 = not 黒番
+
+        # プレイアウト
+        差 = board.playout(黒番, rng)
+        黒の結果 = 1.0 if 差 > 0 else 0.5 if 差 == 0 else 0.0
+
+        # 逆伝播: 各ノードへの着手をしたプレイヤーから見た結果を加える
+        while ノード is not None:
+            ノード.visits += 1
+            ノード.wins += 黒の結果 if ノード.black_moved else 1.0 - 黒の結果
+            ノード = ノード.parent
+
+    def _select(self, node: MCTSNode) -> MCTSNode:
+        """
+        UCT 値（勝率 + 探索項）が最大の子を選ぶ
+
+        Args:
+            node: 展開しきったノード
+
+        Returns:
+            子ノード
+        """
+        係数 = self.exploration * math.sqrt(math.log(node.visits))
+        最大値 = -1.0
+        最善 = node.children[0]
+        for 子 in node.children:
+            値 = 子.wins / 子.visits + 係数 / math.sqrt(子.visits)
+            if 値 > 最大値:
+                最大値 = 値
+                最善 = 子
+        return 最善
+
+
+def make_policy(
+    playouts: int | None = None,
+    time_limit: float | None = None,
+    exploration: float = DEFAULT_EXPLORATION
+) -> Policy:
+    """
+    domain/game.py の play_game で使える MCTS の方策を作る
+
+    Args:
+        playouts: 1手あたりのプレイアウトの回数
+        time_limit: 1手あたりの制限時間（秒）
+        exploration: UCT の探索項の係数
+
+    Returns:
+        (game, rng) -> (row, col) の方策
+    """
+    def mcts_policy(game: Game, rng: random.Random) -> tuple[int, int]:
+        結果 = MCTS(exploration, rng).search(game.board, game.player, playouts, time_limit)
+        return 結果.move
+
+    return mcts_policy
@@ -0,0 +1,45 @@
+"""
+MoveRecord クラス
+
+盤面に適用した1手の記録。
+GameRules.undo_move で盤面を元に戻すために使う。
+"""
+
+from __future__ import annotations
+
+
+class MoveRecord:
+    """
+    適用した1手の記録（取り消し用）
+
+    置いた位置・手番・ひっくり返したコマの位置を保持する。
+    """
+
+    __slots__ = ('row', 'col', 'player', 'flipped')
+
+    def __init__(
+        self,
+        row: int,
+        col: int,
+        player: str,
+        flipped: tuple[tuple[int, int], ...]
+    ) -> None:
+        """
+        MoveRecord を初期化する
+
+        Args:
+            row: 置いた行（0-7）
+            col: 置いた列（0-7）
+            player: 置いたプレイヤー（'B' または 'W'）
+            flipped: ひっくり返したコマの位置 ((row, col), ...)
+        """
+        self.row = row
+        self.col = col
+        self.player = player
+        self.flipped = flipped
+
+    def __repr__(self) -> str:
+        return (
+            f"MoveRecord(row={self.row}, col={self.col}, "
+            f"player={self.player!r}, flipped={self.flipped!r})"
+        )
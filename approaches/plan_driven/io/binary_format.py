@@ -0,0 +1,274 @@
+"""
+バイナリ形式の局面の読み書き
+
+1局面を固定長17バイトで表す:
+
+    オフセット  長さ  内容
+    0           8     黒のビットボード（uint64、リトルエンディアン）
+    8           8     白のビットボード（uint64、リトルエンディアン）
+    16          1     手番（ASCII の 'B' または 'W'）
+
+ビット番号は row * 8 + col（(0, 0) が最下位ビット）で、
+Board.to_bitboards() と同じ。テキスト形式（9行、8文字×8行 + 手番1文字 + 改行9個 = 74バイト）の
+約1/4.4の大きさで、読み込み時に文字列を解析する必要がない。
+
+io パッケージは標準ライブラリと名前が競合するため、このモジュールは
+io ディレクトリを sys.path に加えて `import binary_format` で読み込む（reversi.py と同じ）。
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO, Iterator, TextIO
+
+from domain import bitboard
+from domain.board import Board
+from input_reader import InputReader
+
+
+# 1局面のレコード（黒, 白, 手番）
+RECORD = struct.Struct('<QQc')
+RECORD_SIZE: int = RECORD.size
+
+# 一度に読み込むレコード数
+_READ_RECORDS: int = 4096
+
+_PLAYERS = {b'B': Board.BLACK, b'W': Board.WHITE}
+
+# テキスト形式の盤面に使える文字
+_CELLS = frozenset('.BW')
+
+
+def encode_record(black: int, white: int, player: str) -> bytes:
+    """
+    1局面を17バイトのレコードにする
+
+    Args:
+        black: 黒のビットボード
+        white: 白のビットボード
+        player: 手番（'B' または 'W'）
+
+    Returns:
+        17バイトのレコード
+
+    Raises:
+        ValueError: 手番が 'B' / 'W' でない、または黒と白が重なっている場合
+    """
+    if player not in (Board.BLACK, Board.WHITE):
+        raise ValueError(f"手番は 'B' または 'W' で指定する（{player!r}）")
+    if black & white:
+        raise ValueError("黒と白のビットボードが重なっている")
+    return RECORD.pack(black, white, player.encode('ascii'))
+
+
+def decode_record(record: bytes) -> tuple[int, int, str]:
+    """
+    17バイトのレコードを (黒, 白, 手番) にする
+
+    Args:
+        record: 17バイトのレコード
+
+    Returns:
+        (黒のビットボード, 白のビットボード, 手番)
+
+    Raises:
+        ValueError: 手番のバイトが 'B' / 'W' でない場合
+    """
+    black, white, side = RECORD.unpack(record)
+    return black, white, _player(side)
+
+
+def _player(side: bytes) -> str:
+    player = _PLAYERS.get(side)
+    if player is None:
+        raise ValueError(f"手番のバイトが 'B' / 'W' ではない（{side!r}）")
+    return player
+
+
+class BinaryReader:
+    """
+    バイナリ形式の局面を読み込むクラス
+
+    InputReader のバイナリ版。iter_masks はビットボードのまま返すので、
+    盤面オブジェクトを作らずに bitboard.legal_moves_mask へ渡せる。
+    """
+
+    def __init__(self, board_class: type[Board] = Board) -> None:
+        """
+        BinaryReader を初期化する
+
+        Args:
+            board_class: 盤面の生成に使うクラス（from_bitboards を持つこと）
+        """
+        self._board_class = board_class
+
+    def iter_masks(self, stream: BinaryIO) -> Iterator[tuple[int, int, str]]:
+        """
+        ストリームから局面を (黒, 白, 手番) の形で順に読み込む
+
+        Args:
+            stream: バイナリの入力ストリーム
+
+        Yields:
+            (黒のビットボード, 白のビットボード, 手番)
+
+        Raises:
+            ValueError: 末尾のレコードが17バイトに満たない場合、手番のバイトが不正な場合
+        """
+        while True:
+            データ = stream.read(RECORD_SIZE * _READ_RECORDS)
+            if not データ:
+                return
+            余り = len(データ) % RECORD_SIZE
+            if 余り:
+                # パイプなどでは読み込みが途中で区切られることがあるので、残りを読み足す
+                データ += stream.read(RECORD_SIZE - 余り)
+                if len(データ) % RECORD_SIZE:
+                    raise ValueError(
+                        f"末尾のレコードが{RECORD_SIZE}バイトに満たない"
+                        f"（{len(データ) % RECORD_SIZE}バイト）"
+                    )
+            for black, white, side in RECORD.iter_unpack(データ):
+                yield black, white, _player(side)
+
+    def iter_from_stream(self, stream: BinaryIO) -> Iterator[tuple[Board, str]]:
+        """
+        ストリームから局面を (盤面, 手番) の形で順に読み込む
+
+        Args:
+            stream: バイナリの入力ストリーム
+
+        Yields:
+            (Board, str): 盤面オブジェクトと手番のタプル
+
+        Raises:
+            ValueError: レコードが不正な場合
+        """
+        from_bitboards = self._board_class.from_bitboards
+        for black, white, player in self.iter_masks(stream):
+            yield from_bitboards(black, white), player
+
+    def read_from_stream(self, stream: BinaryIO) -> tuple[Board, str]:
+        """
+        ストリームから1局面を読み込む
+
+        Args:
+            stream: バイナリの入力ストリーム
+
+        Returns:
+            (Board, str): 盤面オブジェクトと手番のタプル
+
+        Raises:
+            ValueError: 17バイト読み込めない場合、レコードが不正な場合
+        """
+        レコード = stream.read(RECORD_SIZE)
+        if len(レコード) != RECORD_SIZE:
+            raise ValueError(
+                f"レコードが{RECORD_SIZE}バイトに満たない（{len(レコード)}バイト）"
+            )
+        black, white, player = decode_record(レコード)
+        return self._board_class.from_bitboards(black, white), player
+
+
+class BinaryWriter:
+    """
+    局面をバイナリ形式で書き込むクラス
+    """
+
+    def write_board(self, stream: BinaryIO, board: Board, player: str) -> None:
+        """
+        盤面と手番を1レコードとして書き込む
+
+        Args:
+            stream: バイナリの出力ストリーム
+            board: 盤面（to_bitboards を持つこと）
+            player: 手番（'B' または 'W'）
+        """
+        black, white = board.to_bitboards()
+        stream.write(encode_record(black, white, player))
+
+    def write_masks(self, stream: BinaryIO, black: int, white: int, player: str) -> None:
+        """
+        ビットボードと手番を1レコードとして書き込む
+
+        Args:
+            stream: バイナリの出力ストリーム
+            black: 黒のビットボード
+            white: 白のビットボード
+            player: 手番（'B' または 'W'）
+        """
+        stream.write(encode_record(black, white, player))
+
+
+def text_to_binary(text_stream: TextIO, binary_stream: BinaryIO) -> int:
+    """
+    テキスト形式（9行ずつ、局面間の空行は可）の局面をバイナリ形式に変換する
+
+    Args:
+        text_stream: テキストの入力ストリーム
+        binary_stream: バイナリの出力ストリーム
+
+    Returns:
+        変換した局面の数
+
+    Raises:
+        ValueError: 末尾の局面が9行に満たない場合、盤面が8文字×8行でない場合、
+            '.' / 'B' / 'W' 以外の文字がある場合、手番が不正な場合
+    """
+    ライター = BinaryWriter()
+    件数 = 0
+    for 行リスト in InputReader.iter_records(text_stream):
+        _validate_lines(行リスト, 件数 + 1)
+        盤面, 手番 = InputReader.parse_lines(行リスト)
+        ライター.write_board(binary_stream, 盤面, 手番)
+        件数 += 1
+    return 件数
+
+
+def _validate_lines(lines: list[str], number: int) -> None:
+    """
+    1局面分の行が盤面8文字×8行 + 手番1行の形式か確かめる
+
+    Args:
+        lines: 前後の空白を除いた9行
+        number: 何番目の局面か（1から数える、エラーの表示用）
+
+    Raises:
+        ValueError: 形式が正しくない場合（局面の番号と行を示す）
+    """
+    for 行番号, 行 in enumerate(lines[:Board.SIZE], 1):
+        if len(行) != Board.SIZE:
+            raise ValueError(
+                f"{number}番目の局面の{行番号}行目が{Board.SIZE}文字ではない（{行!r}）"
+            )
+        if not _CELLS.issuperset(行):
+            raise ValueError(
+                f"{number}番目の局面の{行番号}行目に '.' / 'B' / 'W' 以外の文字がある（{行!r}）"
+            )
+    手番 = lines[Board.SIZE]
+    if 手番 not in (Board.BLACK, Board.WHITE):
+        raise ValueError(f"{number}番目の局面の手番が 'B' / 'W' ではない（{手番!r}）")
+
+
+def binary_to_text(binary_stream: BinaryIO, text_stream: TextIO) -> int:
+    """
+    バイナリ形式の局面をテキスト形式（9行ずつ）に変換する
+
+    Args:
+        binary_stream: バイナリの入力ストリーム
+        text_stream: テキストの出力ストリーム
+
+    Returns:
+        変換した局面の数
+
+    Raises:
+        ValueError: レコードが不正な場合
+    """
+    件数 = 0
+    for black, white, player in BinaryReader().iter_masks(binary_stream):
+        セル列 = bitboard.to_cells(black, white)
+        行リスト = [セル列[i:i + 8] for i in range(0, 64, 8)]
+        行リスト.append(player)
+        text_stream.write('\n'.join(行リスト) + '\n')
+        件数 += 1
+    return 件数
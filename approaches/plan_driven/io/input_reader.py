@@ -4,8 +4,15 @@ InputReader クラス
 標準入力からリバーシの盤面と手番を読み込む。
 """
 
+from __future__ import annotations
+
 import sys
-from typing import Tuple
+
+# typing は起動時間を抑えるため型チェック時だけ読み込む
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, TextIO
+
 from domain.board import Board
 
 
@@ -17,7 +24,17 @@ class InputReader:
     Board オブジェクトと手番を返す。
     """
 
-    def read_from_stdin(self) -> Tuple[Board, str]:
+    def __init__(self, board_class: type[Board] = Board) -> None:
+        """
+        InputReader を初期化する
+
+        Args:
+            board_class: 盤面の生成に使うクラス（Board または CompactBoard など、
+                8x8の盤面データを受け取るクラス）
+        """
+        self._board_class = board_class
+
+    def read_from_stdin(self) -> tuple[Board, str]:
         """
         標準入力から盤面と手番を読み込む
 
@@ -28,16 +45,95 @@ class InputReader:
         Returns:
             (Board, str): 盤面オブジェクトと手番のタプル
         """
-        # 8行の盤面データを読み込む
-        盤面データ = []
-        for _ in range(Board.SIZE):
-            行 = sys.stdin.readline().strip()
-            盤面データ.append(list(行))
+        return self.read_from_stream(sys.stdin)
+
+    def read_from_stream(self, stream: TextIO) -> tuple[Board, str]:
+        """
+        ストリームから盤面と手番を1局面分読み込む
+
+        Args:
+            stream: 入力ストリーム
+
+        Returns:
+            (Board, str): 盤面オブジェクトと手番のタプル
+        """
+        行リスト = [stream.readline().strip() for _ in range(Board.SIZE + 1)]
+        return self.parse_lines(行リスト, self._board_class)
+
+    def iter_from_stream(self, stream: TextIO) -> Iterator[tuple[Board, str]]:
+        """
+        ストリームから局面を順に読み込む
+
+        9行（盤面8行 + 手番1行）を1局面とし、ストリームの終わりまで読み込む。
+        局面と局面の間の空行は読み飛ばす。
+
+        Args:
+            stream: 入力ストリーム
+
+        Yields:
+            (Board, str): 盤面オブジェクトと手番のタプル
+
+        Raises:
+            ValueError: 末尾の局面が9行に満たない場合
+        """
+        for 行リスト in self.iter_records(stream):
+            yield self.parse_lines(行リスト, self._board_class)
+
+    @staticmethod
+    def iter_records(stream: TextIO) -> Iterator[list[str]]:
+        """
+        ストリームを9行ずつの局面（前後の空白を除いた行のリスト）に区切る
+
+        Args:
+            stream: 入力ストリーム
+
+        Yields:
+            list[str]: 1局面分の9行
+
+        Raises:
+            ValueError: 末尾の局面が9行に満たない場合
+        """
+        行数 = Board.SIZE + 1
+        行リスト: list[str] = []
+        for 行 in stream:
+            行 = 行.strip()
+
+            # 局面の区切りの空行は読み飛ばす
+            if not 行 and not 行リスト:
+                continue
+
+            行リスト.append(行)
+            if len(行リスト) == 行数:
+                yield 行リスト
+                行リスト = []
+
+        if 行リスト:
+            raise ValueError(
+                f"末尾の局面が{行数}行に満たない（{len(行リスト)}行）"
+            )
+
+    @staticmethod
+    def parse_lines(
+        lines: list[str],
+        board_class: type[Board] = Board
+    ) -> tuple[Board, str]:
+        """
+        1局面分の行（盤面8行 + 手番1行）を盤面と手番に変換する
+
+        Args:
+            lines: 前後の空白を除いた9行
+            board_class: 盤面の生成に使うクラス
+
+        Returns:
+            (Board, str): 盤面オブジェクトと手番のタプル
+        """
+        # 8行の盤面データ
+        盤面データ = [list(行) for 行 in lines[:Board.SIZE]]
 
-        # 1行の手番を読み込む
-        手番 = sys.stdin.readline().strip()
+        # 1行の手番
+        手番 = lines[Board.SIZE]
 
-        # Board オブジェクトを構築
-        盤面 = Board(盤面データ)
+        # 盤面オブジェクトを構築
+        盤面 = board_class(盤面データ)
 
         return 盤面, 手番
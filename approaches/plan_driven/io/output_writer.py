@@ -4,8 +4,10 @@ OutputWriter クラス
 リバーシの盤面と合法手を標準出力に書き込む。
 """
 
+from __future__ import annotations
+
 import sys
-from typing import List, Tuple
+
 from domain.board import Board
 
 
@@ -20,7 +22,7 @@ class OutputWriter:
     def write_board_with_legal_moves(
         self,
         board: Board,
-        legal_moves: List[Tuple[int, int]],
+        legal_moves: list[tuple[int, int]],
         player: str
     ) -> None:
         """
@@ -34,6 +36,27 @@ class OutputWriter:
             legal_moves: 合法手のリスト [(row, col), ...]
             player: 手番（'B' または 'W'）
         """
+        sys.stdout.write(
+            self.format_board_with_legal_moves(board, legal_moves, player)
+        )
+
+    def format_board_with_legal_moves(
+        self,
+        board: Board,
+        legal_moves: list[tuple[int, int]],
+        player: str
+    ) -> str:
+        """
+        合法手をマークした盤面と手番を出力用の文字列にする
+
+        Args:
+            board: 盤面
+            legal_moves: 合法手のリスト [(row, col), ...]
+            player: 手番（'B' または 'W'）
+
+        Returns:
+            盤面8行と手番1行（各行末に改行）
+        """
         # 盤面をコピー
         盤面データ = board.to_grid()
 
@@ -41,9 +64,7 @@ class OutputWriter:
         for row, col in legal_moves:
             盤面データ[row][col] = '0'
 
-        # 盤面を出力
-        for 行 in 盤面データ:
-            sys.stdout.write(''.join(行) + '\n')
-
-        # 手番を出力
-        sys.stdout.write(player + '\n')
+        # 盤面の各行と手番を改行でつなぐ
+        行リスト = [''.join(行) for 行 in 盤面データ]
+        行リスト.append(player)
+        return '\n'.join(行リスト) + '\n'
@@ -0,0 +1,203 @@
+"""
+PositionCorpus クラス
+
+バイナリ形式（io/binary_format.py、1局面17バイト）の局面ファイルを
+mmap で開き、ファイル全体を読み込まずに局面を参照する。
+
+レコードは固定長なので、i 番目の局面はファイルの i * 17 バイト目から始まる
+（局面番号そのものが索引になり、索引ファイルは不要）。
+"""
+
+from __future__ import annotations
+
+import mmap
+import random
+from typing import Any, Iterator
+
+from domain import bitboard
+from domain.board import Board
+from binary_format import RECORD, RECORD_SIZE, decode_record
+
+
+# as_numpy() が返す構造化配列の型（17バイト、詰め物なし）
+NUMPY_FIELDS = [('black', '<u8'), ('white', '<u8'), ('player', 'S1')]
+
+
+class PositionCorpus:
+    """
+    mmap で開いたバイナリ形式の局面ファイル
+
+    - len(corpus): 局面数
+    - corpus[i]: i 番目の局面を (黒, 白, 手番) で返す（O(1)、負の番号も可）
+    - iter_masks(start, stop): 範囲の局面をコピーせずに順に返す
+    - as_numpy(): numpy の memmap（構造化配列）として返す
+
+    with 文で使うと、抜けるときにファイルを閉じる。
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        局面ファイルを開く
+
+        Args:
+            path: バイナリ形式の局面ファイル
+
+        Raises:
+            ValueError: ファイルの大きさが17バイトの倍数でない場合
+        """
+        self._path = path
+        self._file = open(path, 'rb')
+        try:
+            大きさ = self._file.seek(0, 2)
+            if 大きさ % RECORD_SIZE:
+                raise ValueError(
+                    f"{path} の大きさ（{大きさ}バイト）が{RECORD_SIZE}バイトの倍数ではない"
+                )
+            # 空のファイルは mmap できないので、空のバイト列で代用する
+            self._buffer = (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if 大きさ else b''
+            )
+        except BaseException:
+            self._file.close()
+            raise
+        self._length = 大きさ // RECORD_SIZE
+
+    @property
+    def path(self) -> str:
+        """局面ファイルのパス"""
+        return self._path
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> tuple[int, int, str]:
+        """
+        局面番号で局面を取り出す
+
+        Args:
+            index: 局面番号（負なら末尾から数える）
+
+        Returns:
+            (黒のビットボード, 白のビットボード, 手番)
+
+        Raises:
+            IndexError: 範囲外の場合
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"局面番号 {index} は範囲外（局面数 {self._length}）")
+        開始 = index * RECORD_SIZE
+        return decode_record(self._buffer[開始:開始 + RECORD_SIZE])
+
+    def board(self, index: int, board_class: type[Board] = Board) -> tuple[Board, str]:
+        """
+        局面番号の局面を盤面オブジェクトで返す
+
+        Args:
+            index: 局面番号
+            board_class: 盤面の生成に使うクラス（from_bitboards を持つこと）
+
+        Returns:
+            (Board, str): 盤面オブジェクトと手番のタプル
+        """
+        black, white, player = self[index]
+        return board_class.from_bitboards(black, white), player
+
+    def iter_masks(self, start: int = 0, stop: int | None = None) -> Iterator[tuple[int, int, str]]:
+        """
+        start から stop の手前までの局面を順に返す
+
+        mmap の範囲を memoryview で切り出して struct.iter_unpack に渡すので、
+        ファイルの内容はコピーされない。
+
+        Args:
+            start: 最初の局面番号
+            stop: 最後の局面番号 + 1（省略時は末尾まで）
+
+        Yields:
+            (黒のビットボード, 白のビットボード, 手番)
+
+        Raises:
+            ValueError: 手番のバイトが 'B' / 'W' でない場合
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return
+        範囲 = memoryview(self._buffer)[start * RECORD_SIZE:stop * RECORD_SIZE]
+        try:
+            for black, white, side in RECORD.iter_unpack(範囲):
+                if side == b'B':
+                    yield black, white, Board.BLACK
+                elif side == b'W':
+                    yield black, white, Board.WHITE
+                else:
+                    raise ValueError(f"手番のバイトが 'B' / 'W' ではない（{side!r}）")
+        finally:
+            範囲.release()
+
+    def iter_legal_moves_masks(self, start: int = 0, stop: int | None = None) -> Iterator[int]:
+        """
+        局面ごとの手番側の合法手をビットボードで順に返す
+
+        盤面オブジェクトを作らずに bitboard.legal_moves_mask を直接呼ぶ。
+
+        Args:
+            start: 最初の局面番号
+            stop: 最後の局面番号 + 1（省略時は末尾まで）
+
+        Yields:
+            合法手のビットボード
+        """
+        legal_moves_mask = bitboard.legal_moves_mask
+        for black, white, player in self.iter_masks(start, stop):
+            if player == Board.BLACK:
+                yield legal_moves_mask(black, white)
+            else:
+                yield legal_moves_mask(white, black)
+
+    def sample(self, count: int, rng: random.Random | None = None) -> list[int]:
+        """
+        重複なしで局面番号を無作為に選ぶ
+
+        Args:
+            count: 選ぶ数（局面数以下）
+            rng: 乱数生成器（省略時は random モジュールの既定）
+
+        Returns:
+            局面番号のリスト（self[i] で局面を取り出せる）
+        """
+        return (rng or random).sample(range(self._length), count)
+
+    def as_numpy(self) -> Any:
+        """
+        局面ファイルを numpy の memmap（構造化配列）として返す
+
+        フィールドは black（uint64）・white（uint64）・player（S1）で、
+        ファイルの内容を読み込まずに列として参照できる。numpy が必要。
+
+        Returns:
+            形状 (局面数,) の numpy.memmap（読み取り専用）
+
+        Raises:
+            ImportError: numpy がインストールされていない場合
+        """
+        import numpy as np
+
+        型 = np.dtype(NUMPY_FIELDS)
+        if self._length == 0:
+            return np.empty(0, dtype=型)
+        return np.memmap(self._path, dtype=型, mode='r', shape=(self._length,))
+
+    def close(self) -> None:
+        """ファイルを閉じる"""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def __enter__(self) -> PositionCorpus:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
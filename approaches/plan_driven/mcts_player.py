@@ -0,0 +1,88 @@
+"""
+モンテカルロ木探索（MCTS）による着手の選択
+
+標準入力から盤面と手番を読み込み、domain/mcts.py の MCTS で最善手を探索して、
+候補手ごとの訪問回数と勝率、playouts/sec を標準出力に書き込む。
+
+使い方:
+    python mcts_player.py [--playouts N] [--time 秒] [--exploration C] [--seed S] < board.txt
+
+--playouts と --time の両方を指定した場合は、先に尽きた方で探索を終える。
+どちらも指定しない場合は --playouts 1000 とする。
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+
+from domain.mcts import DEFAULT_EXPLORATION, MCTS, MCTSResult
+
+# io パッケージは標準ライブラリと名前が競合するため、io ディレクトリ自体を
+# sys.path に加えて通常の import で読み込む
+_IO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'io')
+if _IO_DIR not in sys.path:
+    sys.path.append(_IO_DIR)
+
+from input_reader import InputReader
+
+
+# --playouts も --time も指定しない場合のプレイアウトの回数
+DEFAULT_PLAYOUTS: int = 1000
+
+
+def format_result(result: MCTSResult) -> str:
+    """
+    探索の結果を表示用の文字列にする
+
+    Args:
+        result: 探索の結果
+
+    Returns:
+        候補手ごとの行と、最善手・プレイアウトの回数・playouts/sec の行
+    """
+    if result.move is None:
+        return "合法手がありません（パス）"
+    行 = [f"{'move':>8} {'visits':>7} {'win_rate':>9}"]
+    for 位置, 訪問回数, 勝率 in result.candidates:
+        行.append(f"{str(位置):>8} {訪問回数:>7} {勝率:>9.3f}")
+    行.append(
+        f"best {result.move} win_rate {result.win_rate:.3f} "
+        f"playouts {result.playouts} time {result.seconds:.2f}s "
+        f"({result.playouts_per_sec:,.0f} playouts/sec)"
+    )
+    return '\n'.join(行)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    メイン処理
+
+    1. コマンドライン引数を解析する
+    2. 標準入力から盤面と手番を読み込む
+    3. MCTS で探索して結果を標準出力に書き込む
+    """
+    parser = argparse.ArgumentParser(
+        description="標準入力の局面から MCTS で最善手を探索する"
+    )
+    parser.add_argument("--playouts", type=int, default=None,
+                        help=f"プレイアウトの回数（--time も省略した場合は {DEFAULT_PLAYOUTS}）")
+    parser.add_argument("--time", type=float, default=None, help="制限時間（秒）")
+    parser.add_argument("--exploration", type=float, default=DEFAULT_EXPLORATION,
+                        help="UCT の探索項の係数（既定: √2）")
+    parser.add_argument("--seed", type=int, default=None, help="乱数の種")
+    args = parser.parse_args(argv)
+
+    回数 = args.playouts
+    if 回数 is None and args.time is None:
+        回数 = DEFAULT_PLAYOUTS
+
+    盤面, 手番 = InputReader().read_from_stdin()
+    探索 = MCTS(args.exploration, random.Random(args.seed))
+    print(format_result(探索.search(盤面, 手番, 回数, args.time)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
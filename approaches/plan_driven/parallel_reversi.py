@@ -0,0 +1,142 @@
+"""
+リバーシ合法手判定プログラム（並列版）
+
+9行ずつの局面が並んだファイルを読み込み、複数のプロセスで合法手を計算する。
+局面は数百個ずつのチャンクにまとめてワーカーへ渡し、プロセス間通信の回数を減らす。
+出力は入力と同じ順で、1局面ずつ reversi.py を実行した結果と同じになる。
+
+使い方:
+    python parallel_reversi.py positions.txt [-o output.txt]
+                               [--workers N] [--chunk-size K]
+"""
+
+import argparse
+import os
+import sys
+from typing import Iterator, List, Optional, TextIO
+
+from chunk_runner import map_chunks, workers_argument
+from domain.game_rules import GameRules
+
+
+# io パッケージは標準ライブラリと名前が競合するため、io ディレクトリ自体を
+# sys.path に加えて通常の import で読み込む（ワーカープロセスでも同じ）
+_IO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'io')
+if _IO_DIR not in sys.path:
+    sys.path.append(_IO_DIR)
+
+from input_reader import InputReader
+from output_writer import OutputWriter
+
+# 1チャンクあたりの局面数の既定値
+DEFAULT_CHUNK_SIZE: int = 512
+
+
+def iter_chunks(
+    stream: TextIO,
+    chunk_size: int
+) -> Iterator[List[List[str]]]:
+    """
+    入力ストリームを chunk_size 局面ずつのチャンクに区切る
+
+    Args:
+        stream: 9行ずつの局面が並んだ入力ストリーム
+        chunk_size: 1チャンクあたりの局面数
+
+    Yields:
+        局面（9行のリスト）のリスト
+    """
+    チャンク: List[List[str]] = []
+    for 行リスト in InputReader.iter_records(stream):
+        チャンク.append(行リスト)
+        if len(チャンク) == chunk_size:
+            yield チャンク
+            チャンク = []
+    if チャンク:
+        yield チャンク
+
+
+def evaluate_chunk(records: List[List[str]]) -> str:
+    """
+    チャンク内の全局面の合法手を計算し、出力文字列をつなげて返す
+
+    ワーカープロセスで実行される。
+
+    Args:
+        records: 局面（9行のリスト）のリスト
+
+    Returns:
+        各局面の出力（盤面8行 + 手番1行）を入力順につなげた文字列
+    """
+    ライター = OutputWriter()
+    出力リスト: List[str] = []
+    for 行リスト in records:
+        盤面, 手番 = InputReader.parse_lines(行リスト)
+        合法手リスト = GameRules(盤面).find_all_legal_moves(手番)
+        出力リスト.append(
+            ライター.format_board_with_legal_moves(盤面, 合法手リスト, 手番)
+        )
+    return ''.join(出力リスト)
+
+
+def run_parallel(
+    input_stream: TextIO,
+    output_stream: TextIO,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    """
+    入力の全局面を並列に処理し、入力順に出力する
+
+    実行中のチャンクはワーカー数の数倍までに抑え、先頭のチャンクから
+    順に結果を待って書き込む（chunk_runner.map_chunks）。入力全体をメモリに載せることはない。
+
+    Args:
+        input_stream: 9行ずつの局面が並んだ入力ストリーム
+        output_stream: 出力先
+        workers: ワーカープロセス数（None なら CPU 数、1ならこのプロセスで処理する）
+        chunk_size: 1チャンクあたりの局面数
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size は1以上を指定してください")
+
+    引数リスト = ((チャンク,) for チャンク in iter_chunks(input_stream, chunk_size))
+    for 出力 in map_chunks(evaluate_chunk, 引数リスト, workers):
+        output_stream.write(出力)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    メイン処理
+
+    1. コマンドライン引数を解析する
+    2. 入力ファイルの全局面を並列に処理する
+    3. 結果を入力順に出力する
+    """
+    parser = argparse.ArgumentParser(
+        description="局面ファイルの合法手を複数プロセスで計算する"
+    )
+    parser.add_argument("input", help="9行ずつの局面が並んだファイル")
+    parser.add_argument(
+        "-o", "--output", help="出力ファイル（省略時は標準出力）"
+    )
+    parser.add_argument(
+        "--workers", type=workers_argument, default=None,
+        help="ワーカープロセス数（省略時または0なら CPU 数）"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"1チャンクあたりの局面数（既定: {DEFAULT_CHUNK_SIZE}）"
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.input, encoding="utf-8") as 入力:
+        if args.output is None:
+            run_parallel(入力, sys.stdout, args.workers, args.chunk_size)
+        else:
+            with open(args.output, "w", encoding="utf-8") as 出力:
+                run_parallel(入力, 出力, args.workers, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
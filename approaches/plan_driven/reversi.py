@@ -3,46 +3,56 @@
 
 標準入力から盤面と手番を読み込み、
 合法手の位置に '0' をマークした盤面を標準出力に書き込む。
+
+使い方:
+    python reversi.py [--stats] < board.txt
+
+--stats を付けると、判定の内訳（調べたマス・方向の数、途中で打ち切った回数）と
+フェーズ（parse / compute / render）ごとの経過時間を JSON で標準エラー出力に書き込む。
 """
 
-import sys
+from __future__ import annotations
+
 import os
-import importlib.util
+import sys
 
+# io パッケージは標準ライブラリと名前が競合するため、io ディレクトリ自体を
+# sys.path に加えて input_reader / output_writer を通常の import で読み込む
+# （バイトコードキャッシュが効き、起動のたびにソースを読み直さない）
+_IO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'io')
+if _IO_DIR not in sys.path:
+    sys.path.append(_IO_DIR)
 
-def main() -> None:
+
+USAGE = "usage: python reversi.py [--stats] < board.txt"
+
+
+def main(argv: list[str] | None = None) -> None:
     """
     メイン処理
 
     1. 標準入力から盤面と手番を読み込む
     2. 合法手を計算する
     3. 合法手をマークして標準出力に書き込む
+
+    Args:
+        argv: コマンドライン引数（省略時は引数なし）
     """
+    引数 = argv or []
+    if 引数 == ['--stats']:
+        main_with_stats()
+        return
+    if 引数:
+        sys.stderr.write(USAGE + "\n")
+        raise SystemExit(2)
+
     # domain モジュールをインポート
     from domain.board import Board
     from domain.game_rules import GameRules
 
-    # io パッケージは標準ライブラリと競合するため、importlib で手動インポート
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    io_package_path = os.path.join(current_dir, 'io')
-
-    # InputReader をインポート
-    input_reader_spec = importlib.util.spec_from_file_location(
-        "input_reader",
-        os.path.join(io_package_path, "input_reader.py")
-    )
-    input_reader_module = importlib.util.module_from_spec(input_reader_spec)
-    input_reader_spec.loader.exec_module(input_reader_module)
-    InputReader = input_reader_module.InputReader
-
-    # OutputWriter をインポート
-    output_writer_spec = importlib.util.spec_from_file_location(
-        "output_writer",
-        os.path.join(io_package_path, "output_writer.py")
-    )
-    output_writer_module = importlib.util.module_from_spec(output_writer_spec)
-    output_writer_spec.loader.exec_module(output_writer_module)
-    OutputWriter = output_writer_module.OutputWriter
+    # io モジュールをインポート（io ディレクトリは sys.path に追加済み）
+    from input_reader import InputReader
+    from output_writer import OutputWriter
 
     # 1. 標準入力から盤面と手番を読み込む
     リーダー = InputReader()
@@ -57,5 +67,43 @@ def main() -> None:
     ライター.write_board_with_legal_moves(盤面, 合法手リスト, 手番)
 
 
+def main_with_stats() -> None:
+    """
+    計測付きのメイン処理（--stats）
+
+    main と同じ出力を標準出力に書き込み、計測値を JSON で標準エラー出力に書き込む。
+    フェーズの時間は main と同じ GameRules（ビットボード）で計測し、判定の内訳は
+    フェーズの計測が終わってから、InstrumentedGameRules で64マスそれぞれに
+    is_legal_move を呼ぶ別の判定で数える。
+    """
+    import json
+
+    from domain.game_rules import GameRules
+    from domain.instrumentation import InstrumentedGameRules, PhaseTimer
+    from input_reader import InputReader
+    from output_writer import OutputWriter
+
+    タイマー = PhaseTimer()
+    with タイマー.phase('parse'):
+        盤面, 手番 = InputReader().read_from_stdin()
+    with タイマー.phase('compute'):
+        合法手リスト = GameRules(盤面).find_all_legal_moves(手番)
+    with タイマー.phase('render'):
+        OutputWriter().write_board_with_legal_moves(盤面, 合法手リスト, 手番)
+        sys.stdout.flush()
+
+    # 判定の内訳（フェーズの時間には含めない）
+    計測用ルール = InstrumentedGameRules(盤面)
+    計測用ルール.find_all_legal_moves(手番)
+
+    統計 = {
+        'legal_moves': len(合法手リスト),
+        'counters': 計測用ルール.counters.to_dict(),
+        'phases_ms': {名前: 秒 * 1e3 for 名前, 秒 in タイマー.to_dict().items()},
+    }
+    json.dump(統計, sys.stderr)
+    sys.stderr.write("\n")
+
+
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
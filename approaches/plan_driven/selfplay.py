@@ -0,0 +1,305 @@
+"""
+自己対局による局面コーパスの生成
+
+初期配置から乱数で手を選んで終局まで対局し、各手番の局面（着手前の盤面と手番）を
+テキスト形式（9行）またはバイナリ形式（17バイト、io/binary_format.py）で書き出す。
+手番側に合法手がない局面（パス）も1局面として書き出す。
+
+着手は domain/bitboard.py の合法手・ひっくり返すコマの計算（GameRules と同じもの）を
+ビットボードのまま使い、盤面オブジェクトは作らない。
+
+対局は --chunk-games 局ずつのチャンクに分けて複数のプロセスで行う（chunk_runner.py）。
+チャンクの乱数の種は (--seed, チャンク番号) で決まるので、
+ワーカー数によらず同じ設定なら同じ出力になる。
+
+使い方:
+    python selfplay.py --games 10000 -o positions.bin --format binary
+                       [--policy random|weighted] [--workers N]
+                       [--chunk-games K] [--seed S]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import BinaryIO, Callable, Iterator, NamedTuple
+
+from chunk_runner import chunk_rng, game_chunks, map_chunks, per_sec, workers_argument
+from domain import bitboard
+
+# io パッケージは標準ライブラリと名前が競合するため、io ディレクトリ自体を
+# sys.path に加えて通常の import で読み込む（ワーカープロセスでも同じ）
+_IO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'io')
+if _IO_DIR not in sys.path:
+    sys.path.append(_IO_DIR)
+
+from binary_format import RECORD
+
+
+# 初期配置のビットボード（(3, 4) と (4, 3) が黒、(3, 3) と (4, 4) が白）
+INITIAL_BLACK: int = (1 << 28) | (1 << 35)
+INITIAL_WHITE: int = (1 << 27) | (1 << 36)
+
+# weighted で使うマスごとの重み（角を好み、角の隣を避ける）
+SQUARE_WEIGHTS: tuple[int, ...] = (
+    64,  2, 16,  8,  8, 16,  2, 64,
+     2,  1,  4,  4,  4,  4,  1,  2,
+    16,  4,  8,  6,  6,  8,  4, 16,
+     8,  4,  6,  4,  4,  6,  4,  8,
+     8,  4,  6,  4,  4,  6,  4,  8,
+    16,  4,  8,  6,  6,  8,  4, 16,
+     2,  1,  4,  4,  4,  4,  1,  2,
+    64,  2, 16,  8,  8, 16,  2, 64,
+)
+
+# 1チャンクあたりの対局数の既定値
+DEFAULT_CHUNK_GAMES: int = 200
+
+FORMATS: tuple[str, ...] = ('text', 'binary')
+
+
+def _squares(mask: int) -> list[int]:
+    """マスクの立っているビットの番号を昇順に返す"""
+    マス = []
+    while mask:
+        最下位 = mask & -mask
+        マス.append(最下位.bit_length() - 1)
+        mask ^= 最下位
+    return マス
+
+
+def choose_random(moves: int, rng: random.Random) -> int:
+    """
+    合法手から一様に1つ選ぶ
+
+    Args:
+        moves: 合法手のビットボード（0 でないこと）
+        rng: 乱数生成器
+
+    Returns:
+        選んだマスのビット番号（row * 8 + col）
+    """
+    return rng.choice(_squares(moves))
+
+
+def choose_weighted(moves: int, rng: random.Random) -> int:
+    """
+    合法手から SQUARE_WEIGHTS の重みに比例した確率で1つ選ぶ
+
+    Args:
+        moves: 合法手のビットボード（0 でないこと）
+        rng: 乱数生成器
+
+    Returns:
+        選んだマスのビット番号（row * 8 + col）
+    """
+    マス = _squares(moves)
+    return rng.choices(マス, weights=[SQUARE_WEIGHTS[i] for i in マス])[0]
+
+
+# 方策の名前から関数への対応表
+POLICIES: dict[str, Callable[[int, random.Random], int]] = {
+    'random': choose_random,
+    'weighted': choose_weighted,
+}
+
+
+def iter_game_positions(
+    rng: random.Random,
+    policy: Callable[[int, random.Random], int] = choose_random
+) -> Iterator[tuple[int, int, str]]:
+    """
+    初期配置から終局まで1局対局し、各手番の局面を順に返す
+
+    手番側に合法手がなければパスし、その局面も返す。
+    両者とも合法手がなくなったら終局で、その局面は返さない。
+
+    Args:
+        rng: 乱数生成器
+        policy: 合法手のビットボードと乱数生成器から着手を選ぶ関数
+
+    Yields:
+        (黒のビットボード, 白のビットボード, 手番)
+    """
+    turn_moves = bitboard.turn_moves
+    make_move = bitboard.make_move
+    手番側, 相手側 = INITIAL_BLACK, INITIAL_WHITE
+    黒番 = True
+    while True:
+        合法手, パス = turn_moves(手番側, 相手側)
+        if not 合法手:
+            return
+        if パス:
+            # パスの局面も返してから、相手に手番を移す
+            yield (手番側, 相手側, 'B') if 黒番 else (相手側, 手番側, 'W')
+            手番側, 相手側 = 相手側, 手番側
+            黒番 = not 黒番
+        yield (手番側, 相手側, 'B') if 黒番 else (相手側, 手番側, 'W')
+        手番側, 相手側, _ = make_move(手番側, 相手側, policy(合法手, rng))
+        手番側, 相手側 = 相手側, 手番側
+        黒番 = not 黒番
+
+
+def _format_text(black: int, white: int, player: str) -> str:
+    セル列 = bitboard.to_cells(black, white)
+    return '\n'.join(セル列[i:i + 8] for i in range(0, 64, 8)) + f'\n{player}\n'
+
+
+def play_chunk(
+    seed: int,
+    chunk_index: int,
+    games: int,
+    policy: str = 'random',
+    fmt: str = 'text'
+) -> tuple[bytes, int]:
+    """
+    games 局対局し、全局面を書き出したバイト列を返す
+
+    ワーカープロセスで実行される。乱数の種は (seed, chunk_index) で決まる。
+
+    Args:
+        seed: 乱数の種
+        chunk_index: チャンク番号
+        games: 対局数
+        policy: POLICIES のキー
+        fmt: 'text' または 'binary'
+
+    Returns:
+        (書き出したバイト列, 局面数)
+    """
+    rng = chunk_rng(seed, chunk_index)
+    方策 = POLICIES[policy]
+    部品: list[bytes] = []
+    局面数 = 0
+    if fmt == 'binary':
+        pack = RECORD.pack
+        手番バイト = {'B': b'B', 'W': b'W'}
+        for _ in range(games):
+            for black, white, player in iter_game_positions(rng, 方策):
+                部品.append(pack(black, white, 手番バイト[player]))
+                局面数 += 1
+    else:
+        テキスト: list[str] = []
+        for _ in range(games):
+            for black, white, player in iter_game_positions(rng, 方策):
+                テキスト.append(_format_text(black, white, player))
+                局面数 += 1
+        部品.append(''.join(テキスト).encode('ascii'))
+    return b''.join(部品), 局面数
+
+
+class SelfPlayStats(NamedTuple):
+    """自己対局の集計"""
+
+    games: int
+    positions: int
+    seconds: float
+
+    @property
+    def games_per_sec(self) -> float:
+        return per_sec(self.games, self.seconds)
+
+    @property
+    def positions_per_sec(self) -> float:
+        return per_sec(self.positions, self.seconds)
+
+
+def run_selfplay(
+    output: BinaryIO,
+    games: int,
+    workers: int | None = None,
+    chunk_games: int = DEFAULT_CHUNK_GAMES,
+    policy: str = 'random',
+    fmt: str = 'text',
+    seed: int = 0
+) -> SelfPlayStats:
+    """
+    games 局を自己対局し、全局面をチャンク番号順に output へ書き出す
+
+    実行中のチャンクはワーカー数の数倍までに抑え、先頭のチャンクから順に結果を待って書き込む。
+
+    Args:
+        output: バイナリの出力ストリーム
+        games: 対局数
+        workers: ワーカープロセス数（None なら CPU 数、1ならこのプロセスで対局する）
+        chunk_games: 1チャンクあたりの対局数
+        policy: POLICIES のキー
+        fmt: 'text' または 'binary'
+        seed: 乱数の種
+
+    Returns:
+        SelfPlayStats
+
+    Raises:
+        ValueError: 方策・形式・チャンクの大きさが不正な場合
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"不明な方策: {policy}（{', '.join(POLICIES)} から選択）")
+    if fmt not in FORMATS:
+        raise ValueError(f"不明な形式: {fmt}（{', '.join(FORMATS)} から選択）")
+    チャンク = [(*引数, policy, fmt) for 引数 in game_chunks(games, chunk_games, seed)]
+    局面数 = 0
+    開始時刻 = time.perf_counter()
+
+    for データ, 件数 in map_chunks(play_chunk, チャンク, workers):
+        output.write(データ)
+        局面数 += 件数
+
+    return SelfPlayStats(games, 局面数, time.perf_counter() - 開始時刻)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    メイン処理
+
+    1. コマンドライン引数を解析する
+    2. 自己対局して局面を書き出す
+    3. 対局数・局面数と games/sec を標準エラー出力に表示する
+    """
+    parser = argparse.ArgumentParser(
+        description="初期配置から自己対局し、各手番の局面を書き出す"
+    )
+    parser.add_argument("--games", type=int, default=1000, help="対局数（既定: 1000）")
+    parser.add_argument(
+        "-o", "--output", help="出力ファイル（省略時は標準出力）"
+    )
+    parser.add_argument(
+        "--format", choices=FORMATS, default='text',
+        help="出力形式（text: 9行ずつ、binary: 17バイトずつ。既定: text）"
+    )
+    parser.add_argument(
+        "--policy", choices=list(POLICIES), default='random',
+        help="着手の選び方（random: 一様、weighted: 角を好む重み付き。既定: random）"
+    )
+    parser.add_argument(
+        "--workers", type=workers_argument, default=None,
+        help="ワーカープロセス数（省略時または0なら CPU 数）"
+    )
+    parser.add_argument(
+        "--chunk-games", type=int, default=DEFAULT_CHUNK_GAMES,
+        help=f"1チャンクあたりの対局数（既定: {DEFAULT_CHUNK_GAMES}）"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="乱数の種（既定: 0）")
+    args = parser.parse_args(argv)
+
+    if args.output is None:
+        統計 = run_selfplay(sys.stdout.buffer, args.games, args.workers,
+                            args.chunk_games, args.policy, args.format, args.seed)
+        sys.stdout.flush()
+    else:
+        with open(args.output, 'wb') as 出力:
+            統計 = run_selfplay(出力, args.games, args.workers,
+                                args.chunk_games, args.policy, args.format, args.seed)
+
+    print(
+        f"{統計.games}局 {統計.positions}局面 {統計.seconds:.2f}秒 "
+        f"({統計.games_per_sec:,.0f} games/sec, {統計.positions_per_sec:,.0f} positions/sec)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
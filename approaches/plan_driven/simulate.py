@@ -0,0 +1,211 @@
+"""
+対局シミュレータ（画面表示なし）
+
+domain/game.py の Game で、黒と白の方策を指定して初期配置から終局まで対局をくり返し、
+勝敗・手数・パスの回数・最終的なコマの数を集計して games/sec とともに表示する。
+
+対局は selfplay.py と同じく chunk_runner.py で --chunk-games 局ずつのチャンクに分け、
+実行中のチャンクの数を抑えながら複数のプロセスで行う。
+チャンクの乱数の種は (--seed, チャンク番号) で決まるので、
+ワーカー数によらず同じ設定なら同じ集計になる。
+
+使い方:
+    python simulate.py --games 100000 [--black random|greedy|corner]
+                       [--white random|greedy|corner] [--workers N]
+                       [--chunk-games K] [--seed S] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import NamedTuple
+
+from chunk_runner import chunk_rng, game_chunks, map_chunks, per_sec, workers_argument
+from domain.game import POLICIES, play_game
+
+
+# 1チャンクあたりの対局数の既定値
+DEFAULT_CHUNK_GAMES: int = 200
+
+
+class SimulationStats(NamedTuple):
+    """対局の集計"""
+
+    games: int
+    black_wins: int
+    white_wins: int
+    draws: int
+    plies: int
+    passes: int
+    black_discs: int
+    white_discs: int
+    seconds: float = 0.0
+
+    @property
+    def games_per_sec(self) -> float:
+        return per_sec(self.games, self.seconds)
+
+    @property
+    def plies_per_sec(self) -> float:
+        return per_sec(self.plies, self.seconds)
+
+    def to_dict(self) -> dict[str, float]:
+        """JSON に書き出せる辞書にする（games_per_sec / plies_per_sec を含む）"""
+        return {
+            **self._asdict(),
+            'games_per_sec': self.games_per_sec,
+            'plies_per_sec': self.plies_per_sec,
+        }
+
+
+def play_chunk(
+    seed: int,
+    chunk_index: int,
+    games: int,
+    black: str = 'random',
+    white: str = 'random'
+) -> SimulationStats:
+    """
+    games 局対局して集計する
+
+    ワーカープロセスで実行される。乱数の種は (seed, chunk_index) で決まる。
+
+    Args:
+        seed: 乱数の種
+        chunk_index: チャンク番号
+        games: 対局数
+        black: 黒の方策（POLICIES のキー）
+        white: 白の方策（POLICIES のキー）
+
+    Returns:
+        SimulationStats（seconds は 0）
+    """
+    rng = chunk_rng(seed, chunk_index)
+    黒の方策 = POLICIES[black]
+    白の方策 = POLICIES[white]
+    黒の勝ち = 白の勝ち = 引き分け = 手数 = パス = 黒のコマ = 白のコマ = 0
+    for _ in range(games):
+        対局 = play_game(黒の方策, 白の方策, rng)
+        勝者 = 対局.winner()
+        if 勝者 == 'B':
+            黒の勝ち += 1
+        elif 勝者 == 'W':
+            白の勝ち += 1
+        else:
+            引き分け += 1
+        手数 += len(対局.records)
+        パス += 対局.passes
+        黒のコマ += 対局.black_count
+        白のコマ += 対局.white_count
+    return SimulationStats(games, 黒の勝ち, 白の勝ち, 引き分け, 手数, パス, 黒のコマ, 白のコマ)
+
+
+def run_simulation(
+    games: int,
+    black: str = 'random',
+    white: str = 'random',
+    workers: int | None = None,
+    chunk_games: int = DEFAULT_CHUNK_GAMES,
+    seed: int = 0
+) -> SimulationStats:
+    """
+    games 局を対局して集計する
+
+    Args:
+        games: 対局数
+        black: 黒の方策（POLICIES のキー）
+        white: 白の方策（POLICIES のキー）
+        workers: ワーカープロセス数（None なら CPU 数、1ならこのプロセスで対局する）
+        chunk_games: 1チャンクあたりの対局数
+        seed: 乱数の種
+
+    Returns:
+        SimulationStats
+
+    Raises:
+        ValueError: 方策・チャンクの大きさが不正な場合
+    """
+    for 方策 in (black, white):
+        if 方策 not in POLICIES:
+            raise ValueError(f"不明な方策: {方策}（{', '.join(POLICIES)} から選択）")
+    # チャンクの引数は必要になった分だけ作り、結果は受け取った順に足し込む
+    チャンク = ((*引数, black, white) for 引数 in game_chunks(games, chunk_games, seed))
+    合計 = [0] * (len(SimulationStats._fields) - 1)
+    開始時刻 = time.perf_counter()
+
+    for 結果 in map_chunks(play_chunk, チャンク, workers):
+        for i, 値 in enumerate(結果[:-1]):
+            合計[i] += 値
+
+    return SimulationStats(*合計, seconds=time.perf_counter() - 開始時刻)
+
+
+def format_stats(stats: SimulationStats) -> str:
+    """
+    集計を表示用の文字列にする
+
+    Args:
+        stats: 集計
+
+    Returns:
+        複数行の文字列
+    """
+    局数 = stats.games or 1
+    return '\n'.join([
+        f"{stats.games}局 {stats.seconds:.2f}秒 "
+        f"({stats.games_per_sec:,.0f} games/sec, {stats.plies_per_sec:,.0f} plies/sec)",
+        f"黒の勝ち {stats.black_wins} ({stats.black_wins / 局数:.1%}) / "
+        f"白の勝ち {stats.white_wins} ({stats.white_wins / 局数:.1%}) / "
+        f"引き分け {stats.draws} ({stats.draws / 局数:.1%})",
+        f"平均手数 {stats.plies / 局数:.2f} / 平均パス {stats.passes / 局数:.3f} / "
+        f"平均コマ数 黒 {stats.black_discs / 局数:.2f} 白 {stats.white_discs / 局数:.2f}",
+    ])
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    メイン処理
+
+    1. コマンドライン引数を解析する
+    2. 対局をくり返して集計する
+    3. 集計と games/sec を標準出力に表示する
+    """
+    parser = argparse.ArgumentParser(
+        description="初期配置から終局まで対局をくり返し、勝敗と games/sec を表示する"
+    )
+    parser.add_argument("--games", type=int, default=1000, help="対局数（既定: 1000）")
+    parser.add_argument(
+        "--black", choices=list(POLICIES), default='random',
+        help="黒の方策（random: 一様、greedy: 返すコマが最多、corner: 角を優先。既定: random）"
+    )
+    parser.add_argument(
+        "--white", choices=list(POLICIES), default='random',
+        help="白の方策（既定: random）"
+    )
+    parser.add_argument(
+        "--workers", type=workers_argument, default=None,
+        help="ワーカープロセス数（省略時または0なら CPU 数）"
+    )
+    parser.add_argument(
+        "--chunk-games", type=int, default=DEFAULT_CHUNK_GAMES,
+        help=f"1チャンクあたりの対局数（既定: {DEFAULT_CHUNK_GAMES}）"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="乱数の種（既定: 0）")
+    parser.add_argument("--json", action="store_true", help="集計を JSON で出力する")
+    args = parser.parse_args(argv)
+
+    統計 = run_simulation(args.games, args.black, args.white,
+                          args.workers, args.chunk_games, args.seed)
+
+    if args.json:
+        json.dump(統計.to_dict(), sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        print(format_stats(統計))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+バイナリ形式の局面の読み書きのテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、binary_format モジュールが提供すべき振る舞いを表現する。
+"""
+
+import io as _stdlib_io
+import os
+import random
+import sys
+
+import pytest
+
+# domain パッケージと io ディレクトリのモジュールをインポートできるようにパスを追加
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+io_dir = os.path.join(parent_dir, 'io')
+if io_dir not in sys.path:
+    sys.path.append(io_dir)
+
+from domain.board import Board
+from domain.compact_board import CompactBoard
+from binary_format import (
+    RECORD_SIZE,
+    BinaryReader,
+    BinaryWriter,
+    binary_to_text,
+    decode_record,
+    encode_record,
+    text_to_binary,
+)
+
+BytesIO = _stdlib_io.BytesIO
+StringIO = _stdlib_io.StringIO
+
+
+初期配置テキスト = """........
+........
+........
+...WB...
+...BW...
+........
+........
+........
+B
+"""
+
+
+def _ランダムな局面(乱数):
+    盤面データ = [[乱数.choice('..BW') for _ in range(8)] for _ in range(8)]
+    return Board(盤面データ), 乱数.choice('BW')
+
+
+def test_1局面は17バイトのレコードになる():
+    """
+    黒・白のビットボードと手番を17バイトにし、元に戻せる
+    """
+    # Given: 初期配置のビットボード
+    黒, 白 = Board([list(行) for 行 in 初期配置テキスト.split()[:8]]).to_bitboards()
+
+    # When: レコードにして戻す
+    レコード = encode_record(黒, 白, 'B')
+
+    # Then: 17バイトで、同じ値に戻る。末尾は手番の ASCII
+    assert RECORD_SIZE == 17
+    assert len(レコード) == 17
+    assert レコード[16:] == b'B'
+    assert decode_record(レコード) == (黒, 白, 'B')
+
+
+def test_不正な手番や重なったビットボードはエラーになる():
+    """
+    手番が 'B' / 'W' でない、黒と白が重なっている場合は ValueError
+    """
+    with pytest.raises(ValueError):
+        encode_record(0, 0, 'X')
+    with pytest.raises(ValueError):
+        encode_record(1, 1, 'B')
+    with pytest.raises(ValueError):
+        decode_record(bytes(16) + b'X')
+
+
+def test_書き込んだ局面を同じ順に読み込める():
+    """
+    BinaryWriter で書き込んだ局面を BinaryReader で読むと、同じ盤面と手番が同じ順に返る
+    """
+    # Given: ランダムな局面を書き込んだバイナリ
+    乱数 = random.Random(14)
+    局面リスト = [_ランダムな局面(乱数) for _ in range(50)]
+    出力 = BytesIO()
+    ライター = BinaryWriter()
+    for 盤面, 手番 in 局面リスト:
+        ライター.write_board(出力, 盤面, 手番)
+
+    # When: 読み込む
+    読み込んだ局面 = list(BinaryReader().iter_from_stream(BytesIO(出力.getvalue())))
+
+    # Then: 50局面 × 17バイトで、同じ盤面と手番
+    assert len(出力.getvalue()) == 50 * 17
+    assert [(盤面.to_grid(), 手番) for 盤面, 手番 in 読み込んだ局面] == \
+        [(盤面.to_grid(), 手番) for 盤面, 手番 in 局面リスト]
+
+
+def test_盤面クラスを指定して読み込める():
+    """
+    board_class に CompactBoard を渡すと CompactBoard で返る
+    """
+    # Given: 初期配置1局面のバイナリ
+    バイナリ = BytesIO()
+    text_to_binary(StringIO(初期配置テキスト), バイナリ)
+
+    # When: CompactBoard を指定して読み込む
+    盤面, 手番 = BinaryReader(board_class=CompactBoard).read_from_stream(
+        BytesIO(バイナリ.getvalue())
+    )
+
+    # Then: CompactBoard として読み込まれる
+    assert isinstance(盤面, CompactBoard)
+    assert 盤面.get_cell(3, 3) == 'W'
+    assert 手番 == 'B'
+
+
+def test_末尾のレコードが欠けている場合はエラーになる():
+    """
+    17バイトに満たないレコードが末尾に残った場合は ValueError
+    """
+    # Given: 1局面 + 5バイト
+    データ = encode_record(0, 0, 'W') + b'12345'
+
+    # When/Then: 読み込みで ValueError
+    with pytest.raises(ValueError):
+        list(BinaryReader().iter_masks(BytesIO(データ)))
+
+
+def test_テキスト形式とバイナリ形式を相互に変換できる():
+    """
+    テキスト → バイナリ → テキストで元のテキストに戻り、大きさは約1/5になる
+    """
+    # Given: ランダムな局面を並べたテキスト（局面間の空行あり）
+    乱数 = random.Random(15)
+    テキスト = ''
+    for _ in range(20):
+        盤面, 手番 = _ランダムな局面(乱数)
+        テキスト += '\n'.join(''.join(行) for 行 in 盤面.to_grid()) + f'\n{手番}\n'
+    入力 = テキスト.replace(f'\nB\n', '\nB\n\n')
+
+    # When: バイナリにしてからテキストに戻す
+    バイナリ = BytesIO()
+    件数 = text_to_binary(StringIO(入力), バイナリ)
+    戻したテキスト = StringIO()
+    binary_to_text(BytesIO(バイナリ.getvalue()), 戻したテキスト)
+
+    # Then: 空行を除いて元のテキストと一致する
+    assert 件数 == 20
+    assert 戻したテキスト.getvalue() == テキスト
+    assert len(バイナリ.getvalue()) * 4 < len(テキスト)
+
+
+@pytest.mark.parametrize('行, 理由', [
+    ('...WB..', '8文字ではない'),
+    ('...WB....', '8文字ではない'),
+    ('...WX...', "以外の文字がある"),
+])
+def test_盤面の行が不正なテキストは変換せずにエラーになる(行, 理由):
+    """
+    8文字でない行や '.' / 'B' / 'W' 以外の文字を含む局面は、
+    コマをずらして変換せずに、局面の番号と行を示す ValueError を送出する
+    """
+    # Given: 2番目の局面の4行目が不正なテキスト
+    行リスト = 初期配置テキスト.split()
+    行リスト[3] = 行
+    テキスト = 初期配置テキスト + '\n'.join(行リスト) + '\n'
+
+    # When/Then: 変換で ValueError
+    with pytest.raises(ValueError, match=f'2番目の局面の4行目.*{理由}'):
+        text_to_binary(StringIO(テキスト), BytesIO())
+
+
+def test_手番が不正なテキストはエラーになる():
+    """
+    手番の行が 'B' / 'W' でない局面は ValueError
+    """
+    # Given: 手番が 'X' の局面
+    テキスト = 初期配置テキスト.replace('\nB\n', '\nX\n')
+
+    # When/Then: 変換で ValueError
+    with pytest.raises(ValueError, match='1番目の局面の手番'):
+        text_to_binary(StringIO(テキスト), BytesIO())
@@ -0,0 +1,194 @@
+"""
+ビットボードのテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、ビットボードによる合法手計算が提供すべき振る舞いを表現する。
+"""
+
+import random
+import sys
+import os
+
+# domain パッケージをインポートできるようにパスを追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.board import Board
+from domain.game_rules import GameRules
+from domain import bitboard
+
+
+def test_初期配置の黒番の合法手ビットボードを求められる():
+    """
+    初期配置では、黒番の合法手は (2,3), (3,2), (4,5), (5,4) の4つ
+    """
+    # Given: 初期配置のビットボード（(3,3)=W, (3,4)=B, (4,3)=B, (4,4)=W）
+    黒 = (1 << (3 * 8 + 4)) | (1 << (4 * 8 + 3))
+    白 = (1 << (3 * 8 + 3)) | (1 << (4 * 8 + 4))
+
+    # When: 黒番の合法手を求める
+    合法手 = bitboard.legal_moves_mask(黒, 白)
+
+    # Then: 4つの合法手の位置のビットが立っている
+    assert bitboard.mask_to_positions(合法手) == [(2, 3), (3, 2), (4, 5), (5, 4)]
+
+
+def test_行をまたいで回り込む並びは合法手にならない():
+    """
+    右端の先は次の行の左端だが、盤面上はつながっていないので
+    挟んだとはみなさない
+    """
+    # Given: (0,6)=B, (0,7)=W, (1,0)=.
+    #        ビット番号上は 6, 7, 8 と連続している
+    黒 = 1 << 6
+    白 = 1 << 7
+
+    # When: 黒番の合法手を求める
+    合法手 = bitboard.legal_moves_mask(黒, 白)
+
+    # Then: 合法手はない
+    assert 合法手 == 0
+
+
+def test_ビットボードを行優先の位置リストに変換できる():
+    """
+    ビットボードの立っているビットを (row, col) のリストに変換する
+    """
+    # Given: (0,0), (2,5), (7,7) のビットが立ったビットボード
+    ビットボード = (1 << 63) | (1 << (2 * 8 + 5)) | 1
+
+    # When & Then: 行優先の昇順で位置が返される
+    assert bitboard.mask_to_positions(ビットボード) == [(0, 0), (2, 5), (7, 7)]
+    assert bitboard.mask_to_positions(0) == []
+
+
+def test_ランダムな盤面で1マスずつの判定と同じ合法手を列挙する():
+    """
+    ビットボードによる一括計算の結果は、
+    is_legal_move で全マスを1つずつ判定した結果と一致する
+    """
+    乱数 = random.Random(20240601)
+
+    for _ in range(300):
+        # Given: 空マス・黒・白がランダムに配置された盤面
+        盤面データ = [
+            [乱数.choice('..BW') for _ in range(8)] for _ in range(8)
+        ]
+        ルール = GameRules(Board(盤面データ))
+
+        for 手番 in ('B', 'W'):
+            # When: 全合法手を列挙する
+            合法手リスト = ルール.find_all_legal_moves(手番)
+
+            # Then: 1マスずつ判定した結果と一致する
+            期待する合法手 = [
+                (row, col)
+                for row in range(8)
+                for col in range(8)
+                if ルール.is_legal_move(row, col, 手番)
+            ]
+            assert 合法手リスト == 期待する合法手
+
+
+def test_ランダムな盤面で着手と取り消しが正しく行われる():
+    """
+    ランダムな盤面の全合法手について、
+    apply_move で返るコマが方向ごとの判定と一致し、
+    undo_move で元の盤面に戻る
+    """
+    乱数 = random.Random(7)
+
+    for _ in range(100):
+        # Given: ランダムな盤面
+        盤面データ = [
+            [乱数.choice('..BW') for _ in range(8)] for _ in range(8)
+        ]
+        盤面 = Board(盤面データ)
+        ルール = GameRules(盤面)
+
+        for 手番 in ('B', 'W'):
+            for row, col in ルール.find_all_legal_moves(手番):
+                # Given: 方向ごとの判定で求めた、返るはずのコマ
+                期待する返すコマ = []
+                for dr, dc in GameRules.DIRECTIONS:
+                    if ルール.can_flip_in_direction(row, col, dr, dc, 手番):
+                        r, c = row + dr, col + dc
+                        while 盤面データ[r][c] != 手番:
+                            期待する返すコマ.append((r, c))
+                            r, c = r + dr, c + dc
+
+                # When: 着手する
+                記録 = ルール.apply_move(row, col, 手番)
+
+                # Then: 返ったコマが一致し、全て手番の色になっている
+                assert sorted(記録.flipped) == sorted(期待する返すコマ)
+                assert 盤面.get_cell(row, col) == 手番
+                for r, c in 記録.flipped:
+                    assert 盤面.get_cell(r, c) == 手番
+
+                # When & Then: 取り消すと元の盤面に戻る
+                ルール.undo_move(記録)
+                assert 盤面.to_grid() == 盤面データ
+
+
+def test_両者の合法手ビットボードを1回で求められる():
+    """legal_moves_masks_both は legal_moves_mask を2回呼んだ結果と一致する"""
+    乱数 = random.Random(210)
+    for _ in range(500):
+        # Given: ランダムな盤面
+        盤面データ = [[乱数.choice('..BW') for _ in range(8)] for _ in range(8)]
+        黒, 白 = Board(盤面データ).to_bitboards()
+
+        # When: 両者の合法手をまとめて求める
+        黒の合法手, 白の合法手 = bitboard.legal_moves_masks_both(黒, 白)
+
+        # Then: 個別に求めた結果と一致し、popcount が数を表す
+        assert 黒の合法手 == bitboard.legal_moves_mask(黒, 白)
+        assert 白の合法手 == bitboard.legal_moves_mask(白, 黒)
+        assert bitboard.popcount(黒の合法手) == len(bitboard.mask_to_positions(黒の合法手))
+
+
+def test_合法手の有無を列挙せずに判定できる():
+    """has_legal_move / is_game_over は legal_moves_mask の結果と一致する"""
+    乱数 = random.Random(220)
+    for _ in range(500):
+        # Given: ランダムな盤面（空マスが少ない盤面も含める）
+        空マスの割合 = 乱数.random()
+        盤面データ = [
+            ['.' if 乱数.random() < 空マスの割合 else 乱数.choice('BW') for _ in range(8)]
+            for _ in range(8)
+        ]
+        黒, 白 = Board(盤面データ).to_bitboards()
+
+        # When & Then: 有無と終局判定が列挙の結果と一致する
+        assert bitboard.has_legal_move(黒, 白) == (bitboard.legal_moves_mask(黒, 白) != 0)
+        assert bitboard.has_legal_move(白, 黒) == (bitboard.legal_moves_mask(白, 黒) != 0)
+        assert bitboard.is_game_over(黒, 白) == (
+            bitboard.legal_moves_mask(黒, 白) == 0 and bitboard.legal_moves_mask(白, 黒) == 0
+        )
+
+
+def test_着手後のビットボードと次に着手する側の合法手を求められる():
+    """make_move は GameRules.apply_move と同じ盤面に、turn_moves はパスを判定する"""
+    乱数 = random.Random(230)
+    for _ in range(300):
+        # Given: ランダムな盤面
+        盤面データ = [[乱数.choice('..BW') for _ in range(8)] for _ in range(8)]
+        盤面 = Board(盤面データ)
+        黒, 白 = 盤面.to_bitboards()
+
+        # When & Then: パスでなければ手番側、パスなら相手側の合法手を返す
+        合法手, パス = bitboard.turn_moves(黒, 白)
+        if bitboard.legal_moves_mask(黒, 白):
+            assert (合法手, パス) == (bitboard.legal_moves_mask(黒, 白), False)
+        else:
+            assert (合法手, パス) == (bitboard.legal_moves_mask(白, 黒), True)
+            continue
+
+        # When: 黒が最初の合法手に置く
+        row, col = bitboard.mask_to_positions(合法手)[0]
+        新しい黒, 新しい白, 返すコマ = bitboard.make_move(黒, 白, row * 8 + col)
+        GameRules(盤面).apply_move(row, col, 'B')
+
+        # Then: GameRules で着手した盤面と一致する
+        assert (新しい黒, 新しい白) == 盤面.to_bitboards()
+        assert 返すコマ == bitboard.flips_mask(黒, 白, row * 8 + col)
@@ -154,3 +154,66 @@ def test_相手プレイヤーを取得できる():
 
     # When & Then: 'W' の相手は 'B'
     assert Board.get_opponent('W') == 'B'
+
+
+def test_盤面を黒と白のビットボードに変換できる():
+    """
+    盤面を黒・白それぞれのビットボードに変換できる
+    ビット番号は row * 8 + col で、(0, 0) が最下位ビットになる
+    """
+    # Given: 角と中央にコマが配置された盤面
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[0][0] = 'B'
+    盤面データ[7][7] = 'W'
+    盤面データ[3][4] = 'B'
+    盤面データ[4][3] = 'W'
+    盤面 = Board(盤面データ)
+
+    # When: ビットボードに変換する
+    黒, 白 = 盤面.to_bitboards()
+
+    # Then: 各コマの位置のビットだけが立っている
+    assert 黒 == (1 << 0) | (1 << (3 * 8 + 4))
+    assert 白 == (1 << 63) | (1 << (4 * 8 + 3))
+
+
+def test_コマを置いて指定したコマをひっくり返せる():
+    """
+    place_stone はコマを置き、指定された位置のコマを手番の色に変える
+    remove_stone はその変更を元に戻す
+    """
+    # Given: 初期配置
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[3][3] = 'W'
+    盤面データ[3][4] = 'B'
+    盤面データ[4][3] = 'B'
+    盤面データ[4][4] = 'W'
+    盤面 = Board(盤面データ)
+    元の盤面データ = 盤面.to_grid()
+
+    # When: (2,3) に黒を置き、(3,3) をひっくり返す
+    盤面.place_stone(2, 3, 'B', [(3, 3)])
+
+    # Then: 置いたマスとひっくり返したマスが黒になる
+    assert 盤面.get_cell(2, 3) == 'B'
+    assert 盤面.get_cell(3, 3) == 'B'
+
+    # When: 取り消す
+    盤面.remove_stone(2, 3, 'B', [(3, 3)])
+
+    # Then: 元の盤面に戻る
+    assert 盤面.to_grid() == 元の盤面データ
+
+
+def test_セルの値を設定できる():
+    """
+    set_cell で指定位置のセルの値を変更できる
+    """
+    # Given: 空の盤面
+    盤面 = Board([['.'] * 8 for _ in range(8)])
+
+    # When: (5,6) に白を設定する
+    盤面.set_cell(5, 6, 'W')
+
+    # Then: 値が変わっている
+    assert 盤面.get_cell(5, 6) == 'W'
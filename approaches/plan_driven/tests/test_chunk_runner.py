@@ -0,0 +1,111 @@
+"""
+chunk_runner.py のテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、チャンク単位の並列実行が提供すべき振る舞いを表現する。
+"""
+
+import os
+import sys
+
+import pytest
+
+# plan_driven ディレクトリをインポートできるようにパスを追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import simulate
+from chunk_runner import (
+    MAX_PENDING_PER_WORKER,
+    chunk_rng,
+    game_chunks,
+    map_chunks,
+    resolve_workers,
+)
+
+
+def 二乗(x: int) -> int:
+    """ワーカープロセスで実行する関数"""
+    return x * x
+
+
+def test_対局数をチャンクに分け最後のチャンクは残りの対局数になる():
+    """
+    games 局を chunk_games 局ずつに分け、チャンク番号と種を付ける
+    """
+    # When: 10局を4局ずつに分ける
+    チャンク = list(game_chunks(10, 4, seed=7))
+
+    # Then: 4・4・2局のチャンクになる
+    assert チャンク == [(7, 0, 4), (7, 1, 4), (7, 2, 2)]
+
+
+def test_チャンクの大きさが1未満なら呼び出した時点でエラーになる():
+    """
+    chunk_games が1未満なら、イテレータを読む前に ValueError
+    """
+    with pytest.raises(ValueError):
+        game_chunks(10, 0, seed=0)
+
+
+def test_チャンクの乱数は種とチャンク番号だけで決まる():
+    """
+    同じ (seed, chunk_index) なら同じ乱数列になる
+    """
+    assert chunk_rng(3, 1).random() == chunk_rng(3, 1).random()
+    assert chunk_rng(3, 1).random() != chunk_rng(3, 2).random()
+
+
+@pytest.mark.parametrize('ワーカー数', [1, 2])
+def test_結果はチャンクの順に返る(ワーカー数):
+    """
+    ワーカー数によらず、結果はチャンクの順に返る
+    """
+    # When: 20個のチャンクを実行する
+    結果 = list(map_chunks(二乗, ((i,) for i in range(20)), ワーカー数))
+
+    # Then: 入力と同じ順
+    assert 結果 == [i * i for i in range(20)]
+
+
+def test_実行中のチャンクはワーカー数の定数倍までに抑える():
+    """
+    最初の結果を受け取った時点で、読み込んだチャンクは上限を超えない
+    """
+    読んだ数 = 0
+
+    def チャンク():
+        nonlocal 読んだ数
+        for i in range(1000):
+            読んだ数 += 1
+            yield (i,)
+
+    # When: 2ワーカーで最初の結果だけ受け取る
+    結果 = map_chunks(二乗, チャンク(), workers=2)
+    assert next(結果) == 0
+
+    # Then: 全チャンクではなく、上限までしか読んでいない
+    assert 読んだ数 <= 2 * MAX_PENDING_PER_WORKER
+    結果.close()
+
+
+def test_負のワーカー数はエラーになる():
+    """
+    ワーカー数が負なら、プロセスプールを作る前に ValueError
+    """
+    with pytest.raises(ValueError, match='0以上'):
+        resolve_workers(-1)
+    with pytest.raises(ValueError, match='0以上'):
+        list(map_chunks(二乗, [(1,)], workers=-2))
+
+
+def test_コマンドラインで負のワーカー数を指定すると使い方のエラーになる(capsys):
+    """
+    --workers に負の値を指定すると、トレースバックではなく argparse のエラー（終了コード2）になる
+    """
+    # When/Then: simulate.py に --workers -1 を渡すと終了コード2
+    with pytest.raises(SystemExit) as 終了:
+        simulate.main(['--games', '1', '--workers', '-1'])
+    assert 終了.value.code == 2
+
+    # Then: 標準エラー出力に理由を表示する
+    assert '0以上を指定してください' in capsys.readouterr().err
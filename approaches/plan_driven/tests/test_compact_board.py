@@ -0,0 +1,192 @@
+"""
+CompactBoard クラスのテスト
+
+振る舞い駆動でテストを記述。
+CompactBoard が Board と同じように GameRules・InputReader・OutputWriter から
+使えることを確認する。
+"""
+
+import random
+import sys
+import os
+import io as _stdlib_io
+import importlib.util
+
+import pytest
+
+# domain と io パッケージをインポートできるようにパスを追加
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from domain.board import Board
+from domain.compact_board import CompactBoard
+from domain.game_rules import GameRules
+
+
+def _load_io_module(name):
+    """io パッケージは標準ライブラリと名前が競合するため、importlib で手動インポート"""
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(parent_dir, 'io', f"{name}.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+InputReader = _load_io_module("input_reader").InputReader
+OutputWriter = _load_io_module("output_writer").OutputWriter
+
+
+初期配置 = [
+    list("........"),
+    list("........"),
+    list("........"),
+    list("...WB..."),
+    list("...BW..."),
+    list("........"),
+    list("........"),
+    list("........"),
+]
+
+
+def _ランダムな盤面(乱数):
+    return [[乱数.choice('..BW') for _ in range(8)] for _ in range(8)]
+
+
+def test_Boardと同じ値をセルから取得できる():
+    """
+    同じ盤面データから作った Board と CompactBoard は、全マスで同じ値を返す
+    """
+    # Given: ランダムな盤面データ
+    乱数 = random.Random(10)
+    盤面データ = _ランダムな盤面(乱数)
+
+    # When: Board と CompactBoard を作る
+    盤面 = Board(盤面データ)
+    省メモリ盤面 = CompactBoard(盤面データ)
+
+    # Then: 全マスの値・空マス判定・盤面データ・ビットボードが一致する
+    for row in range(8):
+        for col in range(8):
+            assert 省メモリ盤面.get_cell(row, col) == 盤面.get_cell(row, col)
+            assert 省メモリ盤面.is_empty(row, col) == 盤面.is_empty(row, col)
+    assert 省メモリ盤面.to_grid() == 盤面.to_grid()
+    assert 省メモリ盤面.to_bitboards() == 盤面.to_bitboards()
+
+
+def test_64マスでない盤面データはエラーになる():
+    """
+    行や列が足りない盤面データを渡すと ValueError になる
+    """
+    # Given: 7行しかない盤面データ
+    盤面データ = 初期配置[:7]
+
+    # When/Then: CompactBoard の生成で ValueError
+    with pytest.raises(ValueError):
+        CompactBoard(盤面データ)
+
+
+def test_コピーは元の盤面と独立している():
+    """
+    copy() で作った盤面を変更しても、元の盤面は変わらない
+    """
+    # Given: 初期配置の盤面とそのコピー
+    盤面 = CompactBoard(初期配置)
+    コピー = 盤面.copy()
+
+    # When: コピーにコマを置く
+    コピー.place_stone(2, 3, 'B', [(3, 3)])
+
+    # Then: コピーだけが変わっている
+    assert コピー.get_cell(2, 3) == 'B'
+    assert コピー.get_cell(3, 3) == 'B'
+    assert 盤面.get_cell(2, 3) == '.'
+    assert 盤面.get_cell(3, 3) == 'W'
+
+
+def test_バイト列との相互変換ができる():
+    """
+    to_bytes() で得た64バイトから from_bytes() で同じ盤面を作れる
+    """
+    # Given: 初期配置の盤面
+    盤面 = CompactBoard(初期配置)
+
+    # When: バイト列を経由して盤面を作り直す
+    バイト列 = 盤面.to_bytes()
+    復元した盤面 = CompactBoard.from_bytes(バイト列)
+
+    # Then: 64バイトで、同じ盤面になる
+    assert len(バイト列) == 64
+    assert 復元した盤面.to_grid() == 初期配置
+
+
+def test_GameRulesでBoardと同じ合法手と着手結果になる():
+    """
+    ランダム対局の各局面で、CompactBoard を使った GameRules が
+    Board を使った場合と同じ合法手を返し、着手と取り消しも同じ結果になる
+    """
+    乱数 = random.Random(20)
+    for _ in range(20):
+        # Given: 初期配置の Board と CompactBoard
+        盤面 = Board(初期配置)
+        省メモリ盤面 = CompactBoard(初期配置)
+        ルール = GameRules(盤面)
+        省メモリルール = GameRules(省メモリ盤面)
+        手番 = 'B'
+        記録リスト = []
+
+        # When: 同じ手を両方に適用していく
+        while True:
+            合法手 = ルール.find_all_legal_moves(手番)
+            # Then: 合法手が一致する
+            assert 省メモリルール.find_all_legal_moves(手番) == 合法手
+            if not 合法手:
+                手番 = Board.get_opponent(手番)
+                if not ルール.find_all_legal_moves(手番):
+                    break
+                continue
+            row, col = 乱数.choice(合法手)
+            ルール.apply_move(row, col, 手番)
+            記録リスト.append(省メモリルール.apply_move(row, col, 手番))
+            assert 省メモリ盤面.to_grid() == 盤面.to_grid()
+            手番 = Board.get_opponent(手番)
+
+        # Then: 全て取り消すと初期配置に戻る
+        for 記録 in reversed(記録リスト):
+            省メモリルール.undo_move(記録)
+        assert 省メモリ盤面.to_grid() == 初期配置
+
+
+def test_InputReaderで盤面クラスを指定して読み込める():
+    """
+    InputReader に board_class を渡すと、そのクラスの盤面が返る
+    """
+    # Given: 初期配置と黒番の入力
+    入力 = _stdlib_io.StringIO(
+        "\n".join("".join(行) for 行 in 初期配置) + "\nB\n"
+    )
+
+    # When: CompactBoard を指定して読み込む
+    盤面, 手番 = InputReader(board_class=CompactBoard).read_from_stream(入力)
+
+    # Then: CompactBoard として読み込まれる
+    assert isinstance(盤面, CompactBoard)
+    assert 盤面.to_grid() == 初期配置
+    assert 手番 == 'B'
+
+
+def test_OutputWriterでBoardと同じ出力になる():
+    """
+    OutputWriter に CompactBoard を渡しても、Board と同じ文字列を出力する
+    """
+    # Given: 初期配置の Board と CompactBoard と黒番の合法手
+    盤面 = Board(初期配置)
+    省メモリ盤面 = CompactBoard(初期配置)
+    合法手 = GameRules(盤面).find_all_legal_moves('B')
+
+    # When: それぞれ出力文字列を作る
+    出力 = OutputWriter().format_board_with_legal_moves(盤面, 合法手, 'B')
+    省メモリ出力 = OutputWriter().format_board_with_legal_moves(省メモリ盤面, 合法手, 'B')
+
+    # Then: 同じ出力になる
+    assert 省メモリ出力 == 出力
@@ -0,0 +1,120 @@
+"""
+Game クラスのテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、Game クラスが提供すべき振る舞いを表現する。
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+# domain パッケージをインポートできるようにパスを追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.board import Board
+from domain.game import POLICIES, Game, play_game
+
+
+def _数える(盤面, 色):
+    return sum(row.count(色) for row in 盤面.to_grid())
+
+
+def test_初期配置の黒番から始まる():
+    """
+    Game() は初期配置・黒番で、合法手は4つ
+    """
+    # Given/When: 初期配置の対局
+    対局 = Game()
+
+    # Then: 黒番で、コマは2つずつ、合法手は4つ
+    assert 対局.player == 'B'
+    assert (対局.black_count, 対局.white_count) == (2, 2)
+    assert 対局.legal_moves() == [(2, 3), (3, 2), (4, 5), (5, 4)]
+    assert not 対局.is_over
+
+
+def test_着手するとコマを返して手番が替わりコマの数が差分で更新される():
+    """
+    play は盤面をその場で変更し、コマの数を数え直さずに更新する
+    """
+    # Given: 初期配置の対局
+    対局 = Game()
+
+    # When: 黒が (2,3) に置く
+    記録 = 対局.play(2, 3)
+
+    # Then: (3,3) の白が返り、白番になり、コマの数は黒4・白1
+    assert 記録.flipped == ((3, 3),)
+    assert 対局.board.get_cell(3, 3) == 'B'
+    assert 対局.player == 'W'
+    assert (対局.black_count, 対局.white_count) == (4, 1)
+    assert 対局.count_flips(2, 2) == 1
+
+
+def test_合法手でない位置や終局後に着手するとエラーになる():
+    """
+    合法手でない位置、盤面外、終局後の着手は ValueError
+    """
+    # Given: 初期配置の対局
+    対局 = Game()
+
+    # When & Then: 合法手でない位置と盤面外はエラーで、盤面は変わらない
+    with pytest.raises(ValueError):
+        対局.play(0, 0)
+    with pytest.raises(ValueError):
+        対局.play(8, 0)
+    assert 対局.board.to_grid() == Game.initial_board().to_grid()
+
+    # When & Then: 終局後もエラー
+    play_game(POLICIES['random'], POLICIES['random'], random.Random(0), 対局)
+    with pytest.raises(ValueError):
+        対局.play(*対局.records[0].flipped[0])
+
+
+def test_次の手番に合法手がなければパスして同じ手番が続く():
+    """
+    相手に合法手がなければパスし、手番はそのまま
+    """
+    # Given: 黒が (0,2) に置くと白が置けなくなるが、黒はまだ置ける盤面
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[0][0] = 'B'
+    盤面データ[0][1] = 'W'
+    盤面データ[7][7] = 'B'
+    盤面データ[6][6] = 'W'
+    対局 = Game(Board(盤面データ))
+
+    # When: 黒が (0,2) に置く
+    対局.play(0, 2)
+
+    # Then: 白はパスして黒番が続く
+    assert 対局.player == 'B'
+    assert 対局.passes == 1
+    assert 対局.legal_moves() == [(5, 5)]
+
+    # When: 黒が (5,5) に置くと両者とも置けない
+    対局.play(5, 5)
+
+    # Then: 終局で、白のコマがない黒の勝ち
+    assert 対局.is_over
+    assert 対局.legal_moves() == []
+    assert 対局.winner() == 'B'
+
+
+def test_どの方策でも終局まで対局でき差分のコマの数が盤面と一致する():
+    """
+    play_game は終局した Game を返し、コマの数と着手の記録が盤面と矛盾しない
+    """
+    乱数 = random.Random(23)
+    for 名前, 方策 in POLICIES.items():
+        for _ in range(5):
+            # When: 終局まで対局する
+            対局 = play_game(方策, 方策, 乱数)
+
+            # Then: 終局していて、コマの数は盤面を数えた結果と一致する
+            assert 対局.is_over, 名前
+            assert 対局.black_count == _数える(対局.board, 'B')
+            assert 対局.white_count == _数える(対局.board, 'W')
+            assert 4 + len(対局.records) == 対局.black_count + 対局.white_count
@@ -375,3 +375,171 @@ def test_合法手がない場合は空リストを返す():
 
     # Then: 空リストが返される
     assert 合法手リスト == []
+
+
+def test_置いたときにひっくり返るコマを全方向まとめて求める():
+    """
+    find_flips は、指定位置に置いたときにひっくり返る
+    全方向のコマの位置を返す
+    """
+    # Given: (3,3) に黒を置くと8方向全てで白を挟める盤面
+    盤面データ = [
+        ['.', '.', '.', '.', '.', '.', '.', '.'],
+        ['.', 'B', 'B', 'B', 'B', 'B', '.', '.'],
+        ['.', 'B', 'W', 'W', 'W', 'B', '.', '.'],
+        ['.', 'B', 'W', '.', 'W', 'B', '.', '.'],
+        ['.', 'B', 'W', 'W', 'W', 'B', '.', '.'],
+        ['.', 'B', 'B', 'B', 'B', 'B', '.', '.'],
+        ['.', '.', '.', '.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.', '.', '.', '.'],
+    ]
+    ルール = GameRules(Board(盤面データ))
+
+    # When: (3,3) に黒を置いたときのひっくり返るコマを求める
+    返すコマ = ルール.find_flips(3, 3, 'B')
+
+    # Then: 周囲の8つの白が全て返る
+    assert sorted(返すコマ) == [
+        (2, 2), (2, 3), (2, 4), (3, 2), (3, 4), (4, 2), (4, 3), (4, 4)
+    ]
+
+
+def test_合法手でない位置ではひっくり返るコマはない():
+    """
+    空でないマスや挟めないマスでは find_flips は空リストを返す
+    """
+    # Given: 初期配置
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[3][3] = 'B'
+    盤面データ[3][4] = 'W'
+    盤面データ[4][3] = 'W'
+    盤面データ[4][4] = 'B'
+    ルール = GameRules(Board(盤面データ))
+
+    # When & Then: 既にコマがあるマス・挟めないマスは空リスト
+    assert ルール.find_flips(3, 3, 'B') == []
+    assert ルール.find_flips(0, 0, 'B') == []
+
+
+def test_着手を適用してから取り消すと元の盤面に戻る():
+    """
+    apply_move はコマを置いて挟んだコマをひっくり返し、
+    undo_move はその手を取り消して元の盤面に戻す
+    """
+    # Given: 初期配置
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[3][3] = 'B'
+    盤面データ[3][4] = 'W'
+    盤面データ[4][3] = 'W'
+    盤面データ[4][4] = 'B'
+    盤面 = Board(盤面データ)
+    ルール = GameRules(盤面)
+
+    # When: 黒が (2,4) に置く
+    記録 = ルール.apply_move(2, 4, 'B')
+
+    # Then: (2,4) に黒が置かれ、(3,4) の白が黒に返る
+    assert 盤面.get_cell(2, 4) == 'B'
+    assert 盤面.get_cell(3, 4) == 'B'
+    assert 記録.flipped == ((3, 4),)
+
+    # When: 続けて白が (2,5) に置き、2手とも取り消す
+    記録2 = ルール.apply_move(2, 5, 'W')
+    ルール.undo_move(記録2)
+    ルール.undo_move(記録)
+
+    # Then: 初期配置に戻る
+    assert 盤面.to_grid() == 盤面データ
+
+
+def test_合法手でない位置に着手するとエラーになる():
+    """
+    apply_move に合法手でない位置を渡すと ValueError を送出し、
+    盤面は変更しない
+    """
+    import pytest
+
+    # Given: 初期配置
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[3][3] = 'B'
+    盤面データ[3][4] = 'W'
+    盤面データ[4][3] = 'W'
+    盤面データ[4][4] = 'B'
+    盤面 = Board(盤面データ)
+    ルール = GameRules(盤面)
+
+    # When & Then: (0,0) に置こうとするとエラー
+    with pytest.raises(ValueError):
+        ルール.apply_move(0, 0, 'B')
+    assert 盤面.to_grid() == 盤面データ
+
+
+def test_合法手の数とビットボードをリストを作らずに求める():
+    """
+    mobility は合法手の数とビットボードを返し、
+    find_all_legal_moves と同じ合法手を表す
+    """
+    # Given: 初期配置
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[3][3] = 'B'
+    盤面データ[3][4] = 'W'
+    盤面データ[4][3] = 'W'
+    盤面データ[4][4] = 'B'
+    ルール = GameRules(Board(盤面データ))
+
+    # When: 黒番の合法手の数とビットボードを求める
+    数, マスク = ルール.mobility('B')
+
+    # Then: 4手で、ビットは row * 8 + col に立つ
+    assert 数 == 4
+    assert マスク == sum(1 << (row * 8 + col)
+                       for row, col in ルール.find_all_legal_moves('B'))
+
+
+def test_黒と白の合法手の数とビットボードをまとめて求める():
+    """
+    mobility_both は黒と白それぞれに mobility を呼んだ結果と一致する
+    """
+    import random
+
+    乱数 = random.Random(21)
+    for _ in range(200):
+        # Given: ランダムな盤面
+        盤面データ = [[乱数.choice('..BW') for _ in range(8)] for _ in range(8)]
+        ルール = GameRules(Board(盤面データ))
+
+        # When & Then: 両者まとめて求めても個別に求めても同じ
+        assert ルール.mobility_both() == (ルール.mobility('B'), ルール.mobility('W'))
+
+
+def test_片方だけ合法手がない場合はパスで終局ではないと判定する():
+    """
+    has_any_legal_move は合法手の有無を返し、
+    is_game_over は両者とも合法手がない場合だけ True を返す
+    """
+    # Given: 黒は (0,2) に置けるが、白はどこにも置けない盤面
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[0][0] = 'B'
+    盤面データ[0][1] = 'W'
+    ルール = GameRules(Board(盤面データ))
+
+    # When & Then: 白はパス、黒は置ける、終局ではない
+    assert ルール.has_any_legal_move('B')
+    assert not ルール.has_any_legal_move('W')
+    assert not ルール.is_game_over()
+
+
+def test_両者とも合法手がない場合は終局と判定する():
+    """
+    盤面が埋まっていなくても、両者とも置けなければ終局
+    """
+    # Given: 黒しかない盤面
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[3][3] = 'B'
+    盤面データ[4][4] = 'B'
+    ルール = GameRules(Board(盤面データ))
+
+    # When & Then: どちらも置けず終局
+    assert not ルール.has_any_legal_move('B')
+    assert not ルール.has_any_legal_move('W')
+    assert ルール.is_game_over()
@@ -0,0 +1,110 @@
+"""
+InstrumentedGameRules / PhaseTimer のテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、計測用のクラスが提供すべき振る舞いを表現する。
+"""
+
+import os
+import random
+import sys
+import time
+
+# domain パッケージをインポートできるようにパスを追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.board import Board
+from domain.game_rules import GameRules
+from domain.instrumentation import HotPathCounters, InstrumentedGameRules, PhaseTimer
+
+
+初期配置 = [
+    list('........'),
+    list('........'),
+    list('........'),
+    list('...WB...'),
+    list('...BW...'),
+    list('........'),
+    list('........'),
+    list('........'),
+]
+
+
+def test_計測付きでも合法手はGameRulesと一致する():
+    """
+    InstrumentedGameRules の判定結果は GameRules と同じ
+    """
+    # Given: ランダムな盤面
+    乱数 = random.Random(18)
+    for _ in range(100):
+        盤面 = Board([[乱数.choice('..BW') for _ in range(8)] for _ in range(8)])
+        for 手番 in ('B', 'W'):
+            # When: 両方で合法手を求める
+            計測付き = InstrumentedGameRules(盤面).find_all_legal_moves(手番)
+
+            # Then: 一致する
+            assert 計測付き == GameRules(盤面).find_all_legal_moves(手番)
+
+
+def test_初期配置で調べたマスと方向と打ち切りを数える():
+    """
+    64マスを調べ、空でない4マスは方向を調べずに終え、
+    合法手の4マスはひっくり返せる方向が見つかった時点で終える
+    """
+    # Given: 初期配置
+    ルール = InstrumentedGameRules(Board(初期配置))
+
+    # When: 黒番の合法手を求める
+    合法手リスト = ルール.find_all_legal_moves('B')
+
+    # Then: 各計測値が整合している
+    計測値 = ルール.counters
+    assert len(合法手リスト) == 4
+    assert 計測値.squares_examined == 64
+    assert 計測値.exit_occupied == 4
+    assert 計測値.exit_flippable == 4
+    # 合法手でない空きマス56個は8方向すべてを調べる
+    assert 計測値.rays_probed == 56 * 8 + 4 * 8 - 計測値.rays_skipped
+    assert 計測値.rays_probed == (
+        計測値.exit_no_opponent + 計測値.exit_blocked + 計測値.exit_flippable
+    )
+    assert sum(計測値.ray_lengths.values()) == 計測値.rays_probed
+    assert sum(k * v for k, v in 計測値.ray_lengths.items()) == 計測値.ray_steps
+
+
+def test_計測値をJSONに書き出せる辞書にできる():
+    """
+    to_dict() は平均の方向の長さと打ち切りの内訳を含む
+    """
+    # Given: 1方向だけ記録した計測値
+    計測値 = HotPathCounters()
+    計測値.record_ray(3)
+    計測値.record_ray(1)
+
+    # When: 辞書にする
+    辞書 = 計測値.to_dict()
+
+    # Then: 平均と長さごとの数が入る
+    assert 辞書['rays_probed'] == 2
+    assert 辞書['mean_ray_length'] == 2.0
+    assert 辞書['ray_lengths'] == {'1': 1, '3': 1}
+    assert set(辞書['early_exits']) == {
+        'occupied', 'no_opponent', 'blocked', 'flippable', 'rays_skipped'
+    }
+
+
+def test_フェーズごとの経過時間を計測した順に記録する():
+    """
+    同じ名前のフェーズは合計される
+    """
+    タイマー = PhaseTimer()
+    with タイマー.phase('parse'):
+        time.sleep(0.001)
+    with タイマー.phase('compute'):
+        pass
+    with タイマー.phase('parse'):
+        time.sleep(0.001)
+
+    経過時間 = タイマー.to_dict()
+    assert list(経過時間) == ['parse', 'compute']
+    assert 経過時間['parse'] >= 0.002
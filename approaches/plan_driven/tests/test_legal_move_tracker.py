@@ -0,0 +1,100 @@
+"""
+LegalMoveTracker クラスのテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、LegalMoveTracker クラスが提供すべき振る舞いを表現する。
+"""
+
+import random
+import sys
+import os
+
+import pytest
+
+# domain パッケージをインポートできるようにパスを追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.board import Board
+from domain.game_rules import GameRules
+from domain.legal_move_tracker import LegalMoveTracker
+
+
+def 初期配置() -> Board:
+    """リバーシの初期配置の盤面を作る"""
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[3][3] = 'W'
+    盤面データ[3][4] = 'B'
+    盤面データ[4][3] = 'B'
+    盤面データ[4][4] = 'W'
+    return Board(盤面データ)
+
+
+def test_初期配置の両プレイヤーの合法手を保持する():
+    """
+    初期化時に、黒番・白番それぞれの合法手を求めて保持する
+    """
+    # Given & When: 初期配置で LegalMoveTracker を作る
+    トラッカー = LegalMoveTracker(初期配置())
+
+    # Then: 両プレイヤーの合法手が得られる
+    assert トラッカー.legal_moves('B') == [(2, 3), (3, 2), (4, 5), (5, 4)]
+    assert トラッカー.legal_moves('W') == [(2, 4), (3, 5), (4, 2), (5, 3)]
+    assert トラッカー.is_legal_move(2, 3, 'B') is True
+    assert トラッカー.is_legal_move(2, 4, 'B') is False
+
+
+def test_ランダムな対局の各手で全マスの再計算と一致する():
+    """
+    着手・取り消しのたびに保持している合法手は、
+    全マスを調べ直した結果と一致する
+    """
+    乱数 = random.Random(8)
+
+    for _ in range(20):
+        # Given: 初期配置のトラッカー
+        盤面 = 初期配置()
+        トラッカー = LegalMoveTracker(盤面)
+        ルール = GameRules(盤面)
+        手番 = 'B'
+        記録リスト = []
+
+        while True:
+            # Then: 両プレイヤーの合法手が全体の再計算と一致する
+            for プレイヤー in ('B', 'W'):
+                assert トラッカー.legal_moves(プレイヤー) == ルール.find_all_legal_moves(プレイヤー)
+
+            合法手リスト = トラッカー.legal_moves(手番)
+            if not 合法手リスト:
+                手番 = Board.get_opponent(手番)
+                if not トラッカー.has_legal_move(手番):
+                    break
+                continue
+
+            # When: ランダムな合法手を指す
+            row, col = 乱数.choice(合法手リスト)
+            記録リスト.append(トラッカー.apply_move(row, col, 手番))
+            手番 = Board.get_opponent(手番)
+
+        # When: 全ての手を逆順に取り消す
+        while 記録リスト:
+            トラッカー.undo_move(記録リスト.pop())
+            # Then: 取り消しのたびに全体の再計算と一致する
+            for プレイヤー in ('B', 'W'):
+                assert トラッカー.legal_moves(プレイヤー) == ルール.find_all_legal_moves(プレイヤー)
+
+        # Then: 初期配置に戻っている
+        assert 盤面.to_grid() == 初期配置().to_grid()
+
+
+def test_合法手でない着手はエラーになり合法手は変わらない():
+    """
+    合法手でない位置への着手は ValueError を送出し、
+    保持している合法手は変わらない
+    """
+    # Given: 初期配置のトラッカー
+    トラッカー = LegalMoveTracker(初期配置())
+
+    # When & Then: (0,0) への着手はエラー
+    with pytest.raises(ValueError):
+        トラッカー.apply_move(0, 0, 'B')
+    assert トラッカー.legal_moves('B') == [(2, 3), (3, 2), (4, 5), (5, 4)]
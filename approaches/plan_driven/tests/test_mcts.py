@@ -0,0 +1,199 @@
+"""
+MCTS（domain/mcts.py）と mcts_player.py のテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、モンテカルロ木探索が提供すべき振る舞いを表現する。
+"""
+
+import io as _stdlib_io
+import os
+import random
+import sys
+
+import pytest
+
+# plan_driven ディレクトリをインポートできるようにパスを追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mcts_player
+from domain import bitboard
+from domain.board import Board
+from domain.game import Game, play_game, random_policy
+from domain.game_rules import GameRules
+from domain.mcts import MCTS, PlayoutBoard, make_policy
+
+
+def _終局まで読んだ黒のコマの差(黒, 白, 黒番):
+    """両者が最善を尽くしたときの 黒 - 白（比較用の全探索）"""
+    自分, 相手 = (黒, 白) if 黒番 else (白, 黒)
+    合法手 = bitboard.legal_moves_mask(自分, 相手)
+    if not 合法手:
+        if not bitboard.legal_moves_mask(相手, 自分):
+            return bitboard.popcount(黒) - bitboard.popcount(白)
+        return _終局まで読んだ黒のコマの差(黒, 白, not 黒番)
+    結果 = []
+    for 行, 列 in bitboard.mask_to_positions(合法手):
+        盤面 = PlayoutBoard(黒, 白)
+        盤面.play(黒番, 行 * 8 + 列)
+        結果.append(_終局まで読んだ黒のコマの差(盤面.black, 盤面.white, not 黒番))
+    return max(結果) if 黒番 else min(結果)
+
+
+def test_プレイアウト用の盤面はその場で着手してGameRulesと同じ結果になる():
+    """
+    PlayoutBoard.play は Board を作らずにビットボードを更新し、
+    結果は GameRules.apply_move と同じ
+    """
+    乱数 = random.Random(25)
+    for _ in range(50):
+        # Given: ランダムな盤面
+        盤面データ = [[乱数.choice('..BW') for _ in range(8)] for _ in range(8)]
+        for 手番 in ('B', 'W'):
+            for 行, 列 in GameRules(Board(盤面データ)).find_all_legal_moves(手番):
+                盤面 = Board(盤面データ)
+                プレイアウト用 = PlayoutBoard(*盤面.to_bitboards())
+
+                # When: 同じ手を両方に着手する
+                GameRules(盤面).apply_move(行, 列, 手番)
+                プレイアウト用.play(手番 == 'B', 行 * 8 + 列)
+
+                # Then: 結果の盤面が一致する
+                assert (プレイアウト用.black, プレイアウト用.white) == 盤面.to_bitboards()
+
+
+def test_プレイアウトは終局まで進めて盤面に書き戻しコマの差を返す():
+    """
+    playout の後の盤面は両者とも合法手がなく、戻り値は 黒 - 白 のコマの差
+    """
+    乱数 = random.Random(250)
+    初期配置 = Game.initial_board().to_bitboards()
+    盤面 = PlayoutBoard(*初期配置)
+    for _ in range(20):
+        # When: 初期配置に戻してプレイアウトする
+        盤面.reset(*初期配置)
+        差 = 盤面.playout(True, 乱数)
+
+        # Then: 終局していて、差は盤面のコマの差
+        assert bitboard.is_game_over(盤面.black, 盤面.white)
+        assert 差 == bitboard.popcount(盤面.black) - bitboard.popcount(盤面.white)
+        assert 盤面.black & 盤面.white == 0
+
+
+def test_プレイアウトの回数を指定すると回数どおりに探索し盤面を変更しない():
+    """
+    playouts を指定すると、その回数だけプレイアウトし、訪問回数の合計も同じになる
+    """
+    # Given: 初期配置
+    盤面 = Game.initial_board()
+
+    # When: 200回のプレイアウトで探索する
+    結果 = MCTS(rng=random.Random(1)).search(盤面, 'B', playouts=200)
+
+    # Then: 回数どおりで、最善手は合法手、盤面はそのまま
+    assert 結果.playouts == 200
+    assert sum(訪問回数 for _, 訪問回数, _ in 結果.candidates) == 200
+    assert 結果.move in GameRules(盤面).find_all_legal_moves('B')
+    assert 結果.move == 結果.candidates[0][0]
+    assert 0.0 <= 結果.win_rate <= 1.0
+    assert 結果.playouts_per_sec > 0
+    assert 盤面.to_grid() == Game.initial_board().to_grid()
+
+
+def test_制限時間を指定すると時間内で探索を打ち切る():
+    """
+    time_limit だけを指定すると、時間が尽きるまでプレイアウトする
+    """
+    # When: 0.05秒で探索する
+    結果 = MCTS(rng=random.Random(2)).search(Game.initial_board(), 'B', time_limit=0.05)
+
+    # Then: 1回以上プレイアウトし、時間はおおむね制限時間どおり
+    assert 結果.playouts >= 1
+    assert 0.05 <= 結果.seconds < 1.0
+
+
+def test_回数も時間も指定しない場合はエラーになる():
+    """
+    playouts と time_limit のどちらも指定しない、または playouts が0なら ValueError
+    """
+    with pytest.raises(ValueError):
+        MCTS().search(Game.initial_board(), 'B')
+    with pytest.raises(ValueError):
+        MCTS().search(Game.initial_board(), 'B', playouts=0)
+
+
+def test_合法手がない局面では探索せずにNoneを返す():
+    """
+    手番側に合法手がない局面（パス・終局）では move は None
+    """
+    # Given: 黒に合法手がない盤面
+    盤面データ = [['.'] * 8 for _ in range(8)]
+    盤面データ[0][0] = 'W'
+    盤面データ[0][1] = 'B'
+
+    # When & Then
+    結果 = MCTS().search(Board(盤面データ), 'B', playouts=10)
+    assert 結果.move is None
+    assert 結果.playouts == 0
+
+
+def test_終盤で勝ち負けが分かれる局面では勝てる手を選ぶ():
+    """
+    残り数マスで、勝てる手が1つだけある局面では、その手を選ぶ
+    """
+    乱数 = random.Random(2025)
+    調べた局面 = 0
+    while 調べた局面 < 3:
+        # Given: 乱数で終盤まで進めた局面のうち、勝てる手が1つだけのもの
+        対局 = Game()
+        while not 対局.is_over and 64 - 対局.black_count - 対局.white_count > 6:
+            対局.play(*random_policy(対局, 乱数))
+        if 対局.is_over:
+            continue
+        黒, 白 = 対局.board.to_bitboards()
+        黒番 = 対局.player == 'B'
+        勝てる手 = []
+        for 行, 列 in 対局.legal_moves():
+            盤面 = PlayoutBoard(黒, 白)
+            盤面.play(黒番, 行 * 8 + 列)
+            差 = _終局まで読んだ黒のコマの差(盤面.black, 盤面.white, not 黒番)
+            if (差 > 0) == 黒番 and 差 != 0:
+                勝てる手.append((行, 列))
+        if len(勝てる手) != 1 or len(対局.legal_moves()) < 2:
+            continue
+        調べた局面 += 1
+
+        # When: 2000回のプレイアウトで探索する
+        結果 = MCTS(rng=random.Random(調べた局面)).search(対局.board, 対局.player, playouts=2000)
+
+        # Then: 勝てる手を選ぶ
+        assert 結果.move == 勝てる手[0]
+
+
+def test_MCTSの方策でplay_gameを終局まで対局できる():
+    """
+    make_policy の方策は domain/game.py の play_game で使える
+    """
+    # When: 黒を MCTS（1手10回）、白を乱数で対局する
+    対局 = play_game(make_policy(playouts=10), random_policy, random.Random(3))
+
+    # Then: 終局する
+    assert 対局.is_over
+
+
+def test_コマンドラインから候補手とplayouts_per_secを出力する(monkeypatch, capsys):
+    """
+    mcts_player.py は候補手ごとの訪問回数と勝率、最善手と playouts/sec を出力する
+    """
+    # Given: 標準入力に初期配置・黒番
+    入力 = ''.join(''.join(row) + '\n' for row in Game.initial_board().to_grid()) + 'B\n'
+    monkeypatch.setattr('sys.stdin', _stdlib_io.StringIO(入力))
+
+    # When: 50回のプレイアウトで実行する
+    mcts_player.main(['--playouts', '50', '--seed', '0'])
+
+    # Then: 4つの候補手と最善手の行が出力される
+    行 = capsys.readouterr().out.splitlines()
+    assert len(行) == 6
+    assert 行[-1].startswith('best ')
+    assert 'playouts 50' in 行[-1]
+    assert 'playouts/sec' in 行[-1]
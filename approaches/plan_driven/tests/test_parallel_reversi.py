@@ -0,0 +1,89 @@
+"""
+parallel_reversi.py のテスト
+
+振る舞い駆動でテストを記述。
+並列版の出力が、1局面ずつ reversi.py を実行した結果と一致することを確認する。
+"""
+
+import random
+import sys
+import os
+import io as _stdlib_io
+from unittest.mock import patch
+
+import pytest
+
+# plan_driven ディレクトリをインポートできるようにパスを追加
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+import parallel_reversi
+from tests.test_reversi import load_reversi_module
+
+# StringIO は標準ライブラリから取得
+StringIO = _stdlib_io.StringIO
+
+
+def ランダムな局面を作る(乱数: random.Random) -> str:
+    """ランダムな盤面と手番を9行の文字列にする"""
+    行リスト = [
+        ''.join(乱数.choice('..BW') for _ in range(8)) for _ in range(8)
+    ]
+    行リスト.append(乱数.choice('BW'))
+    return '\n'.join(行リスト) + '\n'
+
+
+def test_並列処理の出力が1局面ずつの実行結果と一致する(capsys):
+    """
+    複数の局面を並列に処理した出力は、
+    各局面を reversi.py で1つずつ処理した出力を入力順につなげたものと一致する。
+    """
+    # Given: ランダムな局面が25個並んだ入力
+    乱数 = random.Random(404)
+    局面リスト = [ランダムな局面を作る(乱数) for _ in range(25)]
+
+    # Given: 1局面ずつ reversi.py で処理した出力
+    reversi_module = load_reversi_module()
+    期待する出力 = ''
+    for 局面 in 局面リスト:
+        with patch('sys.stdin', StringIO(局面)):
+            reversi_module.main()
+        期待する出力 += capsys.readouterr().out
+
+    # When: 2プロセス・4局面ずつのチャンクで並列に処理する
+    出力 = StringIO()
+    parallel_reversi.run_parallel(
+        StringIO(''.join(局面リスト)), 出力, workers=2, chunk_size=4
+    )
+
+    # Then: 出力が完全に一致する
+    assert 出力.getvalue() == 期待する出力
+
+
+def test_局面をチャンクに区切れる():
+    """
+    9行ずつの局面を、指定した数ずつのチャンクに区切る。
+    局面の間の空行は読み飛ばす。
+    """
+    # Given: 空行を挟んで5つの局面が並んだ入力
+    乱数 = random.Random(7)
+    入力 = '\n'.join(ランダムな局面を作る(乱数) for _ in range(5))
+
+    # When: 2局面ずつのチャンクに区切る
+    チャンクリスト = list(parallel_reversi.iter_chunks(StringIO(入力), 2))
+
+    # Then: 2, 2, 1 局面のチャンクになる
+    assert [len(チャンク) for チャンク in チャンクリスト] == [2, 2, 1]
+    assert all(len(局面) == 9 for チャンク in チャンクリスト for 局面 in チャンク)
+
+
+def test_末尾の局面が欠けている場合はエラーになる():
+    """
+    末尾の局面が9行に満たない場合は ValueError を送出する。
+    """
+    # Given: 3行しかない入力
+    入力 = "........\n........\nB\n"
+
+    # When & Then: チャンクに区切ろうとするとエラーになる
+    with pytest.raises(ValueError):
+        list(parallel_reversi.iter_chunks(StringIO(入力), 2))
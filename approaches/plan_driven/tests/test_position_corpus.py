@@ -0,0 +1,136 @@
+"""
+PositionCorpus クラスのテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、PositionCorpus クラスが提供すべき振る舞いを表現する。
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+# domain パッケージと io ディレクトリのモジュールをインポートできるようにパスを追加
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+io_dir = os.path.join(parent_dir, 'io')
+if io_dir not in sys.path:
+    sys.path.append(io_dir)
+
+from domain.board import Board
+from domain.compact_board import CompactBoard
+from domain.game_rules import GameRules
+from binary_format import encode_record
+from position_corpus import PositionCorpus
+
+
+def _局面ファイルを作る(path, 件数, シード):
+    """ランダムな局面を書き込み、(黒, 白, 手番) のリストを返す"""
+    乱数 = random.Random(シード)
+    局面リスト = []
+    with open(path, 'wb') as f:
+        for _ in range(件数):
+            盤面 = Board([[乱数.choice('..BW') for _ in range(8)] for _ in range(8)])
+            黒, 白 = 盤面.to_bitboards()
+            手番 = 乱数.choice('BW')
+            f.write(encode_record(黒, 白, 手番))
+            局面リスト.append((黒, 白, 手番))
+    return 局面リスト
+
+
+def test_局面番号で任意の局面を取り出せる(tmp_path):
+    """
+    corpus[i] で i 番目の局面が返り、負の番号は末尾から数える
+    """
+    # Given: 100局面のファイル
+    パス = tmp_path / 'positions.bin'
+    局面リスト = _局面ファイルを作る(パス, 100, 15)
+
+    # When: 開いて任意の番号を参照する
+    with PositionCorpus(str(パス)) as コーパス:
+        # Then: 局面数と各局面が一致する
+        assert len(コーパス) == 100
+        for i in random.Random(1).sample(range(100), 20):
+            assert コーパス[i] == 局面リスト[i]
+        assert コーパス[-1] == 局面リスト[-1]
+        with pytest.raises(IndexError):
+            コーパス[100]
+
+
+def test_範囲を指定して順に読み出せる(tmp_path):
+    """
+    iter_masks(start, stop) は範囲内の局面を順に返す
+    """
+    # Given: 50局面のファイル
+    パス = tmp_path / 'positions.bin'
+    局面リスト = _局面ファイルを作る(パス, 50, 16)
+
+    with PositionCorpus(str(パス)) as コーパス:
+        # When/Then: 全体と一部の範囲
+        assert list(コーパス.iter_masks()) == 局面リスト
+        assert list(コーパス.iter_masks(10, 20)) == 局面リスト[10:20]
+        assert list(コーパス.iter_masks(40, 999)) == 局面リスト[40:]
+
+
+def test_合法手をビットボードのまま順に求められる(tmp_path):
+    """
+    iter_legal_moves_masks は GameRules.legal_moves_mask と同じ値を返す
+    """
+    # Given: 30局面のファイル
+    パス = tmp_path / 'positions.bin'
+    _局面ファイルを作る(パス, 30, 17)
+
+    with PositionCorpus(str(パス)) as コーパス:
+        # When: 合法手を求める
+        合法手リスト = list(コーパス.iter_legal_moves_masks())
+
+        # Then: 盤面オブジェクトを作って求めた値と一致する
+        for i, 合法手 in enumerate(合法手リスト):
+            盤面, 手番 = コーパス.board(i, CompactBoard)
+            assert 合法手 == GameRules(盤面).legal_moves_mask(手番)
+
+
+def test_大きさが17バイトの倍数でないファイルはエラーになる(tmp_path):
+    """
+    途中で切れたファイルを開くと ValueError
+    """
+    # Given: 1局面 + 3バイトのファイル
+    パス = tmp_path / 'broken.bin'
+    パス.write_bytes(encode_record(0, 0, 'B') + b'abc')
+
+    # When/Then: 開くと ValueError
+    with pytest.raises(ValueError):
+        PositionCorpus(str(パス))
+
+
+def test_空のファイルは0局面として開ける(tmp_path):
+    パス = tmp_path / 'empty.bin'
+    パス.write_bytes(b'')
+
+    with PositionCorpus(str(パス)) as コーパス:
+        assert len(コーパス) == 0
+        assert list(コーパス.iter_masks()) == []
+
+
+def test_numpyの構造化配列として列を参照できる(tmp_path):
+    """
+    as_numpy() は black / white / player の列を持つ memmap を返す
+    """
+    np = pytest.importorskip("numpy")
+
+    # Given: 20局面のファイル
+    パス = tmp_path / 'positions.bin'
+    局面リスト = _局面ファイルを作る(パス, 20, 18)
+
+    with PositionCorpus(str(パス)) as コーパス:
+        # When: numpy の配列として参照する
+        配列 = コーパス.as_numpy()
+
+        # Then: 各列が局面と一致する
+        assert 配列.shape == (20,)
+        assert 配列.dtype.itemsize == 17
+        assert [int(x) for x in 配列['black']] == [黒 for 黒, _, _ in 局面リスト]
+        assert [int(x) for x in 配列['white']] == [白 for _, 白, _ in 局面リスト]
+        assert 配列['player'].tolist() == [手番.encode() for _, _, 手番 in 局面リスト]
+        del 配列
@@ -140,3 +140,35 @@ BBBBBBBB
 W
 """
     assert captured.out == 期待する出力
+
+
+def test_statsを付けると計測値をJSONで標準エラー出力に書き込む(capsys):
+    """
+    --stats を付けると、標準出力は通常と同じで、
+    調べたマスの数とフェーズごとの経過時間が JSON で標準エラー出力に書き込まれる。
+    """
+    import json
+
+    # Given: 標準入力に初期配置と黒番が設定されている
+    入力データ = """........
+........
+........
+...WB...
+...BW...
+........
+........
+........
+B"""
+    reversi_module = load_reversi_module()
+
+    # When: --stats を付けて実行
+    with patch('sys.stdin', StringIO(入力データ)):
+        reversi_module.main(['--stats'])
+
+    # Then: 標準出力は通常の出力、標準エラー出力は計測値の JSON
+    captured = capsys.readouterr()
+    assert captured.out.splitlines()[2] == "...0...."
+    統計 = json.loads(captured.err)
+    assert 統計['legal_moves'] == 4
+    assert 統計['counters']['squares_examined'] == 64
+    assert list(統計['phases_ms']) == ['parse', 'compute', 'render']
@@ -0,0 +1,110 @@
+"""
+selfplay.py のテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、自己対局による局面生成が提供すべき振る舞いを表現する。
+"""
+
+import io as _stdlib_io
+import os
+import random
+import sys
+
+# plan_driven ディレクトリをインポートできるようにパスを追加
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+import selfplay
+from domain import bitboard
+from binary_format import BinaryReader
+from input_reader import InputReader
+
+BytesIO = _stdlib_io.BytesIO
+StringIO = _stdlib_io.StringIO
+
+
+def _石の数(黒, 白):
+    return bin(黒 | 白).count('1')
+
+
+def test_1局の局面は初期配置から始まり着手かパスでつながる():
+    """
+    各局面の次の局面は、合法手を1つ打った局面か、パスして手番だけ替わった局面
+    """
+    # Given/When: 1局対局する
+    局面リスト = list(selfplay.iter_game_positions(random.Random(20)))
+
+    # Then: 初期配置の黒番から始まる
+    assert 局面リスト[0] == (selfplay.INITIAL_BLACK, selfplay.INITIAL_WHITE, 'B')
+    for (黒, 白, 手番), (次の黒, 次の白, 次の手番) in zip(局面リスト, 局面リスト[1:]):
+        # Then: 手番は毎回替わる
+        assert 次の手番 != 手番
+        自分, 相手 = (黒, 白) if 手番 == 'B' else (白, 黒)
+        合法手 = bitboard.legal_moves_mask(自分, 相手)
+        if 合法手:
+            # 着手: 石が1つ増え、置いたマスは合法手
+            assert _石の数(次の黒, 次の白) == _石の数(黒, 白) + 1
+            置いたマス = (次の黒 | 次の白) & ~(黒 | 白)
+            assert 置いたマス & 合法手
+        else:
+            # パス: 盤面はそのまま
+            assert (次の黒, 次の白) == (黒, 白)
+
+
+
+def test_同じ種なら同じ出力でワーカー数によらない():
+    """
+    チャンクの種は (seed, チャンク番号) で決まるので、ワーカー数を変えても出力は同じ
+    """
+    # Given/When: 1プロセスと2プロセスで同じ設定の自己対局
+    出力1 = BytesIO()
+    出力2 = BytesIO()
+    統計1 = selfplay.run_selfplay(出力1, games=30, workers=1, chunk_games=7,
+                                fmt='binary', seed=5)
+    統計2 = selfplay.run_selfplay(出力2, games=30, workers=2, chunk_games=7,
+                                fmt='binary', seed=5)
+
+    # Then: 同じバイト列で、局面数も一致する
+    assert 出力1.getvalue() == 出力2.getvalue()
+    assert 統計1.games == 30
+    assert 統計1.positions == 統計2.positions == len(出力1.getvalue()) // 17
+    assert 統計1.games_per_sec > 0
+
+
+def test_テキスト形式とバイナリ形式で同じ局面を書き出す():
+    """
+    text は InputReader で、binary は BinaryReader で読める同じ局面の並び
+    """
+    # Given/When: 同じ設定で両方の形式に書き出す
+    テキスト = BytesIO()
+    バイナリ = BytesIO()
+    selfplay.run_selfplay(テキスト, games=5, workers=1, fmt='text', seed=1)
+    selfplay.run_selfplay(バイナリ, games=5, workers=1, fmt='binary', seed=1)
+
+    # Then: 読み込んだ盤面と手番が一致する
+    テキストの局面 = [
+        (盤面.to_grid(), 手番)
+        for 盤面, 手番 in InputReader().iter_from_stream(StringIO(テキスト.getvalue().decode()))
+    ]
+    バイナリの局面 = [
+        (盤面.to_grid(), 手番)
+        for 盤面, 手番 in BinaryReader().iter_from_stream(BytesIO(バイナリ.getvalue()))
+    ]
+    assert テキストの局面 == バイナリの局面
+    assert len(テキストの局面) > 5 * 30
+
+
+def test_重み付きの方策は角を好む():
+    """
+    角と角の隣が打てるとき、weighted は角を選ぶことが多い
+    """
+    # Given: (0, 0) と (1, 1) が合法手
+    合法手 = (1 << 0) | (1 << 9)
+    乱数 = random.Random(0)
+
+    # When: 1000回選ぶ
+    選んだ = [selfplay.choose_weighted(合法手, 乱数) for _ in range(1000)]
+
+    # Then: 角が大半で、合法手以外は選ばない
+    assert set(選んだ) <= {0, 9}
+    assert 選んだ.count(0) > 900
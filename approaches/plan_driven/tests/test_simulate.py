@@ -0,0 +1,55 @@
+"""
+simulate.py のテスト
+
+振る舞い駆動でテストを記述。
+テスト名は日本語で、対局シミュレータが提供すべき振る舞いを表現する。
+"""
+
+import os
+import sys
+
+import pytest
+
+# plan_driven ディレクトリをインポートできるようにパスを追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import simulate
+
+
+def test_勝敗の合計は対局数になり同じ種ならワーカー数によらない():
+    """
+    集計は対局数と矛盾せず、チャンクの種は (seed, チャンク番号) で決まる
+    """
+    # Given/When: 1プロセスと2プロセスで同じ設定の対局
+    統計1 = simulate.run_simulation(30, 'random', 'corner', workers=1, chunk_games=7, seed=3)
+    統計2 = simulate.run_simulation(30, 'random', 'corner', workers=2, chunk_games=7, seed=3)
+
+    # Then: 勝敗の合計は対局数で、時間以外の集計は同じ
+    assert 統計1.games == 30
+    assert 統計1.black_wins + 統計1.white_wins + 統計1.draws == 30
+    assert 統計1.black_discs + 統計1.white_discs == 4 * 30 + 統計1.plies
+    assert 統計1[:-1] == 統計2[:-1]
+    assert 統計1.games_per_sec > 0
+
+
+def test_不明な方策はエラーになる():
+    """
+    POLICIES にない方策を指定すると ValueError
+    """
+    with pytest.raises(ValueError):
+        simulate.run_simulation(1, 'unknown', 'random', workers=1)
+
+
+def test_コマンドラインから集計をJSONで出力できる(capsys):
+    """
+    --json で集計と games_per_sec を JSON で出力する
+    """
+    import json
+
+    # When: 3局を JSON で出力
+    simulate.main(['--games', '3', '--black', 'greedy', '--workers', '1', '--json'])
+
+    # Then: 対局数と games_per_sec が含まれる
+    出力 = json.loads(capsys.readouterr().out)
+    assert 出力['games'] == 3
+    assert 出力['games_per_sec'] > 0
@@ -0,0 +1,157 @@
+# move_cache.py
+# Zobrist ハッシュと LRU キャッシュによる合法手の再利用
+
+import random
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from reversi_core import find_legal_moves
+
+# Zobrist テーブルの乱数シード（同じシードなら同じハッシュ値になる）
+ZOBRIST_SEED = 20241018
+
+
+def make_zobrist_table(seed: int = ZOBRIST_SEED) -> Dict[str, List[int]]:
+    """
+    Zobrist ハッシュ用の乱数テーブルを作る。
+
+    Args:
+        seed: 乱数シード
+
+    Returns:
+        Dict[str, List[int]]: 'B' / 'W' ごとに、64マス分の64ビット乱数
+    """
+    rng = random.Random(seed)
+    return {
+        'B': [rng.getrandbits(64) for _ in range(64)],
+        'W': [rng.getrandbits(64) for _ in range(64)],
+    }
+
+
+# 既定のテーブル
+ZOBRIST_TABLE = make_zobrist_table()
+
+
+def zobrist_hash(grid: List[List[str]], table: Dict[str, List[int]] = ZOBRIST_TABLE) -> int:
+    """
+    盤面の Zobrist ハッシュ値を計算する。
+
+    コマのあるマスの乱数をすべて XOR したもの。
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+        table: make_zobrist_table で作ったテーブル
+
+    Returns:
+        int: 64ビットのハッシュ値
+    """
+    black = table['B']
+    white = table['W']
+    h = 0
+    index = 0
+    for row in grid:
+        for cell in row:
+            if cell == 'B':
+                h ^= black[index]
+            elif cell == 'W':
+                h ^= white[index]
+            index += 1
+    return h
+
+
+def toggle_stone(h: int, row: int, col: int, stone: str,
+                 table: Dict[str, List[int]] = ZOBRIST_TABLE) -> int:
+    """
+    1マスのコマを置いた（または取り除いた）後のハッシュ値を求める。
+
+    XOR なので、同じ呼び出しをもう一度行うと元に戻る。
+    コマを裏返すときは、元の色と新しい色の両方で呼び出す。
+
+    Args:
+        h: 現在のハッシュ値
+        row: 行（0〜7）
+        col: 列（0〜7）
+        stone: 'B' または 'W'
+        table: make_zobrist_table で作ったテーブル
+
+    Returns:
+        int: 更新後のハッシュ値
+    """
+    return h ^ table[stone][row * 8 + col]
+
+
+class LegalMoveCache:
+    """
+    (Zobrist ハッシュ値, 手番) をキーに合法手を保持する LRU キャッシュ。
+
+    最大件数を超えると、最も長く使われていない局面から捨てる。
+    64ビットのハッシュ値だけで局面を区別するため、異なる局面が
+    衝突する確率はごくわずか（約 2^-64）だが 0 ではない。
+    """
+
+    def __init__(self, maxsize: int = 4096, table: Optional[Dict[str, List[int]]] = None):
+        """
+        Args:
+            maxsize: 保持する局面の最大数（1以上）
+            table: Zobrist テーブル（省略時は既定のテーブル）
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize は1以上を指定してください")
+        self.maxsize = maxsize
+        self.table = table if table is not None else ZOBRIST_TABLE
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Tuple[int, str], Tuple[Tuple[int, int], ...]] = OrderedDict()
+
+    def find_legal_moves(self, grid: List[List[str]], player: str) -> List[Tuple[int, int]]:
+        """
+        合法手を返す。キャッシュにあればそれを、なければ計算して保持する。
+
+        Args:
+            grid: 盤面データ（8x8の2次元リスト）
+            player: 現在のプレイヤー（'B' または 'W'）
+
+        Returns:
+            List[Tuple[int, int]]: 合法手の座標リスト（reversi_core.find_legal_moves と同じ）
+        """
+        key = (zobrist_hash(grid, self.table), player)
+        entries = self._entries
+
+        moves = entries.get(key)
+        if moves is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return list(moves)
+
+        self.misses += 1
+        result = find_legal_moves(grid, player)
+        entries[key] = tuple(result)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        キャッシュの統計を返す。
+
+        Returns:
+            Dict[str, int]: hits / misses / evictions / size / maxsize
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """保持している局面と統計をすべて消す。"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -1,9 +1,15 @@
 # reversi.py
 # メインプログラム（入出力と統合）
 
-from typing import List, Tuple
+import argparse
+import json
+import sys
+from typing import Callable, Iterator, List, Optional, TextIO, Tuple
 from reversi_core import find_legal_moves
 
+# 1局面あたりの入力行数（盤面8行 + 手番1行）
+RECORD_LINES = 9
+
 
 def read_input() -> Tuple[List[List[str]], str]:
     """
@@ -25,14 +31,51 @@ def read_input() -> Tuple[List[List[str]], str]:
     return grid, player
 
 
-def write_output(grid: List[List[str]], legal_moves: List[Tuple[int, int]], player: str) -> None:
+def iter_records(stream: TextIO) -> Iterator[Tuple[List[List[str]], str]]:
     """
-    合法手をマークした盤面を標準出力に書き込む。
+    ストリームから9行ずつ局面を読み込み、1局面ずつ返す。
+
+    局面と局面の間の空行は読み飛ばす。
+    一度に保持するのは1局面分の行だけなので、入力の長さによらず
+    使用メモリは一定になる。
+
+    Args:
+        stream: 入力ストリーム
+
+    Yields:
+        Tuple[List[List[str]], str]: (盤面データ, 手番)
+
+    Raises:
+        ValueError: 入力の末尾で局面が9行に満たない場合
+    """
+    lines = []
+    for line in stream:
+        line = line.strip()
+
+        # 局面の区切りの空行は読み飛ばす
+        if not line and not lines:
+            continue
+
+        lines.append(line)
+        if len(lines) == RECORD_LINES:
+            yield [list(row) for row in lines[:8]], lines[8]
+            lines = []
+
+    if lines:
+        raise ValueError(f"入力の末尾の局面が{RECORD_LINES}行に満たない（{len(lines)}行）")
+
+
+def format_output(grid: List[List[str]], legal_moves: List[Tuple[int, int]], player: str) -> str:
+    """
+    合法手をマークした盤面を出力用の文字列にする。
 
     Args:
         grid: 盤面データ
         legal_moves: 合法手の座標リスト
         player: 手番
+
+    Returns:
+        str: 盤面8行と手番1行（各行末に改行）
     """
     # 盤面をコピー
     output_grid = [row[:] for row in grid]
@@ -41,10 +84,45 @@ def write_output(grid: List[List[str]], legal_moves: List[Tuple[int, int]], play
     for row, col in legal_moves:
         output_grid[row][col] = '0'
 
-    # 出力
-    for row in output_grid:
-        print(''.join(row))
-    print(player)
+    lines = [''.join(row) for row in output_grid]
+    lines.append(player)
+    return '\n'.join(lines) + '\n'
+
+
+def write_output(grid: List[List[str]], legal_moves: List[Tuple[int, int]], player: str) -> None:
+    """
+    合法手をマークした盤面を標準出力に書き込む。
+
+    Args:
+        grid: 盤面データ
+        legal_moves: 合法手の座標リスト
+        player: 手番
+    """
+    print(format_output(grid, legal_moves, player), end='')
+
+
+def run_batch(
+    input_stream: TextIO,
+    output_stream: TextIO,
+    solver: Callable[[List[List[str]], str], List[Tuple[int, int]]] = find_legal_moves,
+) -> int:
+    """
+    複数の局面を順に読み込み、1局面ごとに結果を書き込む。
+
+    Args:
+        input_stream: 9行ずつの局面が並んだ入力ストリーム
+        output_stream: 結果の出力先
+        solver: 合法手を求める関数（既定は reversi_core.find_legal_moves）
+
+    Returns:
+        int: 処理した局面の数
+    """
+    count = 0
+    for grid, player in iter_records(input_stream):
+        legal_moves = solver(grid, player)
+        output_stream.write(format_output(grid, legal_moves, player))
+        count += 1
+    return count
 
 
 def main():
@@ -61,5 +139,37 @@ def main():
     write_output(grid, legal_moves, player)
 
 
+def batch_main(argv: Optional[List[str]] = None):
+    """
+    バッチ処理：標準入力の全局面を1プロセスで処理する。
+
+    --cache N を指定すると、同じ局面の合法手を LRU キャッシュ（最大 N 局面）から返す。
+    キャッシュの統計は標準エラー出力に JSON で書き込む。
+    不明な引数、--batch のない --cache、1未満の --cache は、無視せずにエラーにする（終了コード 2）。
+    """
+    parser = argparse.ArgumentParser(description="9行ずつの局面を連続して処理する")
+    parser.add_argument('--batch', action='store_true', help="バッチモードで実行する")
+    parser.add_argument('--cache', type=int, default=None, metavar='N',
+                        help="合法手の LRU キャッシュの最大局面数（1以上、--batch と一緒に指定する）")
+    args = parser.parse_args(argv)
+    if not args.batch:
+        parser.error("--cache は --batch と一緒に指定してください")
+    if args.cache is not None and args.cache < 1:
+        parser.error(f"--cache は1以上を指定してください: {args.cache}")
+
+    if args.cache is not None:
+        from move_cache import LegalMoveCache
+        cache = LegalMoveCache(args.cache)
+        run_batch(sys.stdin, sys.stdout, cache.find_legal_moves)
+        sys.stdout.flush()
+        print(json.dumps(cache.stats()), file=sys.stderr)
+    else:
+        run_batch(sys.stdin, sys.stdout)
+
+
 if __name__ == "__main__":
-    main()
+    # 引数があれば（--batch / --cache、または不明な引数）batch_main で解析する
+    if sys.argv[1:]:
+        batch_main(sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,139 @@
+# reversi_client.py
+# reversi_server.py に問い合わせる軽量クライアント
+#
+# 起動のたびに読み込むモジュールを減らすため、組み込みの _socket と os / sys だけを使う
+# （socket・tempfile・reversi.py・typing はそれぞれ読み込みに数ms〜数十msかかる）。
+
+import _socket
+import os
+import sys
+
+# 既定のソケットファイル（reversi_server.py と共通）
+DEFAULT_SOCKET_PATH = os.path.join(os.environ.get('TMPDIR', '/tmp'), 'reversi.sock')
+
+# 1局面あたりの行数（盤面8行 + 手番1行）
+RECORD_LINES = 9
+
+
+class ReversiClient:
+    """
+    reversi_server.py への1本の接続。
+
+    1つの接続で何局面でも問い合わせできるので、
+    続けて問い合わせる場合は接続を使い回すと往復の時間だけで済む。
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        """
+        Args:
+            socket_path: サーバのソケットファイルのパス
+        """
+        self._sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+        self._sock.connect(socket_path)
+        self._buffer = b''
+
+    def query(self, lines: list) -> str:
+        """
+        1局面を問い合わせる。
+
+        Args:
+            lines: 盤面8行と手番1行（改行なしの文字列のリスト）。
+                9行に満たない場合は送信後に書き込み側を閉じ、サーバの応答（ERROR）を待つ
+
+        Returns:
+            str: 合法手をマークした盤面8行と手番1行（reversi.py の出力と同じ）
+
+        Raises:
+            RuntimeError: 入力に ASCII 以外の文字がある場合、サーバが入力の誤りを返した場合、
+                または接続が切れた場合
+        """
+        try:
+            request = ('\n'.join(lines) + '\n').encode('ascii')
+        except UnicodeEncodeError as e:
+            text = e.object[e.start:e.end]
+            raise RuntimeError(f"ERROR 入力に ASCII 以外の文字があります: {text!r}") from None
+        self._sock.sendall(request)
+        if len(lines) < RECORD_LINES:
+            self._sock.shutdown(_socket.SHUT_WR)
+
+        response = []
+        for _ in range(RECORD_LINES):
+            line = self._readline()
+            if not response and line.startswith('ERROR'):
+                raise RuntimeError(line.rstrip('\n'))
+            response.append(line)
+        return ''.join(response)
+
+    def _readline(self) -> str:
+        """
+        サーバの応答を1行（改行を含む）読み込む。
+
+        Raises:
+            RuntimeError: 1行を読み終える前に接続が切れた場合
+        """
+        while b'\n' not in self._buffer:
+            chunk = self._sock.recv(4096)
+            if not chunk:
+                raise RuntimeError("サーバとの接続が切れました")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return line.decode('utf-8') + '\n'
+
+    def close(self) -> None:
+        """接続を閉じる。"""
+        self._sock.close()
+
+    def __enter__(self) -> 'ReversiClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def iter_input_records(stream):
+    """
+    ストリームを9行ずつの局面に区切る（局面の間の空行は読み飛ばす）。
+
+    形式の検査はサーバで行う。
+
+    Args:
+        stream: 入力ストリーム
+
+    Yields:
+        List[str]: 1局面分の9行
+    """
+    lines = []
+    for line in stream:
+        line = line.strip()
+        if not line and not lines:
+            continue
+        lines.append(line)
+        if len(lines) == RECORD_LINES:
+            yield lines
+            lines = []
+    if lines:
+        yield lines
+
+
+def main(argv=None) -> int:
+    """
+    標準入力の局面をサーバに問い合わせ、結果を標準出力に書き込む。
+
+    使い方: python reversi_client.py [ソケットファイルのパス] < input.txt
+    出力は reversi.py（複数局面なら reversi.py --batch）と同じ。
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    socket_path = argv[0] if argv else DEFAULT_SOCKET_PATH
+
+    try:
+        with ReversiClient(socket_path) as client:
+            for lines in iter_input_records(sys.stdin):
+                sys.stdout.write(client.query(lines))
+    except (OSError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
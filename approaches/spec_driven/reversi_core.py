@@ -75,3 +75,251 @@ def find_legal_moves(grid: List[List[str]], player: str) -> List[Tuple[int, int]
                 legal_moves.append((row, col))
 
     return legal_moves
+
+
+# 8方向の移動量（mobility / mobility_both / has_any_legal_move / apply_move で使う）
+_DIRECTIONS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1),
+)
+
+
+def mobility(grid: List[List[str]], player: str) -> Tuple[int, int]:
+    """
+    指定されたプレイヤーの合法手の数と、合法手のビットマスクを求める。
+
+    合法手のリストや座標のタプルを作らないので、数だけが必要な評価に使う。
+    ビット番号は row * 8 + col（(0, 0) が最下位ビット）。
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+        player: 現在のプレイヤー（'B' または 'W'）
+
+    Returns:
+        Tuple[int, int]: (合法手の数, 合法手のビットマスク)
+    """
+    opponent = 'W' if player == 'B' else 'B'
+    count = 0
+    mask = 0
+
+    for row in range(8):
+        line = grid[row]
+        for col in range(8):
+            if line[col] != '.':
+                continue
+            for dr, dc in _DIRECTIONS:
+                r, c = row + dr, col + dc
+                # 隣が相手のコマでなければこの方向はダメ
+                if not (0 <= r < 8 and 0 <= c < 8) or grid[r][c] != opponent:
+                    continue
+                r += dr
+                c += dc
+                while 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == opponent:
+                    r += dr
+                    c += dc
+                if 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == player:
+                    count += 1
+                    mask |= 1 << (row * 8 + col)
+                    break
+
+    return count, mask
+
+
+def mobility_both(grid: List[List[str]]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    黒と白の合法手の数とビットマスクを、盤面を1回走査するだけで求める。
+
+    空マスから各方向に進み、隣のコマと同じ色が続いた先に反対の色のコマがあれば、
+    その反対の色のプレイヤーの合法手になる（1回の走査で両者を判定できる）。
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+
+    Returns:
+        Tuple[Tuple[int, int], Tuple[int, int]]:
+            ((黒の合法手の数, 黒のビットマスク), (白の合法手の数, 白のビットマスク))
+    """
+    black_count = white_count = 0
+    black_mask = white_mask = 0
+
+    for row in range(8):
+        line = grid[row]
+        for col in range(8):
+            if line[col] != '.':
+                continue
+            black_found = white_found = False
+            for dr, dc in _DIRECTIONS:
+                r, c = row + dr, col + dc
+                if not (0 <= r < 8 and 0 <= c < 8):
+                    continue
+                first = grid[r][c]
+                if first == '.':
+                    continue
+                r += dr
+                c += dc
+                while 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == first:
+                    r += dr
+                    c += dc
+                if not (0 <= r < 8 and 0 <= c < 8):
+                    continue
+                last = grid[r][c]
+                # 隣と反対の色のコマで終われば、その色のプレイヤーが挟める
+                if last == 'B' and first == 'W':
+                    black_found = True
+                elif last == 'W' and first == 'B':
+                    white_found = True
+                else:
+                    continue
+                if black_found and white_found:
+                    break
+            bit = 1 << (row * 8 + col)
+            if black_found:
+                black_count += 1
+                black_mask |= bit
+            if white_found:
+                white_count += 1
+                white_mask |= bit
+
+    return (black_count, black_mask), (white_count, white_mask)
+
+
+# 空マスがこれより多い局面では、相手のコマの周りの空マス（フロンティア）から調べる
+_FRONTIER_PROBE_EMPTIES = 24
+
+
+def has_any_legal_move(grid: List[List[str]], player: str) -> bool:
+    """
+    指定されたプレイヤーに合法手が1つでもあるかを判定する。
+
+    合法手は必ず相手のコマに隣接する空マス（フロンティア）なので、そこだけを調べ、
+    最初に見つかった時点で打ち切る。パスの判定に使う。
+
+    - 空マスが多い局面（序盤〜中盤）: 相手のコマを起点に、その後ろが空マスである方向だけ
+      相手のコマの先をたどる（調べるのはフロンティアのマスだけになる）
+    - 空マスが少ない局面（終盤）: 空マスを起点に、隣が相手のコマである方向だけたどる
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+        player: 現在のプレイヤー（'B' または 'W'）
+
+    Returns:
+        bool: 合法手があればTrue、なければFalse（パス）
+    """
+    opponent = 'W' if player == 'B' else 'B'
+    empties = 0
+    for line in grid:
+        empties += line.count('.')
+
+    if empties > _FRONTIER_PROBE_EMPTIES:
+        for row in range(8):
+            line = grid[row]
+            for col in range(8):
+                if line[col] != opponent:
+                    continue
+                for dr, dc in _DIRECTIONS:
+                    # 反対側の隣が空マスなら、そこに置いてこの方向に挟めるか
+                    r, c = row - dr, col - dc
+                    if not (0 <= r < 8 and 0 <= c < 8) or grid[r][c] != '.':
+                        continue
+                    r, c = row + dr, col + dc
+                    while 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == opponent:
+                        r += dr
+                        c += dc
+                    if 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == player:
+                        return True
+        return False
+
+    for row in range(8):
+        line = grid[row]
+        for col in range(8):
+            if line[col] != '.':
+                continue
+            for dr, dc in _DIRECTIONS:
+                r, c = row + dr, col + dc
+                if not (0 <= r < 8 and 0 <= c < 8) or grid[r][c] != opponent:
+                    continue
+                r += dr
+                c += dc
+                while 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == opponent:
+                    r += dr
+                    c += dc
+                if 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == player:
+                    return True
+    return False
+
+
+def is_game_over(grid: List[List[str]]) -> bool:
+    """
+    両者とも合法手がない（終局）かを判定する。
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+
+    Returns:
+        bool: 終局ならTrue
+    """
+    return not has_any_legal_move(grid, 'B') and not has_any_legal_move(grid, 'W')
+
+
+def apply_move(grid: List[List[str]], row: int, col: int, player: str) -> List[Tuple[int, int]]:
+    """
+    指定された位置にコマを置き、挟んだ相手のコマをひっくり返す（盤面をその場で変更する）。
+
+    探索で1手ごとに盤面をコピーしないために使う。undo_move で元に戻せる。
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+        row: 置く位置の行（0〜7）
+        col: 置く位置の列（0〜7）
+        player: 現在のプレイヤー（'B' または 'W'）
+
+    Returns:
+        List[Tuple[int, int]]: ひっくり返したコマの座標リスト
+
+    Raises:
+        ValueError: 合法手でない場合（盤面は変更しない）
+    """
+    if not (0 <= row < 8 and 0 <= col < 8) or grid[row][col] != '.':
+        raise ValueError(f"({row}, {col}) は {player} の合法手ではありません")
+
+    opponent = 'W' if player == 'B' else 'B'
+    flipped = []
+    for dr, dc in _DIRECTIONS:
+        r, c = row + dr, col + dc
+        start = len(flipped)
+        while 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == opponent:
+            flipped.append((r, c))
+            r += dr
+            c += dc
+        # 自分のコマで終わらなければ、この方向のコマは返せない
+        if not (0 <= r < 8 and 0 <= c < 8) or grid[r][c] != player:
+            del flipped[start:]
+
+    if not flipped:
+        raise ValueError(f"({row}, {col}) は {player} の合法手ではありません")
+
+    grid[row][col] = player
+    for r, c in flipped:
+        grid[r][c] = player
+    return flipped
+
+
+def undo_move(grid: List[List[str]], row: int, col: int, player: str,
+              flipped: List[Tuple[int, int]]) -> None:
+    """
+    apply_move を取り消す（盤面をその場で変更する）。
+
+    手は適用した順と逆の順に取り消すこと。
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+        row: 置いた位置の行（0〜7）
+        col: 置いた位置の列（0〜7）
+        player: 置いたプレイヤー（'B' または 'W'）
+        flipped: apply_move が返した、ひっくり返したコマの座標リスト
+    """
+    opponent = 'W' if player == 'B' else 'B'
+    grid[row][col] = '.'
+    for r, c in flipped:
+        grid[r][c] = opponent
@@ -0,0 +1,199 @@
+# reversi_server.py
+# Unix ドメインソケットで待ち受ける常駐サーバ
+
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from typing import Callable, List, Optional, Tuple
+from reversi import format_output, iter_records
+from reversi_client import DEFAULT_SOCKET_PATH
+from reversi_core import find_legal_moves
+
+# 入力に誤りがあったときの応答の先頭（この1行を返して接続を閉じる）
+ERROR_PREFIX = 'ERROR'
+
+Solver = Callable[[List[List[str]], str], List[Tuple[int, int]]]
+
+
+def validate_record(grid: List[List[str]], player: str) -> None:
+    """
+    1局面分の入力が正しい形式か確かめる。
+
+    Args:
+        grid: 盤面データ
+        player: 手番
+
+    Raises:
+        ValueError: 盤面が8x8でない、'.' / 'B' / 'W' 以外の文字がある、手番が 'B' / 'W' でない場合
+    """
+    for row in grid:
+        if len(row) != 8:
+            raise ValueError(f"盤面の行は8文字で指定してください: {''.join(row)!r}")
+        for cell in row:
+            if cell not in '.BW':
+                raise ValueError(f"盤面に使えない文字があります: {cell!r}")
+    if player not in ('B', 'W'):
+        raise ValueError(f"手番は 'B' または 'W' で指定してください: {player!r}")
+
+
+class ReversiRequestHandler(socketserver.StreamRequestHandler):
+    """
+    1接続分の要求を処理する。
+
+    接続が閉じられるまで、9行の局面を受け取るたびに
+    reversi.py と同じ形式の9行を返す（1接続で何局面でも問い合わせできる）。
+    入力に誤りがあれば 'ERROR <理由>' の1行を返して接続を閉じる。
+    """
+
+    def handle(self) -> None:
+        lines = io.TextIOWrapper(self.rfile, encoding='ascii', errors='replace', newline='\n')
+        solver = self.server.solver
+        try:
+            for grid, player in iter_records(lines):
+                validate_record(grid, player)
+                self.wfile.write(format_output(grid, solver(grid, player), player).encode('ascii'))
+        except ValueError as e:
+            self.wfile.write(f"{ERROR_PREFIX} {e}\n".encode('utf-8'))
+        except (BrokenPipeError, ConnectionResetError):
+            # 応答を待たずに切断したクライアントは無視する
+            pass
+        finally:
+            lines.detach()
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    """
+    前回のサーバが残したソケットファイルを削除する。
+
+    ソケットファイルで、接続しても拒否される（待ち受けているサーバがない）場合だけ削除する。
+
+    Args:
+        socket_path: ソケットファイルのパス
+
+    Raises:
+        FileExistsError: ソケット以外のファイルがある場合、または別のサーバが待ち受けている場合
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} はソケットではないファイルです")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except ConnectionRefusedError:
+        os.unlink(socket_path)
+        return
+    except FileNotFoundError:
+        return
+    finally:
+        probe.close()
+    raise FileExistsError(f"{socket_path} では別のサーバが待ち受けています")
+
+
+class ReversiServer(socketserver.ThreadingUnixStreamServer):
+    """
+    reversi_core.find_legal_moves を常駐させる Unix ドメインソケットのサーバ。
+
+    接続ごとにスレッドを立てて処理する。起動時に前回のサーバのソケットファイルが
+    残っていれば削除してから待ち受け（remove_stale_socket）、server_close で
+    ソケットファイルを削除する。
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, solver: Solver = find_legal_moves):
+        """
+        Args:
+            socket_path: 待ち受けるソケットファイルのパス
+            solver: 合法手を求める関数（既定は reversi_core.find_legal_moves）
+
+        Raises:
+            FileExistsError: socket_path にソケット以外のファイルがある場合、
+                または別のサーバが待ち受けている場合
+        """
+        remove_stale_socket(socket_path)
+        self.socket_path = socket_path
+        self.solver = solver
+        super().__init__(socket_path, ReversiRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def locked(solver: Solver) -> Solver:
+    """
+    solver をロックで囲み、複数のスレッドから同時に呼ばれないようにする。
+
+    LegalMoveCache のようにスレッドセーフでない solver を、
+    接続ごとのスレッドで共有するために使う。
+
+    Args:
+        solver: 合法手を求める関数
+
+    Returns:
+        Solver: ロックを取ってから solver を呼ぶ関数
+    """
+    lock = threading.Lock()
+
+    def call(grid: List[List[str]], player: str) -> List[Tuple[int, int]]:
+        with lock:
+            return solver(grid, player)
+
+    return call
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    サーバを起動し、SIGINT / SIGTERM を受けるまで待ち受ける。
+
+    --cache N を指定すると、同じ局面の合法手を LRU キャッシュ（最大 N 局面）から返す。
+    終了時にキャッシュの統計を標準エラー出力に JSON で書き込む。
+    """
+    parser = argparse.ArgumentParser(description="Unix ドメインソケットで合法手の問い合わせを受け付ける")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH,
+                        help=f"ソケットファイルのパス（既定: {DEFAULT_SOCKET_PATH}）")
+    parser.add_argument('--cache', type=int, default=0, metavar='N',
+                        help="合法手の LRU キャッシュの最大局面数（0 なら使わない）")
+    args = parser.parse_args(argv)
+
+    cache = None
+    solver: Solver = find_legal_moves
+    if args.cache > 0:
+        from move_cache import LegalMoveCache
+        cache = LegalMoveCache(args.cache)
+        solver = locked(cache.find_legal_moves)
+
+    # SIGTERM でも SIGINT と同じように後始末をして終了する
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        server = ReversiServer(args.socket, solver)
+    except FileExistsError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    with server:
+        print(f"listening on {args.socket}", file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    if cache is not None:
+        print(json.dumps(cache.stats()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
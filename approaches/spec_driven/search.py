@@ -0,0 +1,362 @@
+# search.py
+# ネガマックス法（アルファベータ枝刈り・反復深化）による着手の探索
+
+import argparse
+import sys
+import time
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+from reversi_core import apply_move, find_legal_moves, mobility_both, undo_move
+
+Grid = List[List[str]]
+Move = Tuple[int, int]
+
+# 合法手の生成: (盤面, 手番) -> 合法手の座標リスト（reversi_core.find_legal_moves と同じ形）
+MoveGenerator = Callable[[Grid, str], List[Move]]
+
+# 評価関数: (盤面, 手番) -> 手番から見た評価値（大きいほど手番が有利）
+Evaluator = Callable[[Grid, str], int]
+
+# マスごとの重み（角を好み、角の隣を避ける）
+SQUARE_WEIGHTS = [
+    [100, -20, 10,  5,  5, 10, -20, 100],
+    [-20, -50, -2, -2, -2, -2, -50, -20],
+    [10,   -2,  1,  1,  1,  1,  -2,  10],
+    [5,    -2,  1,  0,  0,  1,  -2,   5],
+    [5,    -2,  1,  0,  0,  1,  -2,   5],
+    [10,   -2,  1,  1,  1,  1,  -2,  10],
+    [-20, -50, -2, -2, -2, -2, -50, -20],
+    [100, -20, 10,  5,  5, 10, -20, 100],
+]
+
+# 合法手の数の差1つあたりの評価値
+MOBILITY_WEIGHT = 10
+
+# 終局した局面のコマ数の差1つあたりの評価値（どの途中局面の評価値よりも大きくする）
+FINAL_SCORE_WEIGHT = 10000
+
+# 探索の評価値の上限（アルファベータの初期窓）
+INFINITY = 64 * FINAL_SCORE_WEIGHT + 1
+
+CORNERS = frozenset({(0, 0), (0, 7), (7, 0), (7, 7)})
+
+# 時間切れを調べる間隔（ノード数）。1ノードは約0.1ms（6,000〜10,000 nps）なので、
+# 約2msごとに時計を見る（時計を見る手間は1回 0.1µs 程度）
+_TIME_CHECK_INTERVAL = 16
+
+
+def evaluate(grid: Grid, player: str) -> int:
+    """
+    マスの重みと合法手の数の差で局面を評価する。
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+        player: 評価する側のプレイヤー（'B' または 'W'）
+
+    Returns:
+        int: player から見た評価値
+    """
+    opponent = 'W' if player == 'B' else 'B'
+    score = 0
+    for line, weights in zip(grid, SQUARE_WEIGHTS):
+        for cell, weight in zip(line, weights):
+            if cell == player:
+                score += weight
+            elif cell == opponent:
+                score -= weight
+
+    (black_count, _), (white_count, _) = mobility_both(grid)
+    if player == 'B':
+        score += (black_count - white_count) * MOBILITY_WEIGHT
+    else:
+        score += (white_count - black_count) * MOBILITY_WEIGHT
+    return score
+
+
+def final_score(grid: Grid, player: str) -> int:
+    """
+    終局した局面を、コマ数の差で評価する。
+
+    Args:
+        grid: 盤面データ（8x8の2次元リスト）
+        player: 評価する側のプレイヤー（'B' または 'W'）
+
+    Returns:
+        int: player から見たコマ数の差 × FINAL_SCORE_WEIGHT
+    """
+    opponent = 'W' if player == 'B' else 'B'
+    diff = 0
+    for line in grid:
+        diff += line.count(player) - line.count(opponent)
+    return diff * FINAL_SCORE_WEIGHT
+
+
+class SearchResult(NamedTuple):
+    """1回の探索（1つの深さ）の結果。"""
+
+    move: Optional[Move]
+    score: int
+    depth: int
+    nodes: int
+    seconds: float
+
+    @property
+    def nps(self) -> float:
+        """1秒あたりの探索ノード数。"""
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+
+class _SearchTimeout(Exception):
+    """探索の制限時間を過ぎたことを知らせる（探索の内部だけで使う）。"""
+
+
+class Searcher:
+    """
+    ネガマックス法（アルファベータ枝刈り）で最善手を探索する。
+
+    探索中に呼ぶのは合法手の生成と評価関数だけなので、
+    どちらも引数で速い実装に差し替えられる。
+    盤面は apply_move / undo_move でその場で変更し、コピーしない。
+    """
+
+    def __init__(self, move_generator: MoveGenerator = find_legal_moves,
+                 evaluator: Evaluator = evaluate, ordering: bool = True):
+        """
+        Args:
+            move_generator: 合法手の生成（既定: reversi_core.find_legal_moves）
+            evaluator: 評価関数（既定: evaluate）
+            ordering: 角と相手の合法手の数で手を並べ替えるか
+        """
+        self.move_generator = move_generator
+        self.evaluator = evaluator
+        self.ordering = ordering
+        self.nodes = 0
+        self._deadline: Optional[float] = None
+
+    def search(self, grid: Grid, player: str, max_depth: int,
+               time_limit: Optional[float] = None) -> SearchResult:
+        """
+        反復深化で最善手を探索し、最後に読み切った深さの結果を返す。
+
+        Args:
+            grid: 盤面データ（探索中は変更するが、終了時には元に戻る）
+            player: 手番（'B' または 'W'）
+            max_depth: 探索する最大の深さ（1以上）
+            time_limit: 制限時間（秒）。省略時は max_depth まで読む
+
+        Returns:
+            SearchResult: 合法手がなければ move は None
+
+        Raises:
+            ValueError: max_depth が1未満の場合
+        """
+        result = None
+        for result in self.iterative_deepening(grid, player, max_depth, time_limit):
+            pass
+        return result
+
+    def iterative_deepening(self, grid: Grid, player: str, max_depth: int,
+                            time_limit: Optional[float] = None) -> Iterator[SearchResult]:
+        """
+        深さ1から max_depth まで順に探索し、深さごとの結果を返す。
+
+        前の深さの最善手を次の深さで最初に調べる。制限時間を過ぎたら、
+        その深さの探索を打ち切って終了する（深さ1は必ず読み切る）。
+
+        Args:
+            grid: 盤面データ（探索中は変更するが、終了時には元に戻る）
+            player: 手番（'B' または 'W'）
+            max_depth: 探索する最大の深さ（1以上）
+            time_limit: 制限時間（秒）
+
+        Yields:
+            SearchResult: 深さごとの結果（nodes / seconds はその深さまでの累計）
+
+        Raises:
+            ValueError: max_depth が1未満の場合
+        """
+        if max_depth < 1:
+            raise ValueError("max_depth は1以上を指定してください")
+        start = time.perf_counter()
+        self.nodes = 0
+        moves = self.move_generator(grid, player)
+        if not moves:
+            yield SearchResult(None, self._negamax(grid, player, max_depth, -INFINITY, INFINITY),
+                               max_depth, self.nodes, time.perf_counter() - start)
+            return
+
+        best_move = moves[0]
+        deadline = start + time_limit if time_limit is not None else None
+        for depth in range(1, max_depth + 1):
+            # 深さ1は必ず読み切るため、時間切れは深さ2から調べる
+            if depth > 1 and deadline is not None:
+                if time.perf_counter() >= deadline:
+                    return
+                self._deadline = deadline
+            try:
+                best_move, score = self._search_root(grid, player, depth, moves, best_move)
+            except _SearchTimeout:
+                return
+            finally:
+                self._deadline = None
+            yield SearchResult(best_move, score, depth, self.nodes, time.perf_counter() - start)
+
+    def _search_root(self, grid: Grid, player: str, depth: int,
+                     moves: List[Move], first: Move) -> Tuple[Move, int]:
+        """
+        ルートの各手を探索し、最善手とその評価値を返す。
+
+        Args:
+            grid: 盤面データ
+            player: 手番
+            depth: 探索する深さ
+            moves: ルートの合法手
+            first: 最初に調べる手（前の深さの最善手）
+
+        Returns:
+            Tuple[Move, int]: (最善手, 評価値)
+        """
+        opponent = 'W' if player == 'B' else 'B'
+        ordered = self._order_moves(grid, player, moves) if self.ordering else list(moves)
+        ordered.remove(first)
+        ordered.insert(0, first)
+
+        self.nodes += 1
+        alpha = -INFINITY
+        best_move = first
+        for row, col in ordered:
+            flipped = apply_move(grid, row, col, player)
+            try:
+                score = -self._negamax(grid, opponent, depth - 1, -INFINITY, -alpha)
+            finally:
+                undo_move(grid, row, col, player, flipped)
+            if score > alpha:
+                alpha = score
+                best_move = (row, col)
+        return best_move, alpha
+
+    def _negamax(self, grid: Grid, player: str, depth: int, alpha: int, beta: int) -> int:
+        """
+        ネガマックス法（アルファベータ枝刈り）で局面を評価する。
+
+        Args:
+            grid: 盤面データ
+            player: 手番
+            depth: 残りの深さ
+            alpha: 下限
+            beta: 上限
+
+        Returns:
+            int: player から見た評価値
+        """
+        self.nodes += 1
+        if self.nodes % _TIME_CHECK_INTERVAL == 0:
+            self._check_deadline()
+
+        if depth <= 0:
+            return self.evaluator(grid, player)
+
+        opponent = 'W' if player == 'B' else 'B'
+        moves = self.move_generator(grid, player)
+        if not moves:
+            # 相手も打てなければ終局、打てればパス（深さは減らさない）
+            if not self.move_generator(grid, opponent):
+                return final_score(grid, player)
+            return -self._negamax(grid, opponent, depth, -beta, -alpha)
+
+        # 子が葉になる深さでは並べ替えの手間の方が大きいので、並べ替えない
+        if self.ordering and depth > 1 and len(moves) > 1:
+            moves = self._order_moves(grid, player, moves)
+
+        for row, col in moves:
+            flipped = apply_move(grid, row, col, player)
+            try:
+                score = -self._negamax(grid, opponent, depth - 1, -beta, -alpha)
+            finally:
+                undo_move(grid, row, col, player, flipped)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def _check_deadline(self) -> None:
+        """
+        制限時間を過ぎていれば _SearchTimeout を送出する（制限時間がなければ何もしない）。
+        """
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+    def _order_moves(self, grid: Grid, player: str, moves: List[Move]) -> List[Move]:
+        """
+        角を最初に、それ以外は着手後の相手の合法手が少ない順に並べる。
+
+        Args:
+            grid: 盤面データ
+            player: 手番
+            moves: 合法手
+
+        Returns:
+            List[Move]: 並べ替えた合法手（新しいリスト）
+        """
+        opponent = 'W' if player == 'B' else 'B'
+        keyed = []
+        for row, col in moves:
+            if (row, col) in CORNERS:
+                keyed.append((-1, row, col))
+                continue
+            # 1手ごとに相手の合法手を生成するので、盤面を変更する前に時計を見る
+            self._check_deadline()
+            flipped = apply_move(grid, row, col, player)
+            keyed.append((len(self.move_generator(grid, opponent)), row, col))
+            undo_move(grid, row, col, player, flipped)
+        keyed.sort()
+        return [(row, col) for _, row, col in keyed]
+
+
+def format_result(result: SearchResult) -> str:
+    """
+    探索結果を1行の文字列にする。
+
+    Args:
+        result: 探索結果
+
+    Returns:
+        str: 深さ・評価値・最善手・ノード数・nps
+    """
+    move = 'pass' if result.move is None else f"{result.move[0]} {result.move[1]}"
+    return (f"depth {result.depth} score {result.score} move {move} "
+            f"nodes {result.nodes} time {result.seconds:.3f}s nps {result.nps:,.0f}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    メイン処理（標準入力の局面を探索し、深さごとの結果を出力する）。
+
+    標準入力に局面がない、または9行に満たない場合は
+    標準エラー出力に理由を書いて終了コード 2 で終了する。
+    """
+    from reversi import iter_records
+
+    parser = argparse.ArgumentParser(
+        description="標準入力の局面（盤面8行 + 手番1行）から最善手を探索する"
+    )
+    parser.add_argument('--depth', type=int, default=6, help="最大の深さ（既定: 6）")
+    parser.add_argument('--time', type=float, default=None,
+                        help="制限時間（秒）。省略時は --depth まで読む")
+    parser.add_argument('--no-ordering', action='store_true',
+                        help="手の並べ替えをしない（比較用）")
+    args = parser.parse_args(argv)
+
+    try:
+        grid, player = next(iter_records(sys.stdin))
+    except StopIteration:
+        parser.error("標準入力に局面がありません（盤面8行 + 手番1行を入力してください）")
+    except ValueError as e:
+        parser.error(str(e))
+    searcher = Searcher(ordering=not args.no_ordering)
+    for result in searcher.iterative_deepening(grid, player, args.depth, args.time):
+        print(format_result(result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# test_move_cache.py
+# Zobrist ハッシュと LRU キャッシュのテストコード
+
+import random
+
+from move_cache import LegalMoveCache, make_zobrist_table, toggle_stone, zobrist_hash
+from reversi_core import find_legal_moves
+
+
+def initial_grid():
+    return [
+        ['.', '.', '.', '.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.', '.', '.', '.'],
+        ['.', '.', '.', 'B', 'W', '.', '.', '.'],
+        ['.', '.', '.', 'W', 'B', '.', '.', '.'],
+        ['.', '.', '.', '.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.', '.', '.', '.']
+    ]
+
+
+# === Zobrist ハッシュ ===
+
+def test_同じ盤面は同じハッシュ値になる():
+    """
+    Given: 内容が同じ2つの盤面
+    When: ハッシュ値を計算する
+    Then: 同じ値になり、異なる盤面とは異なる値になる
+    """
+    assert zobrist_hash(initial_grid()) == zobrist_hash(initial_grid())
+
+    other = initial_grid()
+    other[2][4] = 'B'
+    assert zobrist_hash(other) != zobrist_hash(initial_grid())
+
+
+def test_空の盤面のハッシュ値は0になる():
+    """コマがなければ XOR する乱数がないので 0"""
+    assert zobrist_hash([['.'] * 8 for _ in range(8)]) == 0
+
+
+def test_差分更新で全体の再計算と同じハッシュ値になる():
+    """
+    Given: 初期配置のハッシュ値
+    When: (2,4) に黒を置き (3,4) を白から黒に裏返した差分だけ更新する
+    Then: 変更後の盤面から計算し直した値と一致する
+    """
+    grid = initial_grid()
+    h = zobrist_hash(grid)
+
+    h = toggle_stone(h, 2, 4, 'B')
+    h = toggle_stone(h, 3, 4, 'W')
+    h = toggle_stone(h, 3, 4, 'B')
+    grid[2][4] = 'B'
+    grid[3][4] = 'B'
+
+    assert h == zobrist_hash(grid)
+
+
+def test_シードが同じならテーブルも同じになる():
+    assert make_zobrist_table(1) == make_zobrist_table(1)
+    assert make_zobrist_table(1) != make_zobrist_table(2)
+
+
+# === LRU キャッシュ ===
+
+def test_同じ局面の2回目はキャッシュから返す():
+    """
+    Given: 空のキャッシュ
+    When: 同じ局面を2回問い合わせる
+    Then: 1回目はミス、2回目はヒットになり、結果は同じ
+    """
+    cache = LegalMoveCache(maxsize=8)
+
+    first = cache.find_legal_moves(initial_grid(), 'B')
+    second = cache.find_legal_moves(initial_grid(), 'B')
+
+    assert first == second == [(2, 4), (3, 5), (4, 2), (5, 3)]
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 8}
+
+
+def test_手番が違えば別の局面として扱う():
+    cache = LegalMoveCache(maxsize=8)
+
+    assert cache.find_legal_moves(initial_grid(), 'B') == [(2, 4), (3, 5), (4, 2), (5, 3)]
+    assert cache.find_legal_moves(initial_grid(), 'W') == [(2, 3), (3, 2), (4, 5), (5, 4)]
+    assert cache.misses == 2
+
+
+def test_最大件数を超えると最も古く使われた局面を捨てる():
+    """
+    Given: 最大2局面のキャッシュに A, B を入れ、A を再度参照した状態
+    When: 3つ目の局面 C を入れる
+    Then: 最も長く使われていない B が捨てられ、A は残る
+    """
+    cache = LegalMoveCache(maxsize=2)
+    grid_a = initial_grid()
+    grid_b = initial_grid()
+    grid_b[0][0] = 'W'
+    grid_c = initial_grid()
+    grid_c[7][7] = 'W'
+
+    cache.find_legal_moves(grid_a, 'B')
+    cache.find_legal_moves(grid_b, 'B')
+    cache.find_legal_moves(grid_a, 'B')
+    cache.find_legal_moves(grid_c, 'B')
+
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+    cache.find_legal_moves(grid_a, 'B')
+    assert cache.hits == 2
+    cache.find_legal_moves(grid_b, 'B')
+    assert cache.misses == 4
+
+
+def test_返したリストを変更してもキャッシュは変わらない():
+    cache = LegalMoveCache(maxsize=8)
+
+    cache.find_legal_moves(initial_grid(), 'B').clear()
+
+    assert cache.find_legal_moves(initial_grid(), 'B') == [(2, 4), (3, 5), (4, 2), (5, 3)]
+
+
+def test_ランダムな盤面でキャッシュなしと同じ結果を返す():
+    rng = random.Random(99)
+    grids = [[[rng.choice('..BW') for _ in range(8)] for _ in range(8)] for _ in range(50)]
+    cache = LegalMoveCache(maxsize=16)
+
+    for _ in range(3):
+        for grid in grids:
+            for player in 'BW':
+                assert cache.find_legal_moves(grid, player) == find_legal_moves(grid, player)
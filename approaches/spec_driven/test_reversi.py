@@ -448,3 +448,200 @@ B
 """
 
     assert output == expected
+
+
+# === バッチモード: 複数局面の連続処理 ===
+
+def test_バッチモードで複数の局面を順に処理する():
+    """
+    Given: 9行の局面が空行を挟んで2つ並んだ入力
+    When: run_batch で処理する
+    Then: 局面ごとの出力が入力の順に書き込まれる
+    """
+    from reversi import run_batch
+
+    input_data = """........
+........
+........
+...BW...
+...WB...
+........
+........
+........
+B
+
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+W
+"""
+
+    expected_output = """........
+........
+....0...
+...BW0..
+..0WB...
+...0....
+........
+........
+B
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+BBBBBBBB
+W
+"""
+
+    output = StringIO()
+    count = run_batch(StringIO(input_data), output)
+
+    assert count == 2
+    assert output.getvalue() == expected_output
+
+
+def test_バッチモードで末尾の局面が欠けている場合はエラーになる():
+    """9行に満たない局面が末尾に残った場合は ValueError"""
+    from reversi import run_batch
+
+    input_data = "........\n........\nB\n"
+
+    with pytest.raises(ValueError):
+        run_batch(StringIO(input_data), StringIO())
+
+
+@pytest.mark.parametrize('argv', [
+    ['--cache', '16'],
+    ['--batch', '--unknown'],
+    ['--batch', '--cache', '0'],
+    ['--batch', '--cache', '-5'],
+])
+def test_batchのないcacheや不明な引数はエラーになる(argv, capsys):
+    """
+    Given: --batch のない --cache、1未満の --cache、または不明な引数
+    When: batch_main で引数を解析する
+    Then: 無視せずに終了コード 2 で終了する
+    """
+    from reversi import batch_main
+
+    with pytest.raises(SystemExit) as exc_info:
+        batch_main(argv)
+
+    assert exc_info.value.code == 2
+    assert 'error' in capsys.readouterr().err
+
+
+def test_合法手の数とビットマスクを求める():
+    """
+    Given: 初期配置の盤面
+    When: mobility で黒番の合法手の数とビットマスクを求める
+    Then: 4手で、ビットは row * 8 + col に立つ
+    """
+    from reversi_core import find_legal_moves, mobility
+
+    grid = [['.'] * 8 for _ in range(8)]
+    grid[3][3], grid[3][4] = 'B', 'W'
+    grid[4][3], grid[4][4] = 'W', 'B'
+
+    count, mask = mobility(grid, 'B')
+
+    assert count == 4
+    assert mask == sum(1 << (r * 8 + c) for r, c in find_legal_moves(grid, 'B'))
+
+
+def test_黒と白の合法手の数とビットマスクを1回の走査で求める():
+    """mobility_both は黒と白それぞれの mobility と一致する"""
+    import random
+    from reversi_core import mobility, mobility_both
+
+    rng = random.Random(21)
+    for _ in range(300):
+        grid = [[rng.choice('..BW') for _ in range(8)] for _ in range(8)]
+        assert mobility_both(grid) == (mobility(grid, 'B'), mobility(grid, 'W'))
+
+
+def test_合法手の有無を列挙せずに判定する():
+    """
+    Given: 空マスの割合がさまざまなランダムな盤面
+    When: has_any_legal_move / is_game_over で判定する
+    Then: find_legal_moves で列挙した結果と一致する
+    """
+    import random
+    from reversi_core import find_legal_moves, has_any_legal_move, is_game_over
+
+    rng = random.Random(22)
+    for _ in range(500):
+        empty_ratio = rng.random()
+        grid = [['.' if rng.random() < empty_ratio else rng.choice('BW') for _ in range(8)]
+                for _ in range(8)]
+        black = bool(find_legal_moves(grid, 'B'))
+        white = bool(find_legal_moves(grid, 'W'))
+        assert has_any_legal_move(grid, 'B') == black
+        assert has_any_legal_move(grid, 'W') == white
+        assert is_game_over(grid) == (not black and not white)
+
+
+def test_片方だけ合法手がない場合はパスで終局ではない():
+    """
+    Given: 黒は置けるが白は置けない盤面
+    When: has_any_legal_move / is_game_over で判定する
+    Then: 白はパス、終局ではない
+    """
+    from reversi_core import has_any_legal_move, is_game_over
+
+    grid = [['.'] * 8 for _ in range(8)]
+    grid[0][0], grid[0][1] = 'B', 'W'
+
+    assert has_any_legal_move(grid, 'B')
+    assert not has_any_legal_move(grid, 'W')
+    assert not is_game_over(grid)
+
+
+def test_着手を適用してから取り消すと元の盤面に戻る():
+    """
+    Given: ランダムな盤面
+    When: 各合法手を apply_move で適用し、undo_move で取り消す
+    Then: 返したコマは全て手番の色になり、取り消すと元の盤面に戻る
+    """
+    import random
+    from reversi_core import apply_move, find_legal_moves, undo_move
+
+    rng = random.Random(24)
+    for _ in range(100):
+        grid = [[rng.choice('..BW') for _ in range(8)] for _ in range(8)]
+        original = [row[:] for row in grid]
+        for player in 'BW':
+            for row, col in find_legal_moves(grid, player):
+                flipped = apply_move(grid, row, col, player)
+                assert flipped
+                assert grid[row][col] == player
+                assert all(grid[r][c] == player for r, c in flipped)
+                undo_move(grid, row, col, player, flipped)
+                assert grid == original
+
+
+def test_合法手でない位置に着手するとエラーになり盤面は変わらない():
+    """
+    Given: 初期配置
+    When: 合法手でない位置・盤面外に apply_move する
+    Then: ValueError になり、盤面は変更されない
+    """
+    from reversi_core import apply_move
+
+    grid = [['.'] * 8 for _ in range(8)]
+    grid[3][3], grid[3][4] = 'B', 'W'
+    grid[4][3], grid[4][4] = 'W', 'B'
+    original = [row[:] for row in grid]
+
+    for row, col in ((0, 0), (3, 3), (8, 0)):
+        with pytest.raises(ValueError):
+            apply_move(grid, row, col, 'B')
+    assert grid == original
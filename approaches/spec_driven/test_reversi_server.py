@@ -0,0 +1,181 @@
+# test_reversi_server.py
+# 常駐サーバとクライアントのテストコード
+
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+from reversi import format_output
+from reversi_client import ReversiClient
+from reversi_core import find_legal_moves
+from reversi_server import ReversiServer, locked
+from move_cache import LegalMoveCache
+
+
+INITIAL_LINES = [
+    '........', '........', '........', '...WB...',
+    '...BW...', '........', '........', '........', 'B',
+]
+
+
+@pytest.fixture
+def socket_path():
+    # Unix ドメインソケットのパスは長さの上限（約100文字）があるため短いパスを使う
+    directory = tempfile.mkdtemp(prefix='rv')
+    yield os.path.join(directory, 's')
+    os.rmdir(directory)
+
+
+def start_server(socket_path, solver=find_legal_moves):
+    server = ReversiServer(socket_path, solver)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    return server
+
+
+def stop_server(server):
+    server.shutdown()
+    server.server_close()
+
+
+def test_サーバはreversi_pyと同じ形式で合法手を返す(socket_path):
+    """
+    Given: 起動したサーバ
+    When: 初期配置・黒番を問い合わせる
+    Then: reversi.py と同じ出力が返る
+    """
+    server = start_server(socket_path)
+    try:
+        with ReversiClient(socket_path) as client:
+            response = client.query(INITIAL_LINES)
+    finally:
+        stop_server(server)
+
+    grid = [list(line) for line in INITIAL_LINES[:8]]
+    assert response == format_output(grid, find_legal_moves(grid, 'B'), 'B')
+
+
+def test_1つの接続で続けて問い合わせできる(socket_path):
+    """
+    Given: 起動したサーバ
+    When: 同じ接続で黒番と白番を続けて問い合わせる
+    Then: それぞれの手番の結果が順に返る
+    """
+    server = start_server(socket_path)
+    try:
+        with ReversiClient(socket_path) as client:
+            black = client.query(INITIAL_LINES)
+            white = client.query(INITIAL_LINES[:8] + ['W'])
+    finally:
+        stop_server(server)
+
+    assert black.endswith('B\n')
+    assert white.endswith('W\n')
+    assert black.splitlines()[2] == '...0....'
+    assert white.splitlines()[2] == '....0...'
+
+
+def test_形式の誤った入力にはERRORを返す(socket_path):
+    """
+    Given: 起動したサーバ
+    When: 手番が 'B' / 'W' でない局面を問い合わせる
+    Then: クライアントは RuntimeError を送出し、サーバは他の接続を受け付け続ける
+    """
+    server = start_server(socket_path)
+    try:
+        with ReversiClient(socket_path) as client:
+            with pytest.raises(RuntimeError, match='ERROR'):
+                client.query(INITIAL_LINES[:8] + ['X'])
+        with ReversiClient(socket_path) as client:
+            assert client.query(INITIAL_LINES).endswith('B\n')
+    finally:
+        stop_server(server)
+
+
+def test_キャッシュを使うサーバは同じ局面をキャッシュから返す(socket_path):
+    """
+    Given: LegalMoveCache を使うサーバ
+    When: 同じ局面を2回問い合わせる
+    Then: 2回目はキャッシュから返る
+    """
+    cache = LegalMoveCache(16)
+    server = start_server(socket_path, locked(cache.find_legal_moves))
+    try:
+        with ReversiClient(socket_path) as client:
+            first = client.query(INITIAL_LINES)
+            second = client.query(INITIAL_LINES)
+    finally:
+        stop_server(server)
+
+    assert first == second
+    assert cache.stats()['hits'] == 1
+
+
+def test_サーバを閉じるとソケットファイルを削除する(socket_path):
+    server = start_server(socket_path)
+    assert os.path.exists(socket_path)
+
+    stop_server(server)
+
+    assert not os.path.exists(socket_path)
+
+
+def test_前回のサーバが残したソケットファイルは削除して起動する(socket_path):
+    """
+    Given: 待ち受けているサーバのないソケットファイル
+    When: サーバを起動する
+    Then: ソケットファイルを作り直して問い合わせに答える
+    """
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    server = start_server(socket_path)
+    try:
+        with ReversiClient(socket_path) as client:
+            assert client.query(INITIAL_LINES).endswith('B\n')
+    finally:
+        stop_server(server)
+
+
+def test_待ち受け中のサーバやソケット以外のファイルは削除しない(socket_path):
+    """
+    Given: 待ち受け中のサーバ、またはソケットではない通常のファイル
+    When: 同じパスで別のサーバを起動する
+    Then: FileExistsError になり、既存のサーバやファイルはそのまま残る
+    """
+    server = start_server(socket_path)
+    try:
+        with pytest.raises(FileExistsError):
+            ReversiServer(socket_path)
+        with ReversiClient(socket_path) as client:
+            assert client.query(INITIAL_LINES).endswith('B\n')
+    finally:
+        stop_server(server)
+
+    with open(socket_path, 'w') as f:
+        f.write('data')
+    try:
+        with pytest.raises(FileExistsError):
+            ReversiServer(socket_path)
+        with open(socket_path) as f:
+            assert f.read() == 'data'
+    finally:
+        os.unlink(socket_path)
+
+
+def test_ASCII以外の文字を含む入力はRuntimeErrorになる(socket_path):
+    """
+    Given: 起動したサーバ
+    When: ASCII 以外の文字を含む局面を問い合わせる
+    Then: クライアントは RuntimeError を送出する
+    """
+    server = start_server(socket_path)
+    try:
+        with ReversiClient(socket_path) as client:
+            with pytest.raises(RuntimeError, match='ASCII'):
+                client.query(INITIAL_LINES[:8] + ['黒'])
+    finally:
+        stop_server(server)
@@ -0,0 +1,216 @@
+# test_search.py
+# ネガマックス法による探索のテストコード
+
+import random
+import time
+from io import StringIO
+
+import pytest
+
+from move_cache import LegalMoveCache
+from reversi_core import apply_move, find_legal_moves
+from search import INFINITY, Searcher, evaluate, final_score, main
+
+
+def initial_grid():
+    grid = [['.'] * 8 for _ in range(8)]
+    grid[3][3], grid[3][4] = 'B', 'W'
+    grid[4][3], grid[4][4] = 'W', 'B'
+    return grid
+
+
+def random_position(rng, plies):
+    """初期配置から plies 手だけ乱数で進めた局面を返す。"""
+    grid = initial_grid()
+    player = 'B'
+    for _ in range(plies):
+        moves = find_legal_moves(grid, player)
+        opponent = 'W' if player == 'B' else 'B'
+        if moves:
+            apply_move(grid, *rng.choice(moves), player)
+        elif not find_legal_moves(grid, opponent):
+            break
+        player = opponent
+    return grid, player
+
+
+def plain_negamax(grid, player, depth):
+    """枝刈りも並べ替えもしないネガマックス法（比較用）。"""
+    if depth == 0:
+        return evaluate(grid, player)
+    opponent = 'W' if player == 'B' else 'B'
+    moves = find_legal_moves(grid, player)
+    if not moves:
+        if not find_legal_moves(grid, opponent):
+            return final_score(grid, player)
+        return -plain_negamax(grid, opponent, depth)
+    best = -INFINITY
+    for row, col in moves:
+        child = [line[:] for line in grid]
+        apply_move(child, row, col, player)
+        best = max(best, -plain_negamax(child, opponent, depth - 1))
+    return best
+
+
+def test_枝刈りしても全探索と同じ評価値になる():
+    """
+    Given: 序盤から終盤までのランダムな局面
+    When: アルファベータ枝刈りと並べ替えありで深さ3まで探索する
+    Then: 評価値は全探索と一致し、盤面は元に戻っている
+    """
+    rng = random.Random(24)
+    for plies in (4, 20, 40, 56):
+        grid, player = random_position(rng, plies)
+        original = [row[:] for row in grid]
+        for ordering in (True, False):
+            result = Searcher(ordering=ordering).search(grid, player, 3)
+            assert result.score == plain_negamax(grid, player, 3)
+            assert grid == original
+
+
+def test_反復深化で深さごとの結果とノード数を返す():
+    """
+    Given: 初期配置
+    When: 深さ4まで反復深化で探索する
+    Then: 深さ1〜4の結果が順に返り、ノード数は増え続け、nps が求まる
+    """
+    results = list(Searcher().iterative_deepening(initial_grid(), 'B', 4))
+
+    assert [r.depth for r in results] == [1, 2, 3, 4]
+    assert all(r.move in find_legal_moves(initial_grid(), 'B') for r in results)
+    assert [r.nodes for r in results] == sorted(r.nodes for r in results)
+    assert results[-1].nps > 0
+
+
+def test_角が取れる局面では角を選ぶ():
+    """
+    Given: 黒が (0,0) の角を取れる局面
+    When: 深さ1で探索する
+    Then: 角を選ぶ
+    """
+    grid = [['.'] * 8 for _ in range(8)]
+    grid[1][1] = 'W'
+    grid[2][2] = 'B'
+    grid[3][3] = 'W'
+    grid[3][4] = 'B'
+
+    assert Searcher().search(grid, 'B', 1).move == (0, 0)
+
+
+def test_合法手の生成と評価関数を差し替えられる():
+    """
+    Given: 呼び出し回数を数える合法手の生成と、LRU キャッシュ経由の合法手の生成
+    When: それぞれを渡して探索する
+    Then: 渡した関数が使われ、結果は既定の生成と同じ
+    """
+    calls = []
+
+    def counting_generator(grid, player):
+        calls.append(player)
+        return find_legal_moves(grid, player)
+
+    grid, player = random_position(random.Random(7), 20)
+    expected = Searcher().search(grid, player, 3)
+
+    counted = Searcher(move_generator=counting_generator).search(grid, player, 3)
+    assert (counted.move, counted.score, counted.nodes) == \
+        (expected.move, expected.score, expected.nodes)
+    assert calls
+    cache = LegalMoveCache(maxsize=10000)
+    cached = Searcher(move_generator=cache.find_legal_moves).search(grid, player, 3)
+    assert (cached.move, cached.score) == (expected.move, expected.score)
+    assert cache.hits > 0
+
+    # 評価関数を差し替える（コマの数の差だけで評価する）
+    def disc_difference(grid, player):
+        opponent = 'W' if player == 'B' else 'B'
+        return sum(line.count(player) - line.count(opponent) for line in grid)
+
+    result = Searcher(evaluator=disc_difference).search(initial_grid(), 'B', 1)
+    assert result.score == 3
+
+
+def test_制限時間を過ぎても深さ1の結果は返す():
+    """
+    Given: 初期配置
+    When: 制限時間0秒で深さ10まで探索する
+    Then: 深さ1だけ読み切った結果を返す
+    """
+    result = Searcher().search(initial_grid(), 'B', 10, time_limit=0.0)
+
+    assert result.depth == 1
+    assert result.move in find_legal_moves(initial_grid(), 'B')
+
+
+def test_制限時間を大きく超えずに探索を打ち切る():
+    """
+    Given: 初期配置
+    When: 制限時間0.3秒で深さ20まで探索する
+    Then: 制限時間の直後に、読み切った深さの結果を返す
+    """
+    start = time.perf_counter()
+    result = Searcher().search(initial_grid(), 'B', 20, time_limit=0.3)
+    elapsed = time.perf_counter() - start
+
+    assert 1 <= result.depth < 20
+    assert elapsed < 0.3 + 0.05
+
+
+def test_深さが1未満ならエラーになる():
+    """
+    Given: 初期配置
+    When: 深さ0で探索する
+    Then: ValueError
+    """
+    with pytest.raises(ValueError):
+        Searcher().search(initial_grid(), 'B', 0)
+
+
+def test_合法手がない局面ではパスの結果を返す():
+    """
+    Given: 黒に合法手がない局面
+    When: 探索する
+    Then: move は None
+    """
+    grid = [['.'] * 8 for _ in range(8)]
+    grid[0][0] = 'W'
+    grid[0][1] = 'B'
+
+    result = Searcher().search(grid, 'B', 2)
+
+    assert result.move is None
+
+
+def test_コマンドラインから深さごとの結果を出力する(monkeypatch, capsys):
+    """
+    Given: 標準入力に初期配置・黒番
+    When: --depth 2 で実行する
+    Then: 深さ1と2の行が出力される
+    """
+    text = ''.join(''.join(row) + '\n' for row in initial_grid()) + 'B\n'
+    monkeypatch.setattr('sys.stdin', StringIO(text))
+
+    main(['--depth', '2'])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[:2] for line in lines] == [['depth', '1'], ['depth', '2']]
+    assert all('nps' in line for line in lines)
+
+
+@pytest.mark.parametrize('text', ['', '\n\n', '........\nB\n'])
+def test_標準入力に局面がなければエラーで終了する(text, monkeypatch, capsys):
+    """
+    Given: 空の標準入力、または9行に満たない標準入力
+    When: コマンドラインから実行する
+    Then: トレースバックではなく、標準エラー出力に理由を書いて終了コード 2 で終了する
+    """
+    monkeypatch.setattr('sys.stdin', StringIO(text))
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(['--depth', '2'])
+
+    assert exc_info.value.code == 2
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'error' in captured.err
+
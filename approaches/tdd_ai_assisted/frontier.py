@@ -0,0 +1,320 @@
+"""
+石の周囲の空きマス（フロンティア）から合法手の候補を作るモジュール
+
+合法手は必ず相手の石に隣接する空きマスなので、石の色ごとに
+「その色の石に隣接する空きマス」を保持しておけば、盤面全体を走査せずに候補を作れる。
+計算量は盤面の面積ではなく石の数に比例するので、100x100 以上の大きなボードでも使える。
+"""
+
+from board import Board, Stone
+
+
+# 8方向の増分 (dx, dy)
+DIRECTIONS = (
+    (-1, 0),   # 左
+    (1, 0),    # 右
+    (0, -1),   # 上
+    (0, 1),    # 下
+    (-1, -1),  # 左上
+    (1, -1),   # 右上
+    (-1, 1),   # 左下
+    (1, 1),    # 右下
+)
+
+
+class Frontier:
+    """
+    石を座標の辞書で持ち、色ごとのフロンティアを差分更新する盤面
+
+    - 石: {(x, y): 石の文字} の辞書（空きマスは持たない）
+    - フロンティア: 色ごとの {(x, y): 隣接するその色の石の数} の辞書（空きマスのみ）
+
+    石を置く・裏返すときは周囲8マスだけを更新する。
+    """
+
+    def __init__(self, width: int, height: int):
+        """
+        空のボードを作る
+
+        Args:
+            width: ボードの幅
+            height: ボードの高さ
+
+        Raises:
+            ValueError: 幅か高さが1未満の場合
+        """
+        if width < 1 or height < 1:
+            raise ValueError("ボードの幅と高さは1以上にしてください。")
+        self._width = width
+        self._height = height
+        self._stones: dict[tuple[int, int], str] = {}
+        self._frontiers: dict[str, dict[tuple[int, int], int]] = {
+            Stone.BLACK.value: {},
+            Stone.WHITE.value: {},
+        }
+
+    @classmethod
+    def from_array(cls, board: list[list[str]]) -> "Frontier":
+        """
+        2次元配列から作る
+
+        Args:
+            board: ボードの2次元配列（'0' などの石以外の文字は空きマスとして扱う）
+
+        Returns:
+            Frontier
+        """
+        frontier = cls(len(board[0]) if board else 0, len(board))
+        stone_values = (Stone.BLACK.value, Stone.WHITE.value)
+        for y, row in enumerate(board):
+            for x, cell in enumerate(row):
+                if cell in stone_values:
+                    frontier.place(x, y, cell)
+        return frontier
+
+    @classmethod
+    def from_board(cls, board: Board) -> "Frontier":
+        """
+        Board から作る
+
+        Args:
+            board: ボードの盤面状態
+
+        Returns:
+            Frontier
+        """
+        return cls.from_array(Board.string_to_array(board.board))
+
+    @property
+    def width(self) -> int:
+        """ボードの幅"""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """ボードの高さ"""
+        return self._height
+
+    @property
+    def stone_count(self) -> int:
+        """ボード上の石の数"""
+        return len(self._stones)
+
+    def get(self, x: int, y: int) -> str:
+        """
+        マスの内容を取得する
+
+        Args:
+            x: X座標
+            y: Y座標
+
+        Returns:
+            石の文字、空きマスなら Board.EMPTY
+        """
+        return self._stones.get((x, y), Board.EMPTY)
+
+    def place(self, x: int, y: int, stone: str) -> None:
+        """
+        空きマスに石を置く（裏返しは行わない）
+
+        Args:
+            x: X座標
+            y: Y座標
+            stone: 石の文字
+
+        Raises:
+            ValueError: ボードの外、または空きマスでない場合
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise ValueError(f"({x}, {y}) はボードの外です。")
+        if (x, y) in self._stones:
+            raise ValueError(f"({x}, {y}) には既に石があります。")
+        self._stones[(x, y)] = stone
+        # 置いたマスはもう空きマスではない
+        for counts in self._frontiers.values():
+            counts.pop((x, y), None)
+        self._add_neighbors(x, y, stone, 1)
+
+    def flip(self, x: int, y: int) -> None:
+        """
+        石を裏返す
+
+        Args:
+            x: X座標
+            y: Y座標
+
+        Raises:
+            ValueError: 石がない場合
+        """
+        stone = self._stones.get((x, y))
+        if stone is None:
+            raise ValueError(f"({x}, {y}) には石がありません。")
+        opponent = Frontier._opponent(stone)
+        self._stones[(x, y)] = opponent
+        self._add_neighbors(x, y, stone, -1)
+        self._add_neighbors(x, y, opponent, 1)
+
+    def candidates(self, turn: Stone) -> set[tuple[int, int]]:
+        """
+        合法手の候補（相手の石に隣接する空きマス）を返す
+
+        Args:
+            turn: 現在の手番
+
+        Returns:
+            候補の座標 (x, y) の集合
+        """
+        return set(self._frontiers[Frontier._opponent(turn.value)])
+
+    def legal_moves(self, turn: Stone) -> list[tuple[int, int]]:
+        """
+        合法手を求める
+
+        Args:
+            turn: 現在の手番
+
+        Returns:
+            合法手の座標 (x, y) のリスト（上の行から、同じ行は左から）
+        """
+        my_stone = turn.value
+        opponent_stone = Frontier._opponent(my_stone)
+        moves = [
+            (x, y)
+            for x, y in self._frontiers[opponent_stone]
+            if any(self._flips_in_direction(x, y, dx, dy, my_stone, opponent_stone)
+                   for dx, dy in DIRECTIONS)
+        ]
+        moves.sort(key=lambda move: (move[1], move[0]))
+        return moves
+
+    def mobility(self, turn: Stone) -> tuple[int, int]:
+        """
+        合法手の数と合法手のビットマスクを求める（座標のリストを作らない）
+
+        Args:
+            turn: 現在の手番
+
+        Returns:
+            (合法手の数, 合法手のビットマスク)（ビット番号は y * 幅 + x）
+        """
+        my_stone = turn.value
+        opponent_stone = Frontier._opponent(my_stone)
+        width = self._width
+        count = 0
+        mask = 0
+        for x, y in self._frontiers[opponent_stone]:
+            for dx, dy in DIRECTIONS:
+                if self._flips_in_direction(x, y, dx, dy, my_stone, opponent_stone):
+                    count += 1
+                    mask |= 1 << (y * width + x)
+                    break
+        return count, mask
+
+    def play(self, x: int, y: int, turn: Stone) -> list[tuple[int, int]]:
+        """
+        石を置いて相手の石を裏返す
+
+        Args:
+            x: X座標
+            y: Y座標
+            turn: 現在の手番
+
+        Returns:
+            裏返した石の座標 (x, y) のリスト
+
+        Raises:
+            ValueError: 合法手でない場合
+        """
+        my_stone = turn.value
+        opponent_stone = Frontier._opponent(my_stone)
+        if (x, y) not in self._frontiers[opponent_stone]:
+            raise ValueError(f"({x}, {y}) は合法手ではありません。")
+        flipped = []
+        for dx, dy in DIRECTIONS:
+            line = self._flips_in_direction(x, y, dx, dy, my_stone, opponent_stone)
+            if line:
+                flipped.extend(line)
+        if not flipped:
+            raise ValueError(f"({x}, {y}) は合法手ではありません。")
+        self.place(x, y, my_stone)
+        for fx, fy in flipped:
+            self.flip(fx, fy)
+        return flipped
+
+    def to_array(self) -> list[list[str]]:
+        """
+        2次元配列に変換する
+
+        Returns:
+            ボードの2次元配列
+        """
+        board = [[Board.EMPTY] * self._width for _ in range(self._height)]
+        for (x, y), stone in self._stones.items():
+            board[y][x] = stone
+        return board
+
+    def _add_neighbors(self, x: int, y: int, stone: str, delta: int) -> None:
+        """
+        周囲の空きマスについて、隣接する stone の石の数を delta だけ増減する
+
+        Args:
+            x: X座標
+            y: Y座標
+            stone: 石の文字
+            delta: 増減（1 または -1）
+        """
+        counts = self._frontiers[stone]
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < self._width and 0 <= ny < self._height):
+                continue
+            if (nx, ny) in self._stones:
+                continue
+            count = counts.get((nx, ny), 0) + delta
+            if count:
+                counts[(nx, ny)] = count
+            else:
+                del counts[(nx, ny)]
+
+    def _flips_in_direction(
+        self, x: int, y: int, dx: int, dy: int, my_stone: str, opponent_stone: str
+    ) -> list[tuple[int, int]]:
+        """
+        特定方向で裏返せる石を求める
+
+        空きマスは辞書にないので、盤面の外に出たかどうかを調べなくても
+        相手の石が途切れたところで止まる。
+
+        Args:
+            x: X座標
+            y: Y座標
+            dx: X方向の増分
+            dy: Y方向の増分
+            my_stone: 自分の石
+            opponent_stone: 相手の石
+
+        Returns:
+            裏返せる石の座標のリスト（裏返せない場合は空）
+        """
+        stones = self._stones
+        line = []
+        cx, cy = x + dx, y + dy
+        while stones.get((cx, cy)) == opponent_stone:
+            line.append((cx, cy))
+            cx, cy = cx + dx, cy + dy
+        if line and stones.get((cx, cy)) == my_stone:
+            return line
+        return []
+
+    @staticmethod
+    def _opponent(stone: str) -> str:
+        """
+        相手の石を取得する
+
+        Args:
+            stone: 石の文字
+
+        Returns:
+            相手の石の文字
+        """
+        return Stone.WHITE.value if stone == Stone.BLACK.value else Stone.BLACK.value
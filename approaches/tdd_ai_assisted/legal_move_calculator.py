@@ -3,6 +3,7 @@
 """
 
 from board import Board, Stone
+from frontier import Frontier
 
 
 class LegalMoveCalculator:
@@ -11,23 +12,126 @@ class LegalMoveCalculator:
     # 合法手を表す定数
     LEGAL_MOVE_MARK = "0"
 
+    # チェックする方向のリスト（8方向）
+    _DIRECTIONS = (
+        (-1, 0),   # 左
+        (1, 0),    # 右
+        (0, -1),   # 上
+        (0, 1),    # 下
+        (-1, -1),  # 左上
+        (1, -1),   # 右上
+        (-1, 1),   # 左下
+        (1, 1),    # 右下
+    )
+
     @staticmethod
-    def calculate(board: Board, turn: Stone) -> str:
+    def calculate(board: Board, turn: Stone, use_frontier: bool = False) -> str:
         """
         合法手を計算する
 
         Args:
             board: ボードの盤面状態
             turn: 現在の手番
+            use_frontier: True なら相手の石に隣接する空きマスだけを候補にする
+                （大きなボードで石が少ない場合に速い。ただし呼び出しのたびに
+                盤面全体から Frontier を作るので、面積に比例する時間はかかる。
+                対局を進めながらくり返し求める場合は Frontier を持ち続けて使う）
 
         Returns:
             合法手をマークしたボード表示と手番
         """
         board_array = Board.string_to_array(board.board)
-        LegalMoveCalculator._mark_legal_moves(board_array, turn)
+        if use_frontier:
+            LegalMoveCalculator._mark_legal_moves_frontier(board_array, turn)
+        else:
+            LegalMoveCalculator._mark_legal_moves(board_array, turn)
         legal_moves_board = Board.array_to_string(board_array)
         return f"{legal_moves_board}\n{turn.value}"
 
+    @staticmethod
+    def mobility(board: Board, turn: Stone) -> tuple[int, int]:
+        """
+        合法手の数と合法手のビットマスクを計算する
+
+        合法手をマークしたボード文字列を作らないので、数だけが必要な評価に使う。
+        ビット番号は y * 幅 + x（左上が最下位ビット、8x8 なら64ビット）。
+
+        Args:
+            board: ボードの盤面状態
+            turn: 現在の手番
+
+        Returns:
+            (合法手の数, 合法手のビットマスク)
+        """
+        rows = Board.string_to_array(board.board)
+        height = len(rows)
+        width = len(rows[0])
+        my_stone = turn.value
+        opponent_stone = LegalMoveCalculator._get_opponent_stone(turn)
+
+        count = 0
+        mask = 0
+        for y in range(height):
+            for x in range(width):
+                if rows[y][x] != Board.EMPTY:
+                    continue
+                if LegalMoveCalculator._is_legal_move(rows, x, y, my_stone, opponent_stone):
+                    count += 1
+                    mask |= 1 << (y * width + x)
+        return count, mask
+
+    @staticmethod
+    def mobility_both(board: Board) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        黒と白の合法手の数とビットマスクを、ボードを1回走査するだけで計算する
+
+        空きマスから各方向に進み、隣の石と同じ色が続いた先に反対の色の石があれば、
+        その反対の色の合法手になる（1回の走査で両者を判定できる）。
+
+        Args:
+            board: ボードの盤面状態
+
+        Returns:
+            ((黒の合法手の数, 黒のビットマスク), (白の合法手の数, 白のビットマスク))
+        """
+        rows = Board.string_to_array(board.board)
+        height = len(rows)
+        width = len(rows[0])
+        black = Stone.BLACK.value
+        white = Stone.WHITE.value
+
+        counts = {black: 0, white: 0}
+        masks = {black: 0, white: 0}
+        for y in range(height):
+            for x in range(width):
+                if rows[y][x] != Board.EMPTY:
+                    continue
+                found: set[str] = set()
+                for dx, dy in LegalMoveCalculator._DIRECTIONS:
+                    next_x, next_y = x + dx, y + dy
+                    if not (0 <= next_x < width and 0 <= next_y < height):
+                        continue
+                    first = rows[next_y][next_x]
+                    if first not in counts:
+                        continue
+                    while (0 <= next_x < width and 0 <= next_y < height
+                           and rows[next_y][next_x] == first):
+                        next_x += dx
+                        next_y += dy
+                    if not (0 <= next_x < width and 0 <= next_y < height):
+                        continue
+                    last = rows[next_y][next_x]
+                    # 隣と反対の色の石で終われば、その色の合法手
+                    if last in counts and last != first:
+                        found.add(last)
+                        if len(found) == 2:
+                            break
+                for stone in found:
+                    counts[stone] += 1
+                    masks[stone] |= 1 << (y * width + x)
+
+        return (counts[black], masks[black]), (counts[white], masks[white])
+
     @staticmethod
     def _mark_legal_moves(board: list[list[str]], turn: Stone) -> None:
         """
@@ -53,6 +157,20 @@ class LegalMoveCalculator:
                 if LegalMoveCalculator._is_legal_move(board, x, y, my_stone, opponent_stone):
                     board[y][x] = LegalMoveCalculator.LEGAL_MOVE_MARK
 
+    @staticmethod
+    def _mark_legal_moves_frontier(board: list[list[str]], turn: Stone) -> None:
+        """
+        2次元配列に合法手をマークする（フロンティアの空きマスだけを調べる）
+
+        Frontier を作るときに全マスを1回走査する（合法手の判定はフロンティアだけ）。
+
+        Args:
+            board: ボードの2次元配列（直接変更される）
+            turn: 現在の手番
+        """
+        for x, y in Frontier.from_array(board).legal_moves(turn):
+            board[y][x] = LegalMoveCalculator.LEGAL_MOVE_MARK
+
     @staticmethod
     def _is_legal_move(
         board: list[list[str]], x: int, y: int, my_stone: str, opponent_stone: str
@@ -70,19 +188,7 @@ class LegalMoveCalculator:
         Returns:
             合法手の場合True
         """
-        # チェックする方向のリスト（8方向）
-        directions = [
-            (-1, 0),   # 左
-            (1, 0),    # 右
-            (0, -1),   # 上
-            (0, 1),    # 下
-            (-1, -1),  # 左上
-            (1, -1),   # 右上
-            (-1, 1),   # 左下
-            (1, 1),    # 右下
-        ]
-
-        for dx, dy in directions:
+        for dx, dy in LegalMoveCalculator._DIRECTIONS:
             if LegalMoveCalculator._check_direction(board, x, y, dx, dy, my_stone, opponent_stone):
                 return True
 
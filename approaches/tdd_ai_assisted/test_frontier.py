@@ -0,0 +1,127 @@
+"""
+フロンティアによる合法手計算のテストモジュール
+"""
+
+# pylint: disable=non-ascii-name,invalid-name
+
+import random
+
+import pytest
+from board import Board, Stone
+from frontier import Frontier
+from legal_move_calculator import LegalMoveCalculator
+
+
+INITIAL_BOARD = (
+    "........\n"
+    "........\n"
+    "........\n"
+    "...BW...\n"
+    "...WB...\n"
+    "........\n"
+    "........\n"
+    "........"
+)
+
+
+def _random_board(rng: random.Random, width: int, height: int) -> Board:
+    rows = ["".join(rng.choice("..BW") for _ in range(width)) for _ in range(height)]
+    return Board("\n".join(rows))
+
+
+class TestFrontier:
+    """フロンティアのテスト"""
+
+    def test_候補は相手の石に隣接する空きマスだけになる(self):
+        """候補は相手の石に隣接する空きマスだけになるテスト"""
+        frontier = Frontier.from_board(Board("....\n.BW.\n...."))
+        assert frontier.candidates(Stone.BLACK) == {
+            (1, 0), (2, 0), (3, 0), (3, 1), (1, 2), (2, 2), (3, 2),
+        }
+        assert frontier.candidates(Stone.WHITE) == {
+            (0, 0), (1, 0), (2, 0), (0, 1), (0, 2), (1, 2), (2, 2),
+        }
+
+    def test_初期配置の合法手を上の行から左から順に返す(self):
+        """初期配置の合法手を上の行から左から順に返すテスト"""
+        frontier = Frontier.from_board(Board(INITIAL_BOARD))
+        assert frontier.legal_moves(Stone.BLACK) == [(4, 2), (5, 3), (2, 4), (3, 5)]
+
+    def test_石を置くと挟んだ石が裏返りフロンティアも更新される(self):
+        """石を置くと挟んだ石が裏返りフロンティアも更新されるテスト"""
+        frontier = Frontier.from_board(Board(INITIAL_BOARD))
+
+        flipped = frontier.play(4, 2, Stone.BLACK)
+
+        assert flipped == [(4, 3)]
+        assert frontier.get(4, 3) == "B"
+        assert frontier.stone_count == 5
+        # 差分更新した結果が、作り直した場合と一致する
+        rebuilt = Frontier.from_array(frontier.to_array())
+        for turn in (Stone.BLACK, Stone.WHITE):
+            assert frontier.candidates(turn) == rebuilt.candidates(turn)
+
+    def test_合法手でないマスに置くとエラーが発生する(self):
+        """合法手でないマスに置くとエラーが発生するテスト"""
+        frontier = Frontier.from_board(Board(INITIAL_BOARD))
+        with pytest.raises(ValueError):
+            frontier.play(0, 0, Stone.BLACK)
+        with pytest.raises(ValueError):
+            frontier.play(3, 3, Stone.BLACK)
+
+    def test_大きなボードで対局を進めても差分更新と作り直しが一致する(self):
+        """大きなボードで対局を進めても差分更新と作り直しが一致するテスト"""
+        rng = random.Random(17)
+        frontier = Frontier(100, 100)
+        for x, y, stone in ((49, 49, "W"), (50, 49, "B"), (49, 50, "B"), (50, 50, "W")):
+            frontier.place(x, y, stone)
+        turn = Stone.BLACK
+        for _ in range(60):
+            moves = frontier.legal_moves(turn)
+            if moves:
+                frontier.play(*rng.choice(moves), turn)
+            turn = Stone.WHITE if turn == Stone.BLACK else Stone.BLACK
+
+        rebuilt = Frontier.from_array(frontier.to_array())
+        for turn in (Stone.BLACK, Stone.WHITE):
+            assert frontier.candidates(turn) == rebuilt.candidates(turn)
+            assert frontier.legal_moves(turn) == rebuilt.legal_moves(turn)
+
+
+class TestLegalMoveCalculatorFrontier:
+    """フロンティアを使う合法手計算のテスト"""
+
+    def test_フロンティアを使っても全マス走査と同じ結果になる(self):
+        """フロンティアを使っても全マス走査と同じ結果になるテスト"""
+        rng = random.Random(170)
+        for width, height in ((8, 8), (3, 1), (1, 4), (13, 7)):
+            for _ in range(50):
+                board = _random_board(rng, width, height)
+                for turn in (Stone.BLACK, Stone.WHITE):
+                    assert LegalMoveCalculator.calculate(board, turn, use_frontier=True) == \
+                        LegalMoveCalculator.calculate(board, turn)
+
+
+class TestMobility:
+    """合法手の数とビットマスクのテスト"""
+
+    def test_初期配置の合法手の数とビットマスクを返す(self):
+        """初期配置の合法手の数とビットマスクを返すテスト"""
+        count, mask = LegalMoveCalculator.mobility(Board(INITIAL_BOARD), Stone.BLACK)
+        assert count == 4
+        # ビット番号は y * 幅 + x
+        assert mask == sum(1 << (y * 8 + x) for x, y in ((4, 2), (5, 3), (2, 4), (3, 5)))
+
+    def test_全マス走査とフロンティアと両者まとめての結果が一致する(self):
+        """全マス走査とフロンティアと両者まとめての結果が一致するテスト"""
+        rng = random.Random(210)
+        for width, height in ((8, 8), (5, 3), (1, 6), (12, 12)):
+            for _ in range(50):
+                board = _random_board(rng, width, height)
+                frontier = Frontier.from_board(board)
+                both = LegalMoveCalculator.mobility_both(board)
+                for turn, expected in zip((Stone.BLACK, Stone.WHITE), both):
+                    assert LegalMoveCalculator.mobility(board, turn) == expected
+                    assert frontier.mobility(turn) == expected
+                    marked = LegalMoveCalculator.calculate(board, turn)
+                    assert expected[0] == marked.count(LegalMoveCalculator.LEGAL_MOVE_MARK)
@@ -0,0 +1,138 @@
+"""
+NumPy による一括合法手判定 (vibe_coding アプローチ)
+
+N 個の盤面をまとめて受け取り、ビットボード（黒・白それぞれ64ビット）に
+詰め直してから、8方向のシフト演算を N 局面ぶん同時に行う。
+1局面ずつループする find_legal_moves と同じ結果になる。
+
+ビット番号は row * 8 + col（(0, 0) が最下位ビット）。
+"""
+
+import numpy as np
+
+
+# 盤面を整数配列で渡すときのコード
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+
+_FULL = np.uint64(0xFFFFFFFFFFFFFFFF)
+# 左端と右端の列を除いたマスク（横・斜めの回り込み防止）
+_NOT_EDGE_COLUMNS = np.uint64(0x7E7E7E7E7E7E7E7E)
+
+# (シフト量, 相手のコマに掛けるマスク)。左右両方向のシフトに使う
+_DIRECTION_SHIFTS = (
+    (np.uint64(1), _NOT_EDGE_COLUMNS),  # 左右
+    (np.uint64(8), _FULL),              # 上下
+    (np.uint64(7), _NOT_EDGE_COLUMNS),  # 右上・左下
+    (np.uint64(9), _NOT_EDGE_COLUMNS),  # 左上・右下
+)
+
+# 各マスのビット（pack / unpack 用）
+_BIT_INDEX = np.arange(64, dtype=np.uint64)
+_BIT_VALUES = np.uint64(1) << _BIT_INDEX
+
+
+def _to_codes(boards):
+    """
+    (N, 8, 8) の盤面を EMPTY / BLACK / WHITE の整数配列にする
+
+    文字の配列（'B', 'W', '.'）でも整数コードの配列でも受け付ける
+    """
+    boards = np.asarray(boards)
+    if boards.dtype.kind in 'US':
+        black = b'B' if boards.dtype.kind == 'S' else 'B'
+        white = b'W' if boards.dtype.kind == 'S' else 'W'
+        codes = np.zeros(boards.shape, dtype=np.uint8)
+        codes[boards == black] = BLACK
+        codes[boards == white] = WHITE
+        return codes
+    return boards
+
+
+def pack_boards(boards):
+    """
+    (N, 8, 8) の盤面を (N, 2) の uint64 配列（黒, 白）に詰める
+
+    Args:
+        boards: (N, 8, 8) の盤面（文字または整数コード）
+
+    Returns:
+        (N, 2) の uint64 配列。[:, 0] が黒、[:, 1] が白
+    """
+    codes = _to_codes(boards).reshape(-1, 64)
+    packed = np.empty((codes.shape[0], 2), dtype=np.uint64)
+    # 各マスのビットは重ならないので、合計がそのまま OR になる
+    packed[:, 0] = np.where(codes == BLACK, _BIT_VALUES, np.uint64(0)).sum(axis=1, dtype=np.uint64)
+    packed[:, 1] = np.where(codes == WHITE, _BIT_VALUES, np.uint64(0)).sum(axis=1, dtype=np.uint64)
+    return packed
+
+
+def _is_black_turn(players, n):
+    """手番ベクトル（'B'/'W' または BLACK/WHITE）を黒番かどうかの bool 配列にする"""
+    players = np.asarray(players)
+    if players.ndim == 0:
+        players = np.full(n, players)
+    if players.dtype.kind == 'U':
+        return players == 'B'
+    if players.dtype.kind == 'S':
+        return players == b'B'
+    return players == BLACK
+
+
+def legal_move_masks(packed, players):
+    """
+    詰めた盤面から、各局面の合法手ビットボードを求める
+
+    Args:
+        packed: (N, 2) の uint64 配列（黒, 白）
+        players: (N,) の手番ベクトル（'B'/'W' または BLACK/WHITE）
+
+    Returns:
+        (N,) の uint64 配列。合法手の位置のビットが立っている
+    """
+    packed = np.asarray(packed, dtype=np.uint64)
+    is_black = _is_black_turn(players, packed.shape[0])
+
+    player = np.where(is_black, packed[:, 0], packed[:, 1])
+    opponent = np.where(is_black, packed[:, 1], packed[:, 0])
+    empty = ~(player | opponent)
+    moves = np.zeros_like(player)
+
+    for shift, edge_mask in _DIRECTION_SHIFTS:
+        masked_opponent = opponent & edge_mask
+
+        # 左シフト方向（相手のコマは最大6個まで連続する）
+        x = (player << shift) & masked_opponent
+        for _ in range(5):
+            x |= (x << shift) & masked_opponent
+        moves |= (x << shift) & empty
+
+        # 右シフト方向
+        x = (player >> shift) & masked_opponent
+        for _ in range(5):
+            x |= (x >> shift) & masked_opponent
+        moves |= (x >> shift) & empty
+
+    return moves
+
+
+def find_legal_moves_batch(positions, players):
+    """
+    N 局面の合法手をまとめて求める
+
+    Args:
+        positions: (N, 8, 8) の盤面、または (N, 2) の uint64 配列（黒, 白）
+        players: (N,) の手番ベクトル（'B'/'W' または BLACK/WHITE）
+
+    Returns:
+        (N, 64) の bool 配列。[i, row * 8 + col] が True なら合法手
+    """
+    positions = np.asarray(positions)
+    if positions.ndim == 3:
+        packed = pack_boards(positions)
+    else:
+        packed = positions
+
+    moves = legal_move_masks(packed, players)
+    return ((moves[:, None] >> _BIT_INDEX) & np.uint64(1)).astype(bool)
@@ -111,10 +111,41 @@ def is_legal_move(board: List[List[str]], row: int, col: int, player: str) -> bo
     return False
 
 
+def _build_rays() -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    64マスそれぞれについて、8方向に伸びる列（レイ）を前もって作る
+
+    盤面を1次元（index = row * 8 + col）で見たときの添字のタプルにしておく。
+    相手のコマ1つ + 自分のコマ1つが入らない長さ1以下のレイは、挟めないので入れない。
+    """
+    rays = []
+    for row in range(8):
+        for col in range(8):
+            square_rays = []
+            for dr, dc in DIRECTIONS:
+                ray = []
+                r, c = row + dr, col + dc
+                while 0 <= r < 8 and 0 <= c < 8:
+                    ray.append(r * 8 + c)
+                    r, c = r + dr, c + dc
+                if len(ray) >= 2:
+                    square_rays.append(tuple(ray))
+            rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+# RAYS[row * 8 + col] = そのマスから伸びるレイ（近い順の1次元添字）のタプル
+RAYS = _build_rays()
+
+
 def find_legal_moves(board: List[List[str]], player: str) -> List[Tuple[int, int]]:
     """
     全ての合法手を見つける
 
+    盤面を64マスの1次元リストにして、RAYS のレイを順にたどる。
+    座標の計算や盤面外のチェックはレイを作るときに済んでいるので、
+    ここでは添字でマスを見るだけ。
+
     Args:
         board: 盤面
         player: 手番
@@ -122,17 +153,117 @@ def find_legal_moves(board: List[List[str]], player: str) -> List[Tuple[int, int
     Returns:
         合法手のリスト [(row, col), ...]
     """
+    cells = [cell for row in board for cell in row]
+    opponent = 'W' if player == 'B' else 'B'
     legal_moves = []
 
-    # 8x8の全マスをチェック
-    for row in range(8):
-        for col in range(8):
-            if is_legal_move(board, row, col, player):
-                legal_moves.append((row, col))
+    for index in range(64):
+        if cells[index] != '.':
+            continue
+        for ray in RAYS[index]:
+            # 隣が相手のコマでなければこの方向はダメ
+            if cells[ray[0]] != opponent:
+                continue
+            # 相手のコマが続く間は進み、最初に違うマスが自分のコマならOK
+            found = False
+            for i in ray:
+                cell = cells[i]
+                if cell != opponent:
+                    found = cell == player
+                    break
+            if found:
+                legal_moves.append(divmod(index, 8))
+                break
 
     return legal_moves
 
 
+def mobility(board: List[List[str]], player: str) -> Tuple[int, int]:
+    """
+    合法手の数と、合法手のビットマスクを返す（合法手のリストは作らない）
+
+    ビット番号は row * 8 + col（(0, 0) が最下位ビット）で、batch.py と同じ。
+
+    Args:
+        board: 盤面
+        player: 手番
+
+    Returns:
+        (合法手の数, 合法手のビットマスク)
+    """
+    cells = [cell for row in board for cell in row]
+    opponent = 'W' if player == 'B' else 'B'
+    count = 0
+    mask = 0
+
+    for index in range(64):
+        if cells[index] != '.':
+            continue
+        for ray in RAYS[index]:
+            if cells[ray[0]] != opponent:
+                continue
+            found = False
+            for i in ray:
+                cell = cells[i]
+                if cell != opponent:
+                    found = cell == player
+                    break
+            if found:
+                count += 1
+                mask |= 1 << index
+                break
+
+    return count, mask
+
+
+def mobility_both(board: List[List[str]]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    黒と白の合法手の数とビットマスクを、盤面を1回見るだけで返す
+
+    空マスからレイをたどって、隣のコマと同じ色が続いた先に
+    反対の色のコマがあれば、その反対の色の合法手になる。
+
+    Args:
+        board: 盤面
+
+    Returns:
+        ((黒の数, 黒のビットマスク), (白の数, 白のビットマスク))
+    """
+    cells = [cell for row in board for cell in row]
+    black_count = white_count = 0
+    black_mask = white_mask = 0
+
+    for index in range(64):
+        if cells[index] != '.':
+            continue
+        black_found = white_found = False
+        for ray in RAYS[index]:
+            first = cells[ray[0]]
+            if first == '.':
+                continue
+            last = '.'
+            for i in ray:
+                cell = cells[i]
+                if cell != first:
+                    last = cell
+                    break
+            # 隣と反対の色のコマで終わっていれば、その色が挟める
+            if last == 'B' and first == 'W':
+                black_found = True
+            elif last == 'W' and first == 'B':
+                white_found = True
+            if black_found and white_found:
+                break
+        if black_found:
+            black_count += 1
+            black_mask |= 1 << index
+        if white_found:
+            white_count += 1
+            white_mask |= 1 << index
+
+    return (black_count, black_mask), (white_count, white_mask)
+
+
 def print_board_with_legal_moves(board: List[List[str]],
                                    legal_moves: List[Tuple[int, int]],
                                    player: str):
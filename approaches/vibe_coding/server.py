@@ -0,0 +1,267 @@
+"""
+asyncio による合法手サーバ (vibe_coding アプローチ)
+
+TCP で JSON Lines を受け付ける。1行が1リクエスト:
+
+    {"id": 1, "board": ["........", ..., "........"], "player": "B"}
+
+応答も1行ずつ（リクエストと同じ id を付ける。順番は完了順）:
+
+    {"id": 1, "moves": [[2, 3], [3, 2], [4, 5], [5, 4]]}
+    {"id": 2, "error": "..."}
+
+同時に届いたリクエストは、短い待ち時間（window）の間ためてから
+まとめて1回のバッチ判定にかける。numpy があれば batch.py の一括判定、
+なければ find_legal_moves のループで判定する。
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from reversi import find_legal_moves
+
+# numpy はなくても動く（そのときは1局面ずつ判定する）
+try:
+    import numpy as np
+    from batch import legal_move_masks, pack_boards
+except ImportError:
+    np = None
+
+
+Moves = List[Tuple[int, int]]
+# (盤面のリスト, 手番のリスト) を受け取り、局面ごとの合法手のリストを返す関数
+BatchEvaluator = Callable[[Sequence[List[List[str]]], Sequence[str]], List[Moves]]
+
+DEFAULT_WINDOW = 0.001   # 1ms
+DEFAULT_MAX_BATCH = 256
+
+
+def evaluate_loop(boards, players) -> List[Moves]:
+    """1局面ずつ find_legal_moves を呼ぶ（numpy がないときの判定）"""
+    return [find_legal_moves(board, player) for board, player in zip(boards, players)]
+
+
+def _mask_to_moves(mask: int) -> Moves:
+    """合法手のビットボードを [(row, col), ...]（行優先の昇順）にする"""
+    moves = []
+    while mask:
+        low = mask & -mask
+        moves.append(divmod(low.bit_length() - 1, 8))
+        mask ^= low
+    return moves
+
+
+def evaluate_numpy(boards, players) -> List[Moves]:
+    """batch.py でまとめて判定する"""
+    # 全局面の文字を1本のバイト列にしてから (N, 8, 8) の文字配列にする
+    text = ''.join(''.join(''.join(row) for row in board) for board in boards)
+    cells = np.frombuffer(text.encode('ascii'), dtype='S1').reshape(-1, 8, 8)
+    masks = legal_move_masks(pack_boards(cells), np.array(players))
+    return [_mask_to_moves(int(mask)) for mask in masks]
+
+
+def default_evaluator() -> BatchEvaluator:
+    """numpy があれば evaluate_numpy、なければ evaluate_loop"""
+    return evaluate_loop if np is None else evaluate_numpy
+
+
+class RequestCoalescer:
+    """
+    同時に届いたリクエストをまとめてバッチ判定にかける
+
+    最初のリクエストが届いてから window 秒たつか、max_batch 件たまったら
+    まとめて evaluate を1回呼ぶ。window=0 なら、同じイベントループの
+    1周の間に届いた分だけをまとめる。
+    """
+
+    def __init__(self, evaluate: Optional[BatchEvaluator] = None,
+                 window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        if window < 0:
+            raise ValueError("window は0以上を指定してください")
+        if max_batch < 1:
+            raise ValueError("max_batch は1以上を指定してください")
+        self.evaluate = evaluate or default_evaluator()
+        self.window = window
+        self.max_batch = max_batch
+        self._pending = []  # (盤面, 手番, future)
+        self._timer = None
+        # 統計
+        self.batches = 0
+        self.positions = 0
+
+    def submit(self, board: List[List[str]], player: str) -> 'asyncio.Future[Moves]':
+        """
+        1局面を受け付ける。合法手のリストが入る future を返す
+
+        イベントループの中から呼ぶこと
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((board, player, future))
+
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            if self.window > 0:
+                self._timer = loop.call_later(self.window, self.flush)
+            else:
+                self._timer = loop.call_soon(self.flush)
+        return future
+
+    def flush(self) -> None:
+        """ためているリクエストをまとめて判定し、それぞれの future に結果を入れる"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        boards = [board for board, _, _ in pending]
+        players = [player for _, player, _ in pending]
+        try:
+            results = self.evaluate(boards, players)
+            if len(results) != len(pending):
+                raise RuntimeError(f"evaluate が {len(pending)} 局面に対して {len(results)} 件の結果を返した")
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.positions += len(pending)
+        for (_, _, future), moves in zip(pending, results):
+            # 応答前に切断されたクライアントの future は取り消されている
+            if not future.done():
+                future.set_result(moves)
+
+    @property
+    def mean_batch_size(self) -> float:
+        """1回のバッチ判定あたりの平均局面数"""
+        return self.positions / self.batches if self.batches else 0.0
+
+
+class RequestError(ValueError):
+    """リクエストの形式の誤り。応答に付ける id（読めなければ None）を持つ"""
+
+    def __init__(self, message: str, request_id=None):
+        super().__init__(message)
+        self.request_id = request_id
+
+
+def parse_request(line: bytes):
+    """
+    1行のリクエストを (id, 盤面, 手番) にする
+
+    盤面は8文字×8行、各文字は '.', 'B', 'W'。手番は 'B' か 'W'。
+    形式が違えば RequestError
+    """
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise RequestError(f"JSON として読めない: {e}") from None
+    if not isinstance(request, dict):
+        raise RequestError("リクエストは JSON オブジェクトで送ってください")
+
+    request_id = request.get('id')
+    rows = request.get('board')
+    player = request.get('player')
+    if (not isinstance(rows, list) or len(rows) != 8
+            or not all(isinstance(row, str) and len(row) == 8 and not row.strip('.BW') for row in rows)):
+        raise RequestError("board は '.', 'B', 'W' からなる8文字×8行で指定してください", request_id)
+    if player not in ('B', 'W'):
+        raise RequestError("player は 'B' か 'W' で指定してください", request_id)
+    return request_id, [list(row) for row in rows], player
+
+
+async def _answer(coalescer: RequestCoalescer, line: bytes, writer: asyncio.StreamWriter) -> None:
+    """1リクエストを判定して応答を書き込む（判定の失敗もエラーとして応答し、接続は切らない）"""
+    request_id = None
+    try:
+        request_id, board, player = parse_request(line)
+        moves = await coalescer.submit(board, player)
+        response = {'id': request_id, 'moves': moves}
+    except RequestError as e:
+        response = {'id': e.request_id, 'error': str(e)}
+    except Exception as e:
+        response = {'id': request_id, 'error': str(e)}
+    if not writer.is_closing():
+        writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+
+
+async def handle_client(coalescer: RequestCoalescer,
+                        reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    1接続を処理する
+
+    1つの接続から続けて届いたリクエストも、応答を待たずに受け付けて
+    他の接続のリクエストと一緒にまとめる
+    """
+    tasks = set()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(_answer(coalescer, line, writer))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            await writer.drain()
+        if tasks:
+            await asyncio.gather(*tasks)
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        writer.close()
+
+
+async def start_server(coalescer: RequestCoalescer, host: str = '127.0.0.1', port: int = 0):
+    """サーバを起動して asyncio.Server を返す（port=0 なら空いているポート）"""
+    return await asyncio.start_server(
+        lambda reader, writer: handle_client(coalescer, reader, writer), host, port)
+
+
+async def serve(host: str, port: int, window: float, max_batch: int) -> None:
+    coalescer = RequestCoalescer(window=window, max_batch=max_batch)
+    server = await start_server(coalescer, host, port)
+    address = server.sockets[0].getsockname()
+    print(f"listening on {address[0]}:{address[1]} "
+          f"(window={window * 1000:g}ms, max_batch={max_batch}, evaluator={coalescer.evaluate.__name__})",
+          file=sys.stderr, flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        print(json.dumps({'batches': coalescer.batches, 'positions': coalescer.positions,
+                          'mean_batch_size': round(coalescer.mean_batch_size, 2)}),
+              file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSON Lines で合法手を返す asyncio サーバ")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--window-ms', type=float, default=DEFAULT_WINDOW * 1000,
+                        help="リクエストをまとめる待ち時間（ミリ秒、既定: 1）")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help="1回のバッチ判定の最大局面数（既定: 256）")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms / 1000, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+NumPy 一括合法手判定のテスト (vibe_coding アプローチ)
+
+1局面ずつ判定する find_legal_moves と結果が一致することを確認する。
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch import BLACK, WHITE, find_legal_moves_batch, pack_boards
+from reversi import find_legal_moves
+
+
+INITIAL_BOARD = [
+    ['.', '.', '.', '.', '.', '.', '.', '.'],
+    ['.', '.', '.', '.', '.', '.', '.', '.'],
+    ['.', '.', '.', '.', '.', '.', '.', '.'],
+    ['.', '.', '.', 'B', 'W', '.', '.', '.'],
+    ['.', '.', '.', 'W', 'B', '.', '.', '.'],
+    ['.', '.', '.', '.', '.', '.', '.', '.'],
+    ['.', '.', '.', '.', '.', '.', '.', '.'],
+    ['.', '.', '.', '.', '.', '.', '.', '.'],
+]
+
+
+def mask_to_moves(mask_row):
+    """(64,) の bool 配列を [(row, col), ...] にする"""
+    return [divmod(int(i), 8) for i in np.flatnonzero(mask_row)]
+
+
+def test_initial_position_batch():
+    """
+    初期配置を黒番・白番の2局面として渡す
+    """
+    boards = np.array([INITIAL_BOARD, INITIAL_BOARD])
+    result = find_legal_moves_batch(boards, np.array(['B', 'W']))
+
+    assert result.shape == (2, 64)
+    assert mask_to_moves(result[0]) == [(2, 4), (3, 5), (4, 2), (5, 3)]
+    assert mask_to_moves(result[1]) == [(2, 3), (3, 2), (4, 5), (5, 4)]
+
+
+def test_packed_input_gives_same_result():
+    """
+    整数コードの盤面と、詰めた uint64 配列のどちらでも同じ結果になる
+    """
+    codes = np.zeros((1, 8, 8), dtype=np.uint8)
+    codes[0, 3, 3] = codes[0, 4, 4] = BLACK
+    codes[0, 3, 4] = codes[0, 4, 3] = WHITE
+    players = np.array([BLACK])
+
+    from_codes = find_legal_moves_batch(codes, players)
+    from_packed = find_legal_moves_batch(pack_boards(codes), players)
+
+    assert (from_codes == from_packed).all()
+    assert mask_to_moves(from_codes[0]) == [(2, 4), (3, 5), (4, 2), (5, 3)]
+
+
+def test_random_boards_match_scalar():
+    """
+    ランダムな盤面で、1局面ずつの find_legal_moves と一致する
+    """
+    rng = random.Random(12345)
+    boards = [
+        [[rng.choice('..BW') for _ in range(8)] for _ in range(8)]
+        for _ in range(500)
+    ]
+    players = [rng.choice('BW') for _ in range(500)]
+
+    result = find_legal_moves_batch(np.array(boards), np.array(players))
+
+    for i, (board, player) in enumerate(zip(boards, players)):
+        assert mask_to_moves(result[i]) == find_legal_moves(board, player)
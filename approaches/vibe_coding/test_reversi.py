@@ -5,11 +5,16 @@
 問題文の例を最優先でテストし、その後基本的なケースを追加。
 """
 
+import random
+
 import pytest
 from reversi import (
+    RAYS,
     find_legal_moves,
     is_legal_move,
     can_flip_in_direction,
+    mobility,
+    mobility_both,
 )
 
 
@@ -239,3 +244,51 @@ def test_all_eight_directions():
 
     for dr, dc in directions:
         assert can_flip_in_direction(board, 3, 3, dr, dc, 'B')
+
+
+def test_rays_table():
+    """RAYS: 角は3方向、中央は8方向、レイは近い順の1次元添字"""
+    assert len(RAYS) == 64
+    # (0, 0) から右・下・右下
+    assert sorted(RAYS[0]) == [
+        (1, 2, 3, 4, 5, 6, 7),
+        (8, 16, 24, 32, 40, 48, 56),
+        (9, 18, 27, 36, 45, 54, 63),
+    ]
+    assert len(RAYS[3 * 8 + 3]) == 8
+    # 長さ1のレイ（端の隣から外向き）は入らない
+    assert all(len(ray) >= 2 for rays in RAYS for ray in rays)
+
+
+def test_ray_tables_match_stepwise():
+    """レイ表を使う find_legal_moves が、1歩ずつ調べる is_legal_move と一致する"""
+    rng = random.Random(16)
+    for _ in range(300):
+        board = [[rng.choice('..BW') for _ in range(8)] for _ in range(8)]
+        for player in 'BW':
+            expected = [(r, c) for r in range(8) for c in range(8)
+                        if is_legal_move(board, r, c, player)]
+            assert find_legal_moves(board, player) == expected
+
+
+def test_mobility_initial_position():
+    """mobility: 初期配置の黒番は4手、ビットは row * 8 + col"""
+    board = [['.'] * 8 for _ in range(8)]
+    board[3][3], board[3][4] = 'W', 'B'
+    board[4][3], board[4][4] = 'B', 'W'
+    count, mask = mobility(board, 'B')
+    assert count == 4
+    assert mask == sum(1 << (r * 8 + c) for r, c in find_legal_moves(board, 'B'))
+
+
+def test_mobility_both_matches_find_legal_moves():
+    """mobility_both は両者の find_legal_moves と数・ビットが一致する"""
+    rng = random.Random(21)
+    for _ in range(300):
+        board = [[rng.choice('..BW') for _ in range(8)] for _ in range(8)]
+        expected = []
+        for player in 'BW':
+            moves = find_legal_moves(board, player)
+            expected.append((len(moves), sum(1 << (r * 8 + c) for r, c in moves)))
+            assert mobility(board, player) == expected[-1]
+        assert mobility_both(board) == tuple(expected)
@@ -0,0 +1,139 @@
+"""
+asyncio 合法手サーバのテスト (vibe_coding アプローチ)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from reversi import find_legal_moves
+from server import RequestCoalescer, evaluate_loop, evaluate_numpy, np, start_server
+
+
+INITIAL_ROWS = ["........", "........", "........", "...BW...",
+                "...WB...", "........", "........", "........"]
+INITIAL_BOARD = [list(row) for row in INITIAL_ROWS]
+
+
+def counting(evaluate):
+    """呼ばれた回数とバッチの大きさを記録する evaluate"""
+    sizes = []
+
+    def wrapped(boards, players):
+        sizes.append(len(boards))
+        return evaluate(boards, players)
+
+    wrapped.sizes = sizes
+    return wrapped
+
+
+def test_同時に届いたリクエストは1回のバッチ判定にまとめる():
+    evaluate = counting(evaluate_loop)
+
+    async def run():
+        coalescer = RequestCoalescer(evaluate, window=0.01, max_batch=256)
+        return await asyncio.gather(*[
+            coalescer.submit(INITIAL_BOARD, player) for player in "BWBW"
+        ])
+
+    results = asyncio.run(run())
+
+    assert evaluate.sizes == [4]
+    assert results[0] == find_legal_moves(INITIAL_BOARD, 'B')
+    assert results[1] == find_legal_moves(INITIAL_BOARD, 'W')
+
+
+def test_max_batch件たまったら待ち時間を待たずに判定する():
+    evaluate = counting(evaluate_loop)
+
+    async def run():
+        # 待ち時間は長いが、3件ずつ判定される
+        coalescer = RequestCoalescer(evaluate, window=10, max_batch=3)
+        return await asyncio.wait_for(asyncio.gather(*[
+            coalescer.submit(INITIAL_BOARD, 'B') for _ in range(6)
+        ]), timeout=1)
+
+    asyncio.run(run())
+
+    assert evaluate.sizes == [3, 3]
+
+
+@pytest.mark.skipif(np is None, reason="numpy がない")
+def test_numpyの一括判定はループと同じ合法手を返す():
+    import random
+    rng = random.Random(13)
+    boards = [[[rng.choice('..BW') for _ in range(8)] for _ in range(8)] for _ in range(50)]
+    players = [rng.choice('BW') for _ in range(50)]
+
+    assert evaluate_numpy(boards, players) == evaluate_loop(boards, players)
+
+
+def test_TCPでJSON_Linesのリクエストに応答する():
+    async def run():
+        coalescer = RequestCoalescer(window=0.001)
+        server = await start_server(coalescer)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        writer.write((json.dumps({"id": 1, "board": INITIAL_ROWS, "player": "B"}) + "\n").encode())
+        writer.write(b'{"id": 2, "board": ["..."], "player": "B"}\n')
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(2)]
+
+        writer.close()
+        await writer.wait_closed()
+        server.close()
+        await server.wait_closed()
+        return {response["id"]: response for response in responses}
+
+    responses = asyncio.run(run())
+
+    assert responses[1]["moves"] == [[2, 4], [3, 5], [4, 2], [5, 3]]
+    assert "error" in responses[2]
+
+
+def test_判定が失敗してもエラーを応答して同じ接続の後続のリクエストに答える():
+    calls = []
+
+    def flaky(boards, players):
+        calls.append(len(boards))
+        if len(calls) == 1:
+            raise ZeroDivisionError("division by zero")
+        return evaluate_loop(boards, players)
+
+    async def run():
+        coalescer = RequestCoalescer(flaky, window=0)
+        server = await start_server(coalescer)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        writer.write((json.dumps({"id": 1, "board": INITIAL_ROWS, "player": "B"}) + "\n").encode())
+        await writer.drain()
+        first = json.loads(await reader.readline())
+        writer.write((json.dumps({"id": 2, "board": INITIAL_ROWS, "player": "W"}) + "\n").encode())
+        await writer.drain()
+        second = json.loads(await reader.readline())
+
+        writer.close()
+        await writer.wait_closed()
+        server.close()
+        await server.wait_closed()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == {"id": 1, "error": "division by zero"}
+    assert second == {"id": 2, "moves": [[2, 3], [3, 2], [4, 5], [5, 4]]}
+
+
+def test_結果の件数が局面の数と違えばすべてのfutureをエラーにする():
+    async def run():
+        coalescer = RequestCoalescer(lambda boards, players: [[]], window=0)
+        return await asyncio.wait_for(asyncio.gather(
+            *[coalescer.submit(INITIAL_BOARD, 'B') for _ in range(3)],
+            return_exceptions=True), timeout=1)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,5 @@
+"""
+benchmarks パッケージ
+
+各アプローチの合法手計算を、固定の局面コーパスで横断的に計測する。
+"""
@@ -0,0 +1,7 @@
+"""python -m benchmarks のエントリポイント"""
+
+from benchmarks.runner import main
+
+
+if __name__ == "__main__":
+    main()
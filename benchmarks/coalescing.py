@@ -0,0 +1,208 @@
+"""
+リクエストをまとめる待ち時間（window）ごとのスループットとレイテンシ
+
+vibe_coding の asyncio サーバ（server.py）を同じプロセス内で起動し、
+複数のクライアントが同時に問い合わせたときの
+- 1秒あたりの応答数
+- 1リクエストのレイテンシ（p50 / p99）
+- 1回のバッチ判定あたりの平均局面数
+を window の設定ごとに計測する。
+
+各クライアントは応答を受け取ってから次のリクエストを送る（同時に1件まで）。
+比較のため、まとめずに1件ずつ判定する設定（max_batch=1）も計測する。
+
+使い方:
+    python -m benchmarks.coalescing [--windows 0,0.5,1,2,5] [--clients 64]
+                                    [--requests 50] [--max-batch 256]
+                                    [--evaluator auto|numpy|loop] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from types import ModuleType
+from typing import List, NamedTuple, Optional
+
+from benchmarks.corpus import Position, load_category
+from benchmarks.engines import APPROACHES_DIR, load_approach_file
+from benchmarks.runner import percentile
+
+
+DEFAULT_WINDOWS_MS = [0.0, 0.5, 1.0, 2.0, 5.0]
+
+
+class CoalescingResult(NamedTuple):
+    """1つの設定の計測結果"""
+
+    window_ms: float
+    max_batch: int
+    clients: int
+    requests: int
+    seconds: float
+    p50_ms: float
+    p99_ms: float
+    mean_batch_size: float
+
+    @property
+    def requests_per_sec(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+
+def load_server() -> ModuleType:
+    """
+    vibe_coding/server.py を読み込む
+
+    server.py は同じディレクトリの reversi.py / batch.py を import するので、
+    読み込む間だけ vibe_coding を sys.path の先頭に置く
+    （他のアプローチの reversi.py を拾わないようにするため）。
+    """
+    directory = str(APPROACHES_DIR / "vibe_coding")
+    sys.path.insert(0, directory)
+    try:
+        return load_approach_file("vibe_coding", "server.py")
+    finally:
+        sys.path.remove(directory)
+
+
+def _evaluator(server: ModuleType, name: str):
+    if name == "auto":
+        return server.default_evaluator()
+    if name == "numpy":
+        if server.np is None:
+            raise RuntimeError("numpy がインストールされていない")
+        return server.evaluate_numpy
+    return server.evaluate_loop
+
+
+async def _client(port: int, lines: List[bytes], requests: int, offset: int,
+                  latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for i in range(requests):
+            line = lines[(offset + i) % len(lines)]
+            start = time.perf_counter()
+            writer.write(line)
+            await writer.drain()
+            response = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            if b'"moves"' not in response:
+                raise RuntimeError(f"エラー応答: {response!r}")
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def _measure(server: ModuleType, evaluate, window_ms: float, max_batch: int,
+                   clients: int, requests: int, lines: List[bytes]) -> CoalescingResult:
+    coalescer = server.RequestCoalescer(evaluate, window=window_ms / 1000, max_batch=max_batch)
+    tcp_server = await server.start_server(coalescer)
+    port = tcp_server.sockets[0].getsockname()[1]
+    latencies: List[float] = []
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            _client(port, lines, requests, i * requests, latencies) for i in range(clients)
+        ])
+        seconds = time.perf_counter() - start
+    finally:
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+    latencies.sort()
+    return CoalescingResult(
+        window_ms=window_ms,
+        max_batch=max_batch,
+        clients=clients,
+        requests=len(latencies),
+        seconds=seconds,
+        p50_ms=percentile(latencies, 50) * 1e3,
+        p99_ms=percentile(latencies, 99) * 1e3,
+        mean_batch_size=coalescer.mean_batch_size,
+    )
+
+
+def request_lines(positions: List[Position]) -> List[bytes]:
+    """局面を server.py のリクエスト（JSON Lines）にする"""
+    return [
+        (json.dumps({"id": i, "board": list(p.rows), "player": p.player}) + "\n").encode()
+        for i, p in enumerate(positions)
+    ]
+
+
+def run_sweep(windows_ms: List[float], max_batch: int = 256, clients: int = 64,
+              requests: int = 50, evaluator: str = "auto",
+              category: str = "midgame") -> List[CoalescingResult]:
+    """
+    window の設定ごとに計測する（先頭はまとめない設定 max_batch=1）
+
+    Args:
+        windows_ms: 計測する待ち時間（ミリ秒）
+        max_batch: 1回のバッチ判定の最大局面数
+        clients: 同時に問い合わせるクライアント数
+        requests: 1クライアントあたりのリクエスト数
+        evaluator: 'auto'（numpy があれば numpy）/ 'numpy' / 'loop'
+        category: リクエストに使うコーパスのカテゴリ
+
+    Returns:
+        CoalescingResult のリスト
+    """
+    server = load_server()
+    evaluate = _evaluator(server, evaluator)
+    lines = request_lines(load_category(category))
+    settings = [(0.0, 1)] + [(window, max_batch) for window in windows_ms]
+    return [
+        asyncio.run(_measure(server, evaluate, window, batch, clients, requests, lines))
+        for window, batch in settings
+    ]
+
+
+def format_table(results: List[CoalescingResult]) -> str:
+    lines = [
+        f"{'window(ms)':>10} {'max_batch':>9} {'req/sec':>10} {'p50(ms)':>8} "
+        f"{'p99(ms)':>8} {'batch':>7}",
+        "-" * 57,
+    ]
+    for r in results:
+        lines.append(
+            f"{r.window_ms:>10g} {r.max_batch:>9} {r.requests_per_sec:>10,.0f} "
+            f"{r.p50_ms:>8.2f} {r.p99_ms:>8.2f} {r.mean_batch_size:>7.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _floats(value: str) -> List[float]:
+    return [float(item) for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.coalescing",
+        description="vibe_coding の asyncio サーバで、window ごとのスループットとレイテンシを計測する",
+    )
+    parser.add_argument("--windows", type=_floats, default=DEFAULT_WINDOWS_MS,
+                        help="計測する待ち時間（ミリ秒、カンマ区切り、既定: 0,0.5,1,2,5）")
+    parser.add_argument("--max-batch", type=int, default=256, help="最大バッチ（既定: 256）")
+    parser.add_argument("--clients", type=int, default=64, help="同時クライアント数（既定: 64）")
+    parser.add_argument("--requests", type=int, default=50,
+                        help="1クライアントあたりのリクエスト数（既定: 50）")
+    parser.add_argument("--evaluator", choices=["auto", "numpy", "loop"], default="auto",
+                        help="バッチ判定の方法（既定: numpy があれば numpy）")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力する")
+    args = parser.parse_args(argv)
+
+    results = run_sweep(args.windows, args.max_batch, args.clients, args.requests, args.evaluator)
+
+    if args.json:
+        json.dump(
+            [{**r._asdict(), "requests_per_sec": r.requests_per_sec} for r in results],
+            sys.stdout, indent=2,
+        )
+        sys.stdout.write("\n")
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+ベンチマーク用の局面コーパス
+
+benchmarks/data/ に置いた固定の局面ファイルを読み込む。
+ファイルは各アプローチ共通の入力形式（盤面8行 + 手番1行）で、
+局面の間の空行と '#' で始まるコメント行は読み飛ばす。
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+# コーパスのカテゴリ（data/<カテゴリ>.txt に対応）
+CATEGORIES: Tuple[str, ...] = ("opening", "midgame", "endgame", "pathological")
+
+
+class Position(NamedTuple):
+    """1つの局面（盤面8行と手番）"""
+
+    rows: Tuple[str, ...]
+    player: str
+
+    def grid(self) -> List[List[str]]:
+        """盤面を2次元リストで返す（呼び出しごとに新しいリスト）"""
+        return [list(row) for row in self.rows]
+
+    def to_text(self) -> str:
+        """入力形式（盤面8行 + 手番1行）の文字列にする"""
+        return "\n".join(self.rows) + "\n" + self.player + "\n"
+
+
+def parse_positions(lines: Iterable[str]) -> Iterator[Position]:
+    """
+    入力形式の行から局面を順に取り出す
+
+    Args:
+        lines: 入力形式の行（空行・コメント行を含んでよい）
+
+    Yields:
+        Position: 局面
+
+    Raises:
+        ValueError: 末尾の局面が9行に満たない場合
+    """
+    record: List[str] = []
+    for line in lines:
+        line = line.strip()
+        if not record and (not line or line.startswith("#")):
+            continue
+        record.append(line)
+        if len(record) == 9:
+            yield Position(tuple(record[:8]), record[8])
+            record = []
+    if record:
+        raise ValueError(f"末尾の局面が9行に満たない（{len(record)}行）")
+
+
+def load_category(category: str) -> List[Position]:
+    """
+    カテゴリの局面ファイルを読み込む
+
+    Args:
+        category: CATEGORIES のいずれか
+
+    Returns:
+        局面のリスト（ファイル内の順）
+    """
+    if category not in CATEGORIES:
+        raise ValueError(f"不明なカテゴリ: {category}")
+    with open(DATA_DIR / f"{category}.txt", encoding="utf-8") as f:
+        return list(parse_positions(f))
+
+
+def load_corpus(categories: Iterable[str] = CATEGORIES) -> Dict[str, List[Position]]:
+    """
+    複数カテゴリの局面をまとめて読み込む
+
+    Args:
+        categories: 読み込むカテゴリ
+
+    Returns:
+        カテゴリ名から局面リストへの辞書
+    """
+    return {category: load_category(category) for category in categories}
@@ -0,0 +1,172 @@
+"""
+各アプローチの合法手計算をそろえて呼び出すためのアダプタ
+
+各アプローチはそれぞれ独立したディレクトリで、同名のモジュール
+（reversi.py など）を持つため、ファイルパスを指定して別名で読み込む。
+
+Engine は次の3つの関数の組:
+- prepare: 局面をアプローチ固有の入力に変換する（計測対象外）
+- run: アプローチの中核関数を呼ぶ（計測対象）
+- to_moves: run の結果を [(row, col), ...]（昇順）にそろえる
+"""
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from benchmarks.corpus import Position
+
+
+APPROACHES_DIR = Path(__file__).resolve().parent.parent / "approaches"
+
+Moves = List[Tuple[int, int]]
+
+
+class Engine(NamedTuple):
+    """アプローチの合法手計算を共通の形で呼び出すためのアダプタ"""
+
+    name: str
+    description: str
+    prepare: Callable[[Position], Tuple[Any, ...]]
+    run: Callable[..., Any]
+    to_moves: Callable[[Any], Moves]
+
+    def legal_moves(self, position: Position) -> Moves:
+        """局面の合法手を昇順のリストで返す"""
+        return self.to_moves(self.run(*self.prepare(position)))
+
+
+def add_approach_to_path(approach: str) -> None:
+    """アプローチのディレクトリを sys.path に追加する（内部の import 用）"""
+    directory = str(APPROACHES_DIR / approach)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+
+def load_approach_file(approach: str, filename: str) -> ModuleType:
+    """
+    アプローチのファイルを '<アプローチ名>_<ファイル名>' という名前で読み込む
+
+    同名ファイル（reversi.py など）が複数のアプローチにあるため、
+    通常の import ではなくファイルパスを指定する。
+    ワーカープロセスへ関数を渡せるよう sys.modules にも登録する。
+    """
+    module_name = f"{approach}_{Path(filename).stem}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(
+        module_name, APPROACHES_DIR / approach / filename
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _sorted_moves(moves: Moves) -> Moves:
+    return sorted(moves)
+
+
+def _plan_driven() -> Engine:
+    add_approach_to_path("plan_driven")
+    board = importlib.import_module("domain.board")
+    game_rules = importlib.import_module("domain.game_rules")
+
+    def prepare(position: Position) -> Tuple[Any, ...]:
+        return game_rules.GameRules(board.Board(position.grid())), position.player
+
+    return Engine(
+        name="plan_driven",
+        description="GameRules.find_all_legal_moves",
+        prepare=prepare,
+        run=game_rules.GameRules.find_all_legal_moves,
+        to_moves=_sorted_moves,
+    )
+
+
+def _spec_driven() -> Engine:
+    reversi_core = load_approach_file("spec_driven", "reversi_core.py")
+
+    def prepare(position: Position) -> Tuple[Any, ...]:
+        return position.grid(), position.player
+
+    return Engine(
+        name="spec_driven",
+        description="reversi_core.find_legal_moves",
+        prepare=prepare,
+        run=reversi_core.find_legal_moves,
+        to_moves=_sorted_moves,
+    )
+
+
+def _tdd_ai_assisted() -> Engine:
+    add_approach_to_path("tdd_ai_assisted")
+    board = importlib.import_module("board")
+    calculator = importlib.import_module("legal_move_calculator")
+
+    def prepare(position: Position) -> Tuple[Any, ...]:
+        stone = board.Stone.BLACK if position.player == "B" else board.Stone.WHITE
+        return board.Board("\n".join(position.rows)), stone
+
+    def to_moves(result: str) -> Moves:
+        # 最終行は手番なので除き、'0' がマークされたマスを拾う
+        rows = result.split("\n")[:-1]
+        return [
+            (row, col)
+            for row, line in enumerate(rows)
+            for col, cell in enumerate(line)
+            if cell == calculator.LegalMoveCalculator.LEGAL_MOVE_MARK
+        ]
+
+    return Engine(
+        name="tdd_ai_assisted",
+        description="LegalMoveCalculator.calculate",
+        prepare=prepare,
+        run=calculator.LegalMoveCalculator.calculate,
+        to_moves=to_moves,
+    )
+
+
+def _vibe_coding() -> Engine:
+    reversi = load_approach_file("vibe_coding", "reversi.py")
+
+    def prepare(position: Position) -> Tuple[Any, ...]:
+        return position.grid(), position.player
+
+    return Engine(
+        name="vibe_coding",
+        description="reversi.find_legal_moves",
+        prepare=prepare,
+        run=reversi.find_legal_moves,
+        to_moves=_sorted_moves,
+    )
+
+
+# エンジン名からアダプタを作る関数への対応表
+# 読み込みはエンジンを使うときまで遅らせる
+ENGINE_FACTORIES: Dict[str, Callable[[], Engine]] = {
+    "plan_driven": _plan_driven,
+    "spec_driven": _spec_driven,
+    "tdd_ai_assisted": _tdd_ai_assisted,
+    "vibe_coding": _vibe_coding,
+}
+
+
+def load_engine(name: str) -> Engine:
+    """
+    名前を指定してエンジンを読み込む
+
+    Args:
+        name: ENGINE_FACTORIES のキー
+
+    Returns:
+        Engine
+    """
+    if name not in ENGINE_FACTORIES:
+        raise ValueError(
+            f"不明なエンジン: {name}（{', '.join(ENGINE_FACTORIES)} から選択）"
+        )
+    return ENGINE_FACTORIES[name]()
@@ -0,0 +1,216 @@
+"""
+tdd_ai_assisted の合法手計算: 全マス走査とフロンティアの比較（ボードの大きさ別）
+
+正方形のボードの中央に初期配置の4石を置き、乱数で決まった手数だけ対局を進めた局面で
+- scan: LegalMoveCalculator.calculate(board, turn)（空きマスをすべて調べる）
+- calculate: LegalMoveCalculator.calculate(board, turn, use_frontier=True)
+  （呼び出しのたびに Frontier.from_array で盤面全体から Frontier を作り直す）
+- frontier: 対局しながら差分更新してきた Frontier の legal_moves
+- update: その Frontier に1手打つ（Frontier.play）のにかかる時間（対局中の平均）
+の1回あたりの時間を計測する。scan と calculate は文字列の変換も含めた呼び出し全体の時間で、
+どちらも面積に比例する。石の数はボードの大きさによらずほぼ同じなので、
+Frontier を持ち続ける場合（frontier + update）だけがほぼ一定になる。
+
+計測の前に、3つの方法の合法手が一致することを確認する。
+
+使い方:
+    python -m benchmarks.frontier [--sizes 8,32,100,300] [--moves 60]
+                                  [--repeat 5] [--seed 0] [--json]
+"""
+
+import argparse
+import importlib
+import json
+import random
+import sys
+import time
+from types import ModuleType
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from benchmarks.engines import add_approach_to_path
+
+
+DEFAULT_SIZES = [8, 32, 100, 300]
+
+
+class FrontierResult(NamedTuple):
+    """1つの大きさの計測結果"""
+
+    size: int
+    stones: int
+    candidates: int
+    legal_moves: int
+    scan_ms: float
+    calculate_ms: float
+    frontier_ms: float
+    update_ms: float
+
+    @property
+    def speedup(self) -> float:
+        """calculate(use_frontier=True) の scan に対する速度比"""
+        return self.scan_ms / self.calculate_ms if self.calculate_ms else 0.0
+
+    @property
+    def persistent_speedup(self) -> float:
+        """差分更新する Frontier（legal_moves + play）の scan に対する速度比"""
+        per_move = self.frontier_ms + self.update_ms
+        return self.scan_ms / per_move if per_move else 0.0
+
+
+def _load() -> Tuple[ModuleType, ModuleType, ModuleType]:
+    add_approach_to_path("tdd_ai_assisted")
+    return (
+        importlib.import_module("board"),
+        importlib.import_module("legal_move_calculator"),
+        importlib.import_module("frontier"),
+    )
+
+
+def build_position(size: int, moves: int, seed: int = 0, plays: Optional[List[float]] = None):
+    """
+    size x size のボードで、中央の4石から moves 手だけ乱数で対局を進める
+
+    Args:
+        size: ボードの一辺（2以上）
+        moves: 進める手数（両者に合法手がなくなったらそこで止める）
+        seed: 乱数の種
+        plays: 指定すると、Frontier.play 1回ごとの秒数を追加する
+
+    Returns:
+        (Frontier, 手番の Stone)
+    """
+    board, _, frontier_module = _load()
+    Stone = board.Stone
+    frontier = frontier_module.Frontier(size, size)
+    center = size // 2
+    frontier.place(center - 1, center - 1, "W")
+    frontier.place(center, center - 1, "B")
+    frontier.place(center - 1, center, "B")
+    frontier.place(center, center, "W")
+
+    rng = random.Random(seed)
+    turn = Stone.BLACK
+    passes = 0
+    for _ in range(moves):
+        legal = frontier.legal_moves(turn)
+        if legal:
+            x, y = rng.choice(legal)
+            start = time.perf_counter()
+            frontier.play(x, y, turn)
+            if plays is not None:
+                plays.append(time.perf_counter() - start)
+            passes = 0
+        else:
+            passes += 1
+            if passes == 2:
+                break
+        turn = Stone.WHITE if turn == Stone.BLACK else Stone.BLACK
+    return frontier, turn
+
+
+def _best_ms(function: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def measure(size: int, moves: int = 60, repeat: int = 5, seed: int = 0) -> FrontierResult:
+    """
+    1つの大きさについて scan・calculate・frontier を計測する
+
+    Args:
+        size: ボードの一辺
+        moves: 計測する局面までに進める手数
+        repeat: くり返し回数（最速の回を採用）
+        seed: 乱数の種
+
+    Returns:
+        FrontierResult
+
+    Raises:
+        AssertionError: 3つの方法の合法手が一致しない場合
+    """
+    board_module, calculator, _ = _load()
+    LegalMoveCalculator = calculator.LegalMoveCalculator
+    plays: List[float] = []
+    frontier, turn = build_position(size, moves, seed, plays)
+    board = board_module.Board(board_module.Board.array_to_string(frontier.to_array()))
+
+    scanned = LegalMoveCalculator.calculate(board, turn)
+    assert LegalMoveCalculator.calculate(board, turn, use_frontier=True) == scanned, \
+        f"{size}x{size}: calculate(use_frontier=True) != calculate()"
+    marked = [
+        (x, y)
+        for y, row in enumerate(scanned.split("\n")[:-1])
+        for x, cell in enumerate(row)
+        if cell == LegalMoveCalculator.LEGAL_MOVE_MARK
+    ]
+    legal = frontier.legal_moves(turn)
+    assert marked == legal, f"{size}x{size}: {marked} != {legal}"
+
+    return FrontierResult(
+        size=size,
+        stones=frontier.stone_count,
+        candidates=len(frontier.candidates(turn)),
+        legal_moves=len(legal),
+        scan_ms=_best_ms(lambda: LegalMoveCalculator.calculate(board, turn), repeat),
+        calculate_ms=_best_ms(
+            lambda: LegalMoveCalculator.calculate(board, turn, use_frontier=True), repeat),
+        frontier_ms=_best_ms(lambda: frontier.legal_moves(turn), repeat),
+        update_ms=sum(plays) / len(plays) * 1e3 if plays else 0.0,
+    )
+
+
+def run(sizes: List[int], moves: int = 60, repeat: int = 5, seed: int = 0) -> List[FrontierResult]:
+    """大きさごとに measure する"""
+    return [measure(size, moves, repeat, seed) for size in sizes]
+
+
+def format_table(results: List[FrontierResult]) -> str:
+    lines = [
+        f"{'size':>10} {'stones':>7} {'cand':>6} {'legal':>6} {'scan(ms)':>10} "
+        f"{'calculate(ms)':>14} {'speedup':>8} {'frontier(ms)':>13} {'update(ms)':>11} "
+        f"{'speedup':>9}",
+        "-" * 104,
+    ]
+    for r in results:
+        lines.append(
+            f"{f'{r.size}x{r.size}':>10} {r.stones:>7} {r.candidates:>6} {r.legal_moves:>6} "
+            f"{r.scan_ms:>10.3f} {r.calculate_ms:>14.3f} {r.speedup:>7.1f}x "
+            f"{r.frontier_ms:>13.3f} {r.update_ms:>11.3f} {r.persistent_speedup:>8.1f}x"
+        )
+    return "\n".join(lines)
+
+
+def _ints(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.frontier",
+        description="tdd_ai_assisted の合法手計算を、全マス走査とフロンティアで比較する",
+    )
+    parser.add_argument("--sizes", type=_ints, default=DEFAULT_SIZES,
+                        help="ボードの一辺（カンマ区切り、既定: 8,32,100,300）")
+    parser.add_argument("--moves", type=int, default=60, help="進める手数（既定: 60）")
+    parser.add_argument("--repeat", type=int, default=5, help="くり返し回数（既定: 5）")
+    parser.add_argument("--seed", type=int, default=0, help="乱数の種（既定: 0）")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力する")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.moves, args.repeat, args.seed)
+
+    if args.json:
+        json.dump([{**r._asdict(), "speedup": r.speedup, "persistent_speedup": r.persistent_speedup}
+                   for r in results], sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
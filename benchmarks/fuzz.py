@@ -0,0 +1,492 @@
+"""
+アプローチ横断の差分ファジング
+
+乱数で作った局面を全エンジンに通し、合法手がすべて一致することを確認する。
+
+局面の作り方（--kind）:
+- random: 各マスを乱数で '.' / 'B' / 'W' にした局面（石の密度も局面ごとに乱数）。
+  実戦では現れない局面（孤立した石、片方の色だけなど）も含む
+- reachable: 初期配置から乱数で手を選んで対局を進めた途中の局面（実戦で現れる局面）
+- mixed: 上の2つを半分ずつ（既定）
+
+局面は「チャンク」（既定 2000 局面）単位でワーカープロセスに割り当てる。
+チャンクの局面は (--seed, チャンク番号) だけで決まるので、同じ設定なら同じ局面を調べる。
+不一致が見つかったらそこで止め、不一致が残る範囲で石を1つずつ取り除いて
+局面を小さくしたもの（最小化した再現局面）を表示する。
+
+使い方:
+    python -m benchmarks.fuzz [--positions 1000000] [--workers 8] [--chunk 2000]
+                              [--kind mixed|random|reachable] [--seed 0]
+                              [--engines plan_driven,spec_driven,...] [--json]
+"""
+
+import argparse
+import concurrent.futures
+import importlib
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+from typing import (
+    Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union,
+)
+
+from benchmarks.corpus import Position
+from benchmarks.engines import (
+    ENGINE_FACTORIES,
+    Engine,
+    Moves,
+    add_approach_to_path,
+    load_approach_file,
+    load_engine,
+)
+
+
+KINDS: Tuple[str, ...] = ("mixed", "random", "reachable")
+
+DEFAULT_CHUNK = 2000
+
+
+def _plan_driven_scan() -> Engine:
+    """GameRules.is_legal_move を64マスに呼ぶ（ビットボードを使わない）版"""
+    engine = load_engine("plan_driven")
+
+    def run(rules, player: str) -> Moves:
+        return [(r, c) for r in range(8) for c in range(8) if rules.is_legal_move(r, c, player)]
+
+    return engine._replace(
+        name="plan_driven_scan", description="GameRules.is_legal_move x 64", run=run,
+    )
+
+
+def _tdd_frontier() -> Engine:
+    """LegalMoveCalculator.calculate(use_frontier=True)"""
+    engine = load_engine("tdd_ai_assisted")
+    calculator = importlib.import_module("legal_move_calculator").LegalMoveCalculator
+
+    def run(board, turn) -> str:
+        return calculator.calculate(board, turn, use_frontier=True)
+
+    return engine._replace(
+        name="tdd_frontier", description="LegalMoveCalculator.calculate(use_frontier=True)",
+        run=run,
+    )
+
+
+class BatchEngine(NamedTuple):
+    """局面をまとめて判定するエンジン（チャンクの局面を1回で判定する）"""
+
+    name: str
+    description: str
+    legal_moves_many: Callable[[Sequence[Position]], List[Moves]]
+
+
+def _vibe_batch() -> BatchEngine:
+    """vibe_coding の numpy 一括判定（numpy が必要）"""
+    add_approach_to_path("vibe_coding")
+    batch = load_approach_file("vibe_coding", "batch.py")
+
+    def legal_moves_many(positions: Sequence[Position]) -> List[Moves]:
+        masks = batch.find_legal_moves_batch(
+            [position.grid() for position in positions],
+            [position.player for position in positions],
+        )
+        return [[divmod(int(i), 8) for i in mask.nonzero()[0]] for mask in masks]
+
+    return BatchEngine(
+        name="vibe_batch",
+        description="batch.find_legal_moves_batch",
+        legal_moves_many=legal_moves_many,
+    )
+
+
+# ファジングで使えるエンジン（ベンチマークのエンジン + 別の計算方法）
+FUZZ_ENGINE_FACTORIES: Dict[str, Callable[[], Union[Engine, BatchEngine]]] = {
+    **ENGINE_FACTORIES,
+    "plan_driven_scan": _plan_driven_scan,
+    "tdd_frontier": _tdd_frontier,
+    "vibe_batch": _vibe_batch,
+}
+
+
+def load_fuzz_engine(name: str) -> Union[Engine, BatchEngine]:
+    """
+    名前を指定してファジング用のエンジンを読み込む
+
+    Args:
+        name: FUZZ_ENGINE_FACTORIES のキー
+
+    Returns:
+        Engine または BatchEngine
+    """
+    if name not in FUZZ_ENGINE_FACTORIES:
+        raise ValueError(
+            f"不明なエンジン: {name}（{', '.join(FUZZ_ENGINE_FACTORIES)} から選択）"
+        )
+    return FUZZ_ENGINE_FACTORIES[name]()
+
+
+def default_engine_names() -> List[str]:
+    """既定で使うエンジン（vibe_batch は numpy があるときだけ）"""
+    names = list(FUZZ_ENGINE_FACTORIES)
+    if importlib.util.find_spec("numpy") is None:
+        names.remove("vibe_batch")
+    return names
+
+
+class Mismatch(NamedTuple):
+    """エンジン間で合法手が一致しなかった局面"""
+
+    position: Position
+    results: Dict[str, Moves]
+
+    def describe(self) -> str:
+        lines = [self.position.to_text().rstrip("\n")]
+        lines += [f"{name}: {moves}" for name, moves in self.results.items()]
+        return "\n".join(lines)
+
+
+class FuzzResult(NamedTuple):
+    """ファジングの結果"""
+
+    engines: List[str]
+    kind: str
+    checked: int
+    seconds: float
+    workers: int
+    mismatch: Optional[Mismatch]
+    minimized: Optional[Mismatch]
+
+    @property
+    def positions_per_sec(self) -> float:
+        return self.checked / self.seconds if self.seconds else 0.0
+
+
+def _bitboard():
+    add_approach_to_path("plan_driven")
+    return importlib.import_module("domain.bitboard")
+
+
+def _to_position(cells: str, player: str) -> Position:
+    return Position(tuple(cells[i:i + 8] for i in range(0, 64, 8)), player)
+
+
+def random_positions(rng: random.Random) -> Iterator[Position]:
+    """各マスを乱数で決めた局面を限りなく返す"""
+    while True:
+        density = rng.random()
+        empty = 1.0 - density
+        stone = density / 2
+        cells = "".join(rng.choices(".BW", weights=(empty, stone, stone), k=64))
+        yield _to_position(cells, rng.choice("BW"))
+
+
+def reachable_positions(rng: random.Random) -> Iterator[Position]:
+    """初期配置から乱数で対局を進め、途中の局面（手番側から見た局面）を限りなく返す"""
+    bitboard = _bitboard()
+    legal_moves_mask = bitboard.legal_moves_mask
+    flips_mask = bitboard.flips_mask
+    while True:
+        # 初期配置: (3, 3) と (4, 4) が白、(3, 4) と (4, 3) が黒
+        own, other = (1 << 28) | (1 << 35), (1 << 27) | (1 << 36)
+        black_to_move = True
+        passes = 0
+        while passes < 2:
+            black, white = (own, other) if black_to_move else (other, own)
+            yield _to_position(bitboard.to_cells(black, white), "B" if black_to_move else "W")
+            moves = legal_moves_mask(own, other)
+            if moves:
+                squares = [i for i in range(64) if moves >> i & 1]
+                square = rng.choice(squares)
+                flips = flips_mask(own, other, square)
+                own |= flips | (1 << square)
+                other &= ~flips
+                passes = 0
+            else:
+                passes += 1
+            own, other = other, own
+            black_to_move = not black_to_move
+
+
+def generate_positions(kind: str, seed: int, chunk_index: int, count: int) -> List[Position]:
+    """
+    チャンク1つ分の局面を作る（(seed, chunk_index) が同じなら同じ局面）
+
+    Args:
+        kind: KINDS のいずれか
+        seed: 乱数の種
+        chunk_index: チャンク番号
+        count: 局面数
+
+    Returns:
+        局面のリスト
+    """
+    if kind not in KINDS:
+        raise ValueError(f"不明な種類: {kind}（{', '.join(KINDS)} から選択）")
+    rng = random.Random(f"{seed}:{chunk_index}")
+    if kind == "random":
+        sources = [random_positions(rng)]
+    elif kind == "reachable":
+        sources = [reachable_positions(rng)]
+    else:
+        sources = [random_positions(rng), reachable_positions(rng)]
+    return [next(sources[i % len(sources)]) for i in range(count)]
+
+
+AnyEngine = Union[Engine, BatchEngine]
+
+
+def _error_result(error: Exception) -> Moves:
+    return [("error", repr(error))]
+
+
+def _legal_moves_many(engine: AnyEngine, positions: Sequence[Position]) -> List[Moves]:
+    """
+    エンジンで局面ごとの合法手（昇順）を求める
+
+    例外を送出した場合は、例外の内容を結果として記録する（不一致として扱う）。
+    """
+    if isinstance(engine, BatchEngine):
+        try:
+            return [sorted(moves) for moves in engine.legal_moves_many(positions)]
+        except Exception as error:
+            return [_error_result(error)] * len(positions)
+    results = []
+    for position in positions:
+        try:
+            results.append(sorted(engine.legal_moves(position)))
+        except Exception as error:
+            results.append(_error_result(error))
+    return results
+
+
+def first_mismatch(engines: Sequence[AnyEngine],
+                   positions: Sequence[Position]) -> Tuple[int, Optional[Mismatch]]:
+    """
+    局面を全エンジンに通し、最初に一致しなかった局面を返す
+
+    Args:
+        engines: 比較するエンジン
+        positions: 局面
+
+    Returns:
+        (調べた局面数, 最初の不一致)。すべて一致すれば (局面数, None)
+    """
+    columns = {engine.name: _legal_moves_many(engine, positions) for engine in engines}
+    for index, position in enumerate(positions):
+        results = {name: column[index] for name, column in columns.items()}
+        values = list(results.values())
+        if any(value != values[0] for value in values[1:]):
+            return index + 1, Mismatch(position, results)
+    return len(positions), None
+
+
+def find_mismatch(engines: Sequence[AnyEngine], position: Position) -> Optional[Mismatch]:
+    """1局面を全エンジンに通し、一致しなければ Mismatch を返す"""
+    return first_mismatch(engines, [position])[1]
+
+
+def minimize(engines: Sequence[AnyEngine], mismatch: Mismatch) -> Mismatch:
+    """
+    不一致が残る範囲で石を取り除き、局面を小さくする
+
+    石を1つずつ '.' にしてみて、不一致が続けばそのまま取り除く。
+    どの石も取り除けなくなるまでくり返す。
+
+    Args:
+        engines: エンジン
+        mismatch: 見つかった不一致
+
+    Returns:
+        最小化した不一致（取り除ける石がなければ元のまま）
+    """
+    current = mismatch
+    changed = True
+    while changed:
+        changed = False
+        cells = "".join(current.position.rows)
+        for index in range(64):
+            if cells[index] == ".":
+                continue
+            candidate = cells[:index] + "." + cells[index + 1:]
+            smaller = find_mismatch(engines, _to_position(candidate, current.position.player))
+            if smaller is not None:
+                current = smaller
+                cells = candidate
+                changed = True
+    return current
+
+
+# ワーカープロセスごとに読み込んだエンジン
+_worker_engines: List[AnyEngine] = []
+
+
+def _init_worker(names: Sequence[str]) -> None:
+    global _worker_engines
+    _worker_engines = [load_fuzz_engine(name) for name in names]
+
+
+def _check_chunk(kind: str, seed: int, chunk_index: int,
+                 count: int) -> Tuple[int, Optional[Mismatch]]:
+    """チャンクを調べ、(調べた局面数, 最初の不一致) を返す"""
+    return first_mismatch(_worker_engines, generate_positions(kind, seed, chunk_index, count))
+
+
+def _chunks(positions: int, chunk: int) -> Iterator[Tuple[int, int]]:
+    for index, start in enumerate(range(0, positions, chunk)):
+        yield index, min(chunk, positions - start)
+
+
+def run_fuzz(engine_names: Sequence[str], positions: int, workers: int = 1,
+             chunk: int = DEFAULT_CHUNK, kind: str = "mixed", seed: int = 0,
+             progress: Optional[Callable[[int, float], None]] = None) -> FuzzResult:
+    """
+    全エンジンで合法手が一致するかを調べる
+
+    Args:
+        engine_names: 比較するエンジン（2つ以上）
+        positions: 調べる局面数
+        workers: ワーカープロセス数（1ならこのプロセスで調べる）
+        chunk: 1回にワーカーへ渡す局面数
+        kind: 局面の作り方（KINDS）
+        seed: 乱数の種
+        progress: チャンクが終わるたびに (調べた局面数, 経過秒) で呼ばれる関数
+
+    Returns:
+        FuzzResult（不一致があれば mismatch と minimized が入る）
+    """
+    if len(engine_names) < 2:
+        raise ValueError("比較には2つ以上のエンジンが必要")
+    if kind not in KINDS:
+        raise ValueError(f"不明な種類: {kind}（{', '.join(KINDS)} から選択）")
+
+    checked = 0
+    mismatch: Optional[Mismatch] = None
+    start = time.perf_counter()
+    if workers <= 1:
+        _init_worker(engine_names)
+        for index, count in _chunks(positions, chunk):
+            done, mismatch = _check_chunk(kind, seed, index, count)
+            checked += done
+            if progress:
+                progress(checked, time.perf_counter() - start)
+            if mismatch is not None:
+                break
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(list(engine_names),)
+        ) as pool:
+            pending = {
+                pool.submit(_check_chunk, kind, seed, index, count)
+                for index, count in _chunks(positions, chunk)
+            }
+            try:
+                for future in concurrent.futures.as_completed(pending):
+                    done, mismatch = future.result()
+                    checked += done
+                    if progress:
+                        progress(checked, time.perf_counter() - start)
+                    if mismatch is not None:
+                        break
+            finally:
+                for future in pending:
+                    future.cancel()
+    seconds = time.perf_counter() - start
+
+    minimized = None
+    if mismatch is not None:
+        minimized = minimize([load_fuzz_engine(name) for name in engine_names], mismatch)
+    return FuzzResult(
+        engines=list(engine_names),
+        kind=kind,
+        checked=checked,
+        seconds=seconds,
+        workers=max(1, workers),
+        mismatch=mismatch,
+        minimized=minimized,
+    )
+
+
+def format_result(result: FuzzResult) -> str:
+    lines = [
+        f"engines:   {', '.join(result.engines)}",
+        f"kind:      {result.kind}",
+        f"workers:   {result.workers}",
+        f"checked:   {result.checked:,} positions in {result.seconds:.2f}s "
+        f"({result.positions_per_sec:,.0f} positions/sec)",
+    ]
+    if result.mismatch is None:
+        lines.append("result:    all engines agree")
+    else:
+        lines.append("result:    MISMATCH")
+        lines.append("")
+        lines.append("# 見つかった局面")
+        lines.append(result.mismatch.describe())
+        lines.append("")
+        lines.append("# 最小化した再現局面")
+        lines.append(result.minimized.describe())
+    return "\n".join(lines)
+
+
+def _names(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.fuzz",
+        description="乱数の局面で、全エンジンの合法手が一致するかを調べる",
+    )
+    parser.add_argument("--engines", type=_names, default=None,
+                        help=f"比較するエンジン（カンマ区切り、{', '.join(FUZZ_ENGINE_FACTORIES)}）")
+    parser.add_argument("--positions", type=int, default=1_000_000,
+                        help="調べる局面数（既定: 1000000）")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="ワーカープロセス数（既定: CPU 数）")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK,
+                        help=f"1回にワーカーへ渡す局面数（既定: {DEFAULT_CHUNK}）")
+    parser.add_argument("--kind", choices=KINDS, default="mixed", help="局面の作り方（既定: mixed）")
+    parser.add_argument("--seed", type=int, default=0, help="乱数の種（既定: 0）")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力する")
+    args = parser.parse_args(argv)
+
+    def progress(checked: int, seconds: float) -> None:
+        rate = checked / seconds if seconds else 0.0
+        sys.stderr.write(f"\r{checked:,}/{args.positions:,} ({rate:,.0f} positions/sec)")
+        sys.stderr.flush()
+
+    result = run_fuzz(
+        args.engines or default_engine_names(), args.positions, args.workers,
+        args.chunk, args.kind, args.seed, progress=None if args.json else progress,
+    )
+    if not args.json:
+        sys.stderr.write("\n")
+
+    if args.json:
+        payload = {
+            "engines": result.engines,
+            "kind": result.kind,
+            "workers": result.workers,
+            "checked": result.checked,
+            "seconds": result.seconds,
+            "positions_per_sec": result.positions_per_sec,
+            "mismatch": None,
+        }
+        if result.mismatch is not None:
+            payload["mismatch"] = {
+                "found": result.mismatch.position.to_text(),
+                "minimized": result.minimized.position.to_text(),
+                "results": {name: [list(m) for m in moves]
+                            for name, moves in result.minimized.results.items()},
+            }
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(format_result(result))
+    return 1 if result.mismatch is not None else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+パスの判定: 全合法手の列挙と has_any_legal_move（最初の1手で打ち切る）の比較
+
+コーパスの各局面について、黒と白の両方で「合法手が1つでもあるか」を
+- enumerate: 全合法手を列挙して空かどうかを見る（従来の方法）
+- probe: has_any_legal_move（フロンティアから調べ、最初に見つかった時点で打ち切る）
+で判定し、1回の判定あたりの時間（µs）と速度比を報告する。
+
+対象は plan_driven（GameRules）と spec_driven（reversi_core）。
+盤面オブジェクトの生成は計測に含めない。
+計測の前に、両者の判定がすべての局面で一致することを確認する。
+
+使い方:
+    python -m benchmarks.has_any_move [--categories midgame,endgame]
+                                      [--approaches plan_driven,spec_driven]
+                                      [--repeat 5] [--json]
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from benchmarks.corpus import Position, load_category
+from benchmarks.engines import add_approach_to_path, load_approach_file
+
+
+DEFAULT_CATEGORIES = ["midgame", "endgame", "pathological"]
+
+# アプローチごとの (局面から引数を作る関数, enumerate, probe)
+Probe = Tuple[Callable[[Position, str], Tuple[Any, ...]],
+              Callable[..., bool], Callable[..., bool]]
+
+
+class HasAnyMoveResult(NamedTuple):
+    """1つのアプローチ・カテゴリの計測結果"""
+
+    approach: str
+    category: str
+    checks: int
+    without_moves: int
+    enumerate_us: float
+    probe_us: float
+
+    @property
+    def speedup(self) -> float:
+        return self.enumerate_us / self.probe_us if self.probe_us else 0.0
+
+
+def _plan_driven() -> Probe:
+    add_approach_to_path("plan_driven")
+    Board = importlib.import_module("domain.board").Board
+    GameRules = importlib.import_module("domain.game_rules").GameRules
+
+    def prepare(position: Position, player: str) -> Tuple[Any, ...]:
+        return GameRules(Board(position.grid())), player
+
+    def enumerate_moves(rules: Any, player: str) -> bool:
+        return bool(rules.find_all_legal_moves(player))
+
+    return prepare, enumerate_moves, GameRules.has_any_legal_move
+
+
+def _spec_driven() -> Probe:
+    reversi_core = load_approach_file("spec_driven", "reversi_core.py")
+
+    def prepare(position: Position, player: str) -> Tuple[Any, ...]:
+        return position.grid(), player
+
+    def enumerate_moves(grid: Any, player: str) -> bool:
+        return bool(reversi_core.find_legal_moves(grid, player))
+
+    return prepare, enumerate_moves, reversi_core.has_any_legal_move
+
+
+PROBES: Dict[str, Callable[[], Probe]] = {
+    "plan_driven": _plan_driven,
+    "spec_driven": _spec_driven,
+}
+
+
+def _time_per_call(function: Callable[..., bool],
+                   inputs: Sequence[Tuple[Any, ...]], repeat: int) -> float:
+    """inputs 全体を repeat 回まわした中で最速の1回から、1呼び出しあたりの秒数を返す"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in inputs:
+            function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / len(inputs)
+
+
+def run(categories: Sequence[str] = DEFAULT_CATEGORIES,
+        approaches: Sequence[str] = tuple(PROBES),
+        repeat: int = 5) -> List[HasAnyMoveResult]:
+    """
+    アプローチ・カテゴリごとに enumerate と probe を計測する
+
+    Args:
+        categories: 計測するコーパスのカテゴリ
+        approaches: 計測するアプローチ（PROBES のキー）
+        repeat: くり返し回数（最速の回を採用）
+
+    Returns:
+        HasAnyMoveResult のリスト
+
+    Raises:
+        AssertionError: enumerate と probe の判定が一致しない局面がある場合
+    """
+    results = []
+    for approach in approaches:
+        prepare, enumerate_moves, probe = PROBES[approach]()
+        for category in categories:
+            # パスの判定は手番によらず両者について行うので、局面ごとに黒と白の両方を調べる
+            inputs = [prepare(p, player) for p in load_category(category) for player in "BW"]
+            without_moves = 0
+            for args in inputs:
+                expected = enumerate_moves(*args)
+                assert probe(*args) == expected, f"{approach}/{category}: {args[1]}"
+                without_moves += not expected
+            results.append(HasAnyMoveResult(
+                approach=approach,
+                category=category,
+                checks=len(inputs),
+                without_moves=without_moves,
+                enumerate_us=_time_per_call(enumerate_moves, inputs, repeat) * 1e6,
+                probe_us=_time_per_call(probe, inputs, repeat) * 1e6,
+            ))
+    return results
+
+
+def format_table(results: List[HasAnyMoveResult]) -> str:
+    lines = [
+        f"{'approach':<12} {'category':<13} {'checks':>7} {'no-move':>8} "
+        f"{'enumerate(us)':>14} {'probe(us)':>10} {'speedup':>8}",
+        "-" * 78,
+    ]
+    for r in results:
+        lines.append(
+            f"{r.approach:<12} {r.category:<13} {r.checks:>7} {r.without_moves:>8} "
+            f"{r.enumerate_us:>14.2f} {r.probe_us:>10.2f} {r.speedup:>7.1f}x"
+        )
+    return "\n".join(lines)
+
+
+def _names(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.has_any_move",
+        description="パスの判定を、全合法手の列挙と has_any_legal_move で比較する",
+    )
+    parser.add_argument("--categories", type=_names, default=DEFAULT_CATEGORIES,
+                        help="計測するカテゴリ（カンマ区切り、既定: midgame,endgame,pathological）")
+    parser.add_argument("--approaches", type=_names, default=list(PROBES),
+                        help="計測するアプローチ（カンマ区切り、既定: plan_driven,spec_driven）")
+    parser.add_argument("--repeat", type=int, default=5, help="くり返し回数（既定: 5）")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力する")
+    args = parser.parse_args(argv)
+
+    results = run(args.categories, args.approaches, args.repeat)
+
+    if args.json:
+        json.dump([{**r._asdict(), "speedup": r.speedup} for r in results], sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
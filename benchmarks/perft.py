@@ -0,0 +1,355 @@
+"""
+perft（手数 N までの局面木の葉の数え上げ）
+
+指定した局面から深さ N まで全ての手を展開し、葉の数を数える。
+
+局面木のたどり方（mode）:
+- native: エンジン自身の盤面表現で着手・取り消しと合法手の生成を行う（NATIVE_WALKERS）。
+  plan_driven は domain/bitboard.py のビットボード、spec_driven は reversi_core の
+  find_legal_moves / apply_move / undo_move。ノードごとの盤面の変換はない
+- adapter: 着手と取り消しは plan_driven の GameRules.apply_move / undo_move で行い、
+  ノードごとに盤面を Position に変換して benchmarks.engines のアダプタで合法手を求める。
+  native のないエンジン（tdd_ai_assisted / vibe_coding）と --adapter のときに使う。
+  変換（盤面 → Position → エンジンの入力、結果 → 手のリスト）にかかった時間は
+  adapter_seconds として別に報告する
+
+パスの扱い:
+- 手番側に合法手がなく相手にはある場合、パスを1手として数える
+- 両者とも合法手がない（終局）場合、その局面を葉として数える
+
+初期配置からの葉の数は 4, 12, 56, 244, 1396, 8200, 55092, 390216, ...（深さ 1, 2, 3, ...）
+
+使い方:
+    python -m benchmarks.perft --depth 6 [--engines plan_driven,vibe_coding]
+                               [--input board.txt] [--divide] [--adapter]
+"""
+
+import argparse
+import importlib
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from benchmarks.corpus import Position
+from benchmarks.engines import (
+    ENGINE_FACTORIES,
+    Engine,
+    Moves,
+    add_approach_to_path,
+    load_approach_file,
+    load_engine,
+)
+
+
+INITIAL_POSITION = Position(
+    ("........", "........", "........", "...WB...",
+     "...BW...", "........", "........", "........"),
+    "B",
+)
+
+
+class PerftResult(NamedTuple):
+    """1エンジンの perft 結果"""
+
+    engine: str
+    depth: int
+    nodes: int
+    generator_calls: int
+    seconds: float
+    divide: Dict[str, int]
+    mode: str = "adapter"
+    adapter_seconds: float = 0.0
+
+    @property
+    def nodes_per_sec(self) -> float:
+        """1秒あたりに数えた葉の数"""
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    @property
+    def adapter_share(self) -> float:
+        """全体の時間のうち、アダプタでの盤面の変換にかかった割合"""
+        return self.adapter_seconds / self.seconds if self.seconds else 0.0
+
+    @property
+    def calls_per_sec(self) -> float:
+        """1秒あたりの合法手生成の呼び出し回数"""
+        return self.generator_calls / self.seconds if self.seconds else 0.0
+
+
+def _domain() -> Tuple[Any, Any]:
+    """plan_driven の Board と GameRules を読み込む"""
+    add_approach_to_path("plan_driven")
+    board = importlib.import_module("domain.board")
+    game_rules = importlib.import_module("domain.game_rules")
+    return board.Board, game_rules.GameRules
+
+
+def read_position(path: str) -> Position:
+    """
+    plan_driven の InputReader で局面ファイルを読み込む
+
+    Args:
+        path: 入力形式（盤面8行 + 手番1行）のファイル
+
+    Returns:
+        Position
+    """
+    _domain()
+    input_reader = load_approach_file("plan_driven", "io/input_reader.py")
+    with open(path, encoding="utf-8") as f:
+        board, player = input_reader.InputReader().read_from_stream(f)
+    return Position(tuple("".join(row) for row in board.to_grid()), player)
+
+
+def _notation(move: Optional[Tuple[int, int]]) -> str:
+    """手を 'a1' 形式（列 a-h, 行 1-8）で表す。パスは 'pass'"""
+    if move is None:
+        return "pass"
+    row, col = move
+    return f"{'abcdefgh'[col]}{row + 1}"
+
+
+class Walker(NamedTuple):
+    """
+    局面木をたどるための、盤面の状態を閉じ込めた3つの関数の組
+
+    - generate(player): 現在の局面の player の合法手（昇順）
+    - make(row, col, player): 着手し、unmake に渡す値を返す
+    - unmake(token): make を取り消す（make と逆の順に呼ぶ）
+    """
+
+    generate: Callable[[str], Moves]
+    make: Callable[[int, int, str], Any]
+    unmake: Callable[[Any], None]
+
+
+def _plan_driven_walker(position: Position) -> Walker:
+    """plan_driven の domain/bitboard.py で、黒・白のビットボードをその場で更新してたどる"""
+    Board, _ = _domain()
+    bitboard = importlib.import_module("domain.bitboard")
+    legal_moves_mask = bitboard.legal_moves_mask
+    flips_mask = bitboard.flips_mask
+    mask_to_positions = bitboard.mask_to_positions
+    # [黒, 白]
+    discs = list(Board(position.grid()).to_bitboards())
+
+    def generate(player: str) -> Moves:
+        if player == "B":
+            return mask_to_positions(legal_moves_mask(discs[0], discs[1]))
+        return mask_to_positions(legal_moves_mask(discs[1], discs[0]))
+
+    def make(row: int, col: int, player: str) -> Tuple[int, int, int]:
+        own = 0 if player == "B" else 1
+        placed = 1 << (row * 8 + col)
+        flips = flips_mask(discs[own], discs[1 - own], row * 8 + col)
+        discs[own] |= flips | placed
+        discs[1 - own] ^= flips
+        return own, placed, flips
+
+    def unmake(token: Tuple[int, int, int]) -> None:
+        own, placed, flips = token
+        discs[own] ^= flips | placed
+        discs[1 - own] |= flips
+
+    return Walker(generate, make, unmake)
+
+
+def _spec_driven_walker(position: Position) -> Walker:
+    """spec_driven の reversi_core で、2次元リストの盤面をその場で更新してたどる"""
+    reversi_core = load_approach_file("spec_driven", "reversi_core.py")
+    grid = position.grid()
+
+    def generate(player: str) -> Moves:
+        return reversi_core.find_legal_moves(grid, player)
+
+    def make(row: int, col: int, player: str) -> Tuple[int, int, str, Any]:
+        return row, col, player, reversi_core.apply_move(grid, row, col, player)
+
+    def unmake(token: Tuple[int, int, str, Any]) -> None:
+        reversi_core.undo_move(grid, *token)
+
+    return Walker(generate, make, unmake)
+
+
+# エンジン名から、そのエンジン自身の盤面表現でたどる Walker を作る関数への対応表
+NATIVE_WALKERS: Dict[str, Callable[[Position], Walker]] = {
+    "plan_driven": _plan_driven_walker,
+    "spec_driven": _spec_driven_walker,
+}
+
+
+def _adapter_walker(engine: Engine, position: Position,
+                    adapter_seconds: List[float]) -> Walker:
+    """
+    GameRules で着手・取り消しを行い、合法手はノードごとにアダプタ経由で求める
+
+    盤面の変換（prepare / to_moves を含む）にかかった時間を adapter_seconds[0] に足す。
+    """
+    Board, GameRules = _domain()
+    board = Board(position.grid())
+    rules = GameRules(board)
+    perf_counter = time.perf_counter
+
+    def generate(player: str) -> Moves:
+        start = perf_counter()
+        rows = tuple("".join(row) for row in board.to_grid())
+        args = engine.prepare(Position(rows, player))
+        converted = perf_counter()
+        result = engine.run(*args)
+        returned = perf_counter()
+        moves = engine.to_moves(result)
+        adapter_seconds[0] += (converted - start) + (perf_counter() - returned)
+        return moves
+
+    def make(row: int, col: int, player: str) -> Any:
+        return rules.apply_move(row, col, player)
+
+    return Walker(generate, make, rules.undo_move)
+
+
+def perft(
+    engine: Engine,
+    position: Position,
+    depth: int,
+    divide: bool = False,
+    native: bool = True
+) -> PerftResult:
+    """
+    局面から深さ depth までの葉の数を数える
+
+    Args:
+        engine: 合法手の生成に使うエンジン
+        position: 開始局面
+        depth: 展開する手数（0以上）
+        divide: True なら初手ごとの葉の数も返す
+        native: True なら、NATIVE_WALKERS にあるエンジンはエンジン自身の盤面表現でたどる
+
+    Returns:
+        PerftResult
+    """
+    if depth < 0:
+        raise ValueError("depth は0以上を指定してください")
+
+    adapter_seconds = [0.0]
+    if native and engine.name in NATIVE_WALKERS:
+        mode = "native"
+        walker = NATIVE_WALKERS[engine.name](position)
+    else:
+        mode = "adapter"
+        walker = _adapter_walker(engine, position, adapter_seconds)
+    make = walker.make
+    unmake = walker.unmake
+    calls = 0
+
+    def generate(player: str) -> Moves:
+        nonlocal calls
+        calls += 1
+        return walker.generate(player)
+
+    def count(player: str, remaining: int) -> int:
+        if remaining == 0:
+            return 1
+        moves = generate(player)
+        opponent = "W" if player == "B" else "B"
+        if not moves:
+            if not generate(opponent):
+                return 1
+            return count(opponent, remaining - 1)
+        total = 0
+        for row, col in moves:
+            token = make(row, col, player)
+            total += count(opponent, remaining - 1)
+            unmake(token)
+        return total
+
+    per_move: Dict[str, int] = {}
+    start = time.perf_counter()
+    if divide and depth > 0:
+        player = position.player
+        opponent = "W" if player == "B" else "B"
+        moves = generate(player)
+        if moves:
+            for row, col in moves:
+                token = make(row, col, player)
+                per_move[_notation((row, col))] = count(opponent, depth - 1)
+                unmake(token)
+        elif generate(opponent):
+            per_move[_notation(None)] = count(opponent, depth - 1)
+        nodes = sum(per_move.values()) if per_move else 1
+    else:
+        nodes = count(position.player, depth)
+    seconds = time.perf_counter() - start
+
+    return PerftResult(engine.name, depth, nodes, calls, seconds, per_move,
+                       mode, adapter_seconds[0])
+
+
+def run_perft(
+    engines: List[Engine],
+    position: Position,
+    depth: int,
+    divide: bool = False,
+    report: Callable[[str], None] = print,
+    native: bool = True
+) -> List[PerftResult]:
+    """
+    複数のエンジンで perft を実行し、葉の数が一致することを確認する
+
+    Raises:
+        AssertionError: エンジンによって葉の数（または初手ごとの数）が異なる場合
+    """
+    results: List[PerftResult] = []
+    for engine in engines:
+        result = perft(engine, position, depth, divide, native)
+        results.append(result)
+        line = (
+            f"{result.engine:<16} {result.mode:<7} depth={depth} nodes={result.nodes:,} "
+            f"time={result.seconds:.3f}s nodes/sec={result.nodes_per_sec:,.0f} "
+            f"movegen/sec={result.calls_per_sec:,.0f}"
+        )
+        if result.mode == "adapter":
+            line += f" adapter={result.adapter_seconds:.3f}s ({result.adapter_share:.0%})"
+        report(line)
+        for move, nodes in result.divide.items():
+            report(f"  {move}: {nodes:,}")
+
+    reference = results[0]
+    for result in results[1:]:
+        if (result.nodes, result.divide) != (reference.nodes, reference.divide):
+            raise AssertionError(
+                f"perft の結果が一致しない: {reference.engine}={reference.nodes} "
+                f"{result.engine}={result.nodes}"
+            )
+    return results
+
+
+def _split(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.perft",
+        description="局面木の葉を数え、合法手生成の正しさと速度を確かめる",
+    )
+    parser.add_argument("--depth", type=int, default=6, help="展開する手数（既定: 6）")
+    parser.add_argument(
+        "--engines", type=_split, default=["plan_driven"],
+        help=f"使うエンジン（カンマ区切り: {','.join(ENGINE_FACTORIES)}）",
+    )
+    parser.add_argument(
+        "--input", help="開始局面のファイル（省略時は初期配置・黒番）"
+    )
+    parser.add_argument("--divide", action="store_true", help="初手ごとの葉の数も表示する")
+    parser.add_argument(
+        "--adapter", action="store_true",
+        help="native でたどれるエンジンもアダプタ経由で数える（アダプタの負荷の比較用）",
+    )
+    args = parser.parse_args(argv)
+
+    position = read_position(args.input) if args.input else INITIAL_POSITION
+    engines = [load_engine(name) for name in args.engines]
+    run_perft(engines, position, args.depth, args.divide, native=not args.adapter)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+vibe_coding の合法手計算: 1歩ずつ座標を計算する版とレイ表を使う版の比較
+
+- before: 64マスそれぞれについて is_legal_move を呼ぶ
+  （can_flip_in_direction が1歩ごとに座標を足して盤面外チェックする、以前の find_legal_moves）
+- after: reversi.find_legal_moves（盤面を64マスの1次元リストにして RAYS をたどる）
+
+コーパスのカテゴリごとに、1局面あたりの時間（µs）と速度比を報告する。
+計測の前に、両者の結果がすべての局面で一致することを確認する。
+
+使い方:
+    python -m benchmarks.ray_tables [--categories opening,endgame] [--repeat 5] [--json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from types import ModuleType
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from benchmarks.corpus import CATEGORIES, load_category
+from benchmarks.engines import load_approach_file
+
+
+Grid = List[List[str]]
+Moves = List[Tuple[int, int]]
+
+
+class RayTableResult(NamedTuple):
+    """1カテゴリの計測結果"""
+
+    category: str
+    positions: int
+    before_us: float
+    after_us: float
+
+    @property
+    def speedup(self) -> float:
+        return self.before_us / self.after_us if self.after_us else 0.0
+
+
+def stepwise_legal_moves(reversi: ModuleType) -> Callable[[Grid, str], Moves]:
+    """レイ表を使う前の find_legal_moves（is_legal_move を64マスに呼ぶ）を返す"""
+    is_legal_move = reversi.is_legal_move
+
+    def find_legal_moves(board: Grid, player: str) -> Moves:
+        return [
+            (row, col)
+            for row in range(8)
+            for col in range(8)
+            if is_legal_move(board, row, col, player)
+        ]
+
+    return find_legal_moves
+
+
+def _time_per_call(function: Callable[[Grid, str], Moves],
+                   inputs: Sequence[Tuple[Grid, str]], repeat: int) -> float:
+    """inputs 全体を repeat 回まわした中で最速の1回から、1呼び出しあたりの秒数を返す"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for board, player in inputs:
+            function(board, player)
+        best = min(best, time.perf_counter() - start)
+    return best / len(inputs)
+
+
+def run(categories: Sequence[str] = CATEGORIES, repeat: int = 5) -> List[RayTableResult]:
+    """
+    カテゴリごとに before / after を計測する
+
+    Args:
+        categories: 計測するコーパスのカテゴリ
+        repeat: くり返し回数（最速の回を採用）
+
+    Returns:
+        RayTableResult のリスト
+
+    Raises:
+        AssertionError: before と after の結果が一致しない局面がある場合
+    """
+    reversi = load_approach_file("vibe_coding", "reversi.py")
+    before = stepwise_legal_moves(reversi)
+    after = reversi.find_legal_moves
+
+    results = []
+    for category in categories:
+        inputs = [(p.grid(), p.player) for p in load_category(category)]
+        for board, player in inputs:
+            expected = before(board, player)
+            actual = after(board, player)
+            assert actual == expected, f"{category}: {actual} != {expected}"
+        results.append(RayTableResult(
+            category=category,
+            positions=len(inputs),
+            before_us=_time_per_call(before, inputs, repeat) * 1e6,
+            after_us=_time_per_call(after, inputs, repeat) * 1e6,
+        ))
+    return results
+
+
+def format_table(results: List[RayTableResult]) -> str:
+    lines = [
+        f"{'category':<14} {'positions':>9} {'before(us)':>11} {'after(us)':>10} {'speedup':>8}",
+        "-" * 56,
+    ]
+    for r in results:
+        lines.append(
+            f"{r.category:<14} {r.positions:>9} {r.before_us:>11.1f} "
+            f"{r.after_us:>10.1f} {r.speedup:>7.2f}x"
+        )
+    return "\n".join(lines)
+
+
+def _names(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.ray_tables",
+        description="vibe_coding の合法手計算を、レイ表の導入前後で比較する",
+    )
+    parser.add_argument("--categories", type=_names, default=list(CATEGORIES),
+                        help="計測するカテゴリ（カンマ区切り、既定: すべて）")
+    parser.add_argument("--repeat", type=int, default=5, help="くり返し回数（既定: 5）")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力する")
+    args = parser.parse_args(argv)
+
+    results = run(args.categories, args.repeat)
+
+    if args.json:
+        json.dump([{**r._asdict(), "speedup": r.speedup} for r in results], sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+アプローチ横断のベンチマーク
+
+固定コーパスの各局面について、各アプローチの中核関数を計測する。
+
+- ウォームアップの後、コーパス全体を指定回数くり返して1呼び出しずつ計測
+- 局面/秒、p50/p99 レイテンシ、ピークメモリ（tracemalloc）を報告
+- 計測の前に、全エンジンの結果が一致することを確認
+
+使い方:
+    python -m benchmarks [--engines plan_driven,spec_driven]
+                         [--categories opening,endgame]
+                         [--repeat 5] [--warmup 1] [--json]
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from benchmarks.corpus import CATEGORIES, Position, load_corpus
+from benchmarks.engines import ENGINE_FACTORIES, Engine, load_engine
+
+
+class BenchmarkResult(NamedTuple):
+    """1エンジン × 1カテゴリの計測結果"""
+
+    engine: str
+    category: str
+    positions: int
+    calls: int
+    positions_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_memory_bytes: int
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    昇順に並んだ値の q パーセンタイル（最近傍順位法）を返す
+
+    Args:
+        sorted_values: 昇順の値（1つ以上）
+        q: 0〜100
+
+    Returns:
+        パーセンタイル値
+    """
+    if not sorted_values:
+        raise ValueError("値が1つもない")
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+def check_agreement(
+    engines: Sequence[Engine],
+    corpus: Dict[str, List[Position]]
+) -> None:
+    """
+    全エンジンの合法手が全局面で一致することを確認する
+
+    Raises:
+        AssertionError: 結果が異なる局面があった場合
+    """
+    if len(engines) < 2:
+        return
+    reference = engines[0]
+    for category, positions in corpus.items():
+        for index, position in enumerate(positions):
+            expected = reference.legal_moves(position)
+            for engine in engines[1:]:
+                actual = engine.legal_moves(position)
+                if actual != expected:
+                    raise AssertionError(
+                        f"{category}[{index}] で結果が一致しない: "
+                        f"{reference.name}={expected} {engine.name}={actual}\n"
+                        f"{position.to_text()}"
+                    )
+
+
+def _measure_peak_memory(engine: Engine, prepared: List[Tuple[Any, ...]]) -> int:
+    """コーパスを1回処理する間に新たに確保されたメモリのピーク（バイト）"""
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run = engine.run
+        for args in prepared:
+            run(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - baseline)
+
+
+def benchmark(
+    engine: Engine,
+    category: str,
+    positions: List[Position],
+    repeat: int = 5,
+    warmup: int = 1
+) -> BenchmarkResult:
+    """
+    1エンジン × 1カテゴリを計測する
+
+    Args:
+        engine: 計測するエンジン
+        category: カテゴリ名（結果の表示用）
+        positions: 局面のリスト
+        repeat: コーパス全体をくり返す回数
+        warmup: 計測前にコーパス全体を処理する回数
+
+    Returns:
+        BenchmarkResult
+    """
+    # 入力の変換は計測に含めない
+    prepared = [engine.prepare(position) for position in positions]
+    run = engine.run
+    clock = time.perf_counter_ns
+
+    for _ in range(warmup):
+        for args in prepared:
+            run(*args)
+
+    latencies: List[int] = []
+    record = latencies.append
+    for _ in range(repeat):
+        for args in prepared:
+            start = clock()
+            run(*args)
+            record(clock() - start)
+
+    latencies.sort()
+    total_ns = sum(latencies)
+    return BenchmarkResult(
+        engine=engine.name,
+        category=category,
+        positions=len(positions),
+        calls=len(latencies),
+        positions_per_sec=len(latencies) / (total_ns / 1e9) if total_ns else 0.0,
+        p50_us=percentile(latencies, 50) / 1000,
+        p99_us=percentile(latencies, 99) / 1000,
+        peak_memory_bytes=_measure_peak_memory(engine, prepared),
+    )
+
+
+def format_table(results: Sequence[BenchmarkResult]) -> str:
+    """計測結果を表形式の文字列にする"""
+    header = (
+        f"{'engine':<16} {'category':<13} {'pos':>5} {'pos/sec':>12} "
+        f"{'p50(us)':>9} {'p99(us)':>9} {'peak(KiB)':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.engine:<16} {r.category:<13} {r.positions:>5} "
+            f"{r.positions_per_sec:>12,.0f} {r.p50_us:>9.1f} {r.p99_us:>9.1f} "
+            f"{r.peak_memory_bytes / 1024:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _split(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="各アプローチの合法手計算を固定コーパスで計測する",
+    )
+    parser.add_argument(
+        "--engines", type=_split, default=list(ENGINE_FACTORIES),
+        help=f"計測するエンジン（カンマ区切り、既定: {','.join(ENGINE_FACTORIES)}）",
+    )
+    parser.add_argument(
+        "--categories", type=_split, default=list(CATEGORIES),
+        help=f"計測するカテゴリ（カンマ区切り、既定: {','.join(CATEGORIES)}）",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="くり返し回数（既定: 5）")
+    parser.add_argument("--warmup", type=int, default=1, help="ウォームアップ回数（既定: 1）")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力する")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(args.categories)
+    engines = [load_engine(name) for name in args.engines]
+    check_agreement(engines, corpus)
+
+    results = [
+        benchmark(engine, category, positions, args.repeat, args.warmup)
+        for engine in engines
+        for category, positions in corpus.items()
+    ]
+
+    if args.json:
+        json.dump([r._asdict() for r in results], sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(format_table(results))
@@ -0,0 +1,227 @@
+"""
+CLI の起動時間の計測
+
+各アプローチのエントリポイントを1局面ずつ別プロセスで起動し、
+起動から最初の出力が届くまでの時間を計測する。
+あわせて -X importtime の出力から、モジュールの読み込みにかかった時間を集計する。
+
+比較のため、何も import せずに1行出力するだけのインタプリタの起動時間も計測する。
+
+使い方:
+    python -m benchmarks.startup [--approaches plan_driven,spec_driven]
+                                 [--runs 20] [--top 10] [--json]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from benchmarks.engines import APPROACHES_DIR
+from benchmarks.perft import INITIAL_POSITION
+from benchmarks.runner import percentile
+
+
+# アプローチ名と、1局面を標準入力から読むエントリポイント
+ENTRY_POINTS: Dict[str, str] = {
+    "plan_driven": "reversi.py",
+    "spec_driven": "reversi.py",
+    "tdd_ai_assisted": "main.py",
+    "vibe_coding": "reversi.py",
+}
+
+# インタプリタだけの起動時間（比較用）
+BASELINE = "interpreter"
+
+
+class ImportTime(NamedTuple):
+    """-X importtime の1行分"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class StartupResult(NamedTuple):
+    """1エントリポイントの計測結果"""
+
+    name: str
+    runs: int
+    first_output_p50_ms: float
+    first_output_min_ms: float
+    import_total_ms: float
+    modules: int
+    top_imports: List[ImportTime]
+
+
+def parse_importtime(stderr: str) -> List[ImportTime]:
+    """
+    -X importtime の出力を解析する
+
+    各行は 'import time: <自身(us)> | <累積(us)> | <字下げ><モジュール名>'。
+    見出し行やそれ以外の出力は無視する。
+
+    Args:
+        stderr: 標準エラー出力
+
+    Returns:
+        読み込まれたモジュールの一覧（出力順）
+    """
+    entries: List[ImportTime] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        stripped = name.lstrip(" ")
+        # 字下げは入れ子1段につき2文字（最上位も1文字の空白がある）
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append(
+            ImportTime(stripped, int(fields[0]), int(fields[1]), depth)
+        )
+    return entries
+
+
+def _command(name: str) -> List[str]:
+    if name == BASELINE:
+        return [sys.executable, "-c", "print()"]
+    return [sys.executable, ENTRY_POINTS[name]]
+
+
+def _cwd(name: str) -> Optional[Path]:
+    return None if name == BASELINE else APPROACHES_DIR / name
+
+
+def time_to_first_output(command: Sequence[str], stdin: bytes, cwd: Optional[Path]) -> float:
+    """
+    プロセスを起動してから標準出力の最初の1バイトが届くまでの秒数を返す
+
+    Raises:
+        RuntimeError: 何も出力せずに終了した場合、または異常終了した場合
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command, cwd=cwd,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    process.stdin.write(stdin)
+    process.stdin.close()
+    first = process.stdout.read(1)
+    elapsed = time.perf_counter() - start
+    process.stdout.read()
+    process.stdout.close()
+    if process.wait() != 0 or not first:
+        raise RuntimeError(f"{' '.join(command)} が正常に出力しなかった")
+    return elapsed
+
+
+def import_profile(command: Sequence[str], stdin: bytes, cwd: Optional[Path]) -> List[ImportTime]:
+    """-X importtime を付けて1回実行し、モジュールの読み込み時間を返す"""
+    completed = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]],
+        cwd=cwd, input=stdin, capture_output=True, check=True,
+    )
+    return parse_importtime(completed.stderr.decode("utf-8", "replace"))
+
+
+def measure_startup(name: str, runs: int = 20, top: int = 10) -> StartupResult:
+    """
+    エントリポイントの起動時間を計測する
+
+    Args:
+        name: ENTRY_POINTS のキー、または BASELINE
+        runs: 起動をくり返す回数
+        top: 報告する、読み込み時間（自身）の長いモジュールの数
+
+    Returns:
+        StartupResult
+    """
+    if name != BASELINE and name not in ENTRY_POINTS:
+        raise ValueError(
+            f"不明なアプローチ: {name}（{', '.join(ENTRY_POINTS)} から選択）"
+        )
+    command = _command(name)
+    cwd = _cwd(name)
+    stdin = INITIAL_POSITION.to_text().encode("ascii")
+
+    # 1回目はバイトコードキャッシュの作成を含むため計測しない
+    time_to_first_output(command, stdin, cwd)
+    samples = sorted(time_to_first_output(command, stdin, cwd) for _ in range(runs))
+
+    imports = import_profile(command, stdin, cwd)
+    return StartupResult(
+        name=name,
+        runs=runs,
+        first_output_p50_ms=percentile(samples, 50) * 1e3,
+        first_output_min_ms=samples[0] * 1e3,
+        import_total_ms=sum(entry.self_us for entry in imports) / 1e3,
+        modules=len(imports),
+        top_imports=sorted(imports, key=lambda entry: entry.self_us, reverse=True)[:top],
+    )
+
+
+def format_report(results: List[StartupResult]) -> str:
+    """計測結果を表と、読み込み時間の長いモジュールの一覧に整形する"""
+    lines = [
+        f"{'approach':<16} {'p50(ms)':>9} {'min(ms)':>9} {'import(ms)':>11} {'modules':>8}",
+        "-" * 57,
+    ]
+    for r in results:
+        lines.append(
+            f"{r.name:<16} {r.first_output_p50_ms:>9.1f} {r.first_output_min_ms:>9.1f} "
+            f"{r.import_total_ms:>11.1f} {r.modules:>8}"
+        )
+    for r in results:
+        if r.name == BASELINE:
+            continue
+        lines.append("")
+        lines.append(f"{r.name}: 読み込み時間（自身）の長いモジュール")
+        for entry in r.top_imports:
+            lines.append(f"  {entry.self_us / 1e3:>7.2f} ms  {entry.module}")
+    return "\n".join(lines)
+
+
+def _split(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="各アプローチの CLI の起動から最初の出力までの時間を計測する",
+    )
+    parser.add_argument(
+        "--approaches", type=_split, default=list(ENTRY_POINTS),
+        help=f"計測するアプローチ（カンマ区切り、既定: {','.join(ENTRY_POINTS)}）",
+    )
+    parser.add_argument("--runs", type=int, default=20, help="起動回数（既定: 20）")
+    parser.add_argument("--top", type=int, default=10, help="表示するモジュール数（既定: 10）")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力する")
+    args = parser.parse_args(argv)
+
+    results = [
+        measure_startup(name, args.runs, args.top)
+        for name in [BASELINE, *args.approaches]
+    ]
+
+    if args.json:
+        json.dump(
+            [
+                {**r._asdict(), "top_imports": [e._asdict() for e in r.top_imports]}
+                for r in results
+            ],
+            sys.stdout, indent=2,
+        )
+        sys.stdout.write("\n")
+    else:
+        print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
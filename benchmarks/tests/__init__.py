@@ -0,0 +1,5 @@
+"""
+tests パッケージ
+
+benchmarks パッケージのテストを含むパッケージ。
+"""
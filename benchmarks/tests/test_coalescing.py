@@ -0,0 +1,14 @@
+"""
+リクエストをまとめる待ち時間ごとの計測のテスト
+"""
+
+from benchmarks.coalescing import run_sweep
+
+
+def test_まとめない設定と各windowの結果を返す():
+    results = run_sweep([0.0, 1.0], max_batch=8, clients=4, requests=3, evaluator="loop")
+
+    assert [(r.window_ms, r.max_batch) for r in results] == [(0.0, 1), (0.0, 8), (1.0, 8)]
+    assert all(r.requests == 12 for r in results)
+    assert results[0].mean_batch_size == 1.0
+    assert all(r.requests_per_sec > 0 for r in results)
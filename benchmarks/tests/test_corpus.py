@@ -0,0 +1,46 @@
+"""
+局面コーパスのテスト
+"""
+
+import pytest
+
+from benchmarks.corpus import CATEGORIES, load_category, load_corpus, parse_positions
+
+
+def test_全カテゴリの局面を読み込める():
+    """各カテゴリのファイルから、8行8文字の盤面と手番の局面が読み込める"""
+    corpus = load_corpus()
+
+    assert list(corpus) == list(CATEGORIES)
+    for category, positions in corpus.items():
+        assert positions, f"{category} が空"
+        for position in positions:
+            assert len(position.rows) == 8
+            assert all(len(row) == 8 for row in position.rows)
+            assert set("".join(position.rows)) <= {".", "B", "W"}
+            assert position.player in ("B", "W")
+
+
+def test_コーパスは読み込むたびに同じ内容になる():
+    """固定ファイルなので、何度読み込んでも同じ局面が同じ順で得られる"""
+    assert load_category("midgame") == load_category("midgame")
+
+
+def test_空行とコメント行を読み飛ばす():
+    """局面の間の空行と '#' で始まる行は無視する"""
+    lines = ["# コメント", ""] + ["........"] * 8 + ["B", "", "# 次"] + ["BBBBBBBB"] * 8 + ["W"]
+
+    positions = list(parse_positions(lines))
+
+    assert [p.player for p in positions] == ["B", "W"]
+    assert positions[1].rows[0] == "BBBBBBBB"
+
+
+def test_末尾の局面が欠けている場合はエラーになる():
+    with pytest.raises(ValueError):
+        list(parse_positions(["........", "B"]))
+
+
+def test_不明なカテゴリはエラーになる():
+    with pytest.raises(ValueError):
+        load_category("unknown")
@@ -0,0 +1,54 @@
+"""
+エンジン（アプローチのアダプタ）とベンチマークのテスト
+"""
+
+import pytest
+
+from benchmarks.corpus import Position, load_corpus
+from benchmarks.engines import ENGINE_FACTORIES, load_engine
+from benchmarks.runner import benchmark, check_agreement, percentile
+
+
+INITIAL = Position(
+    ("........", "........", "........", "...WB...",
+     "...BW...", "........", "........", "........"),
+    "B",
+)
+
+
+@pytest.mark.parametrize("name", list(ENGINE_FACTORIES))
+def test_各エンジンが初期配置の合法手を返す(name):
+    engine = load_engine(name)
+
+    assert engine.legal_moves(INITIAL) == [(2, 3), (3, 2), (4, 5), (5, 4)]
+
+
+def test_全エンジンの結果がコーパス全体で一致する():
+    engines = [load_engine(name) for name in ENGINE_FACTORIES]
+
+    check_agreement(engines, load_corpus())
+
+
+def test_不明なエンジンはエラーになる():
+    with pytest.raises(ValueError):
+        load_engine("unknown")
+
+
+def test_パーセンタイルを最近傍順位で求める():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7], 99) == 7
+
+
+def test_計測結果に呼び出し回数と統計値が入る():
+    engine = load_engine("vibe_coding")
+
+    result = benchmark(engine, "initial", [INITIAL, INITIAL], repeat=3, warmup=1)
+
+    assert result.calls == 6
+    assert result.positions == 2
+    assert result.positions_per_sec > 0
+    assert 0 < result.p50_us <= result.p99_us
+    assert result.peak_memory_bytes >= 0
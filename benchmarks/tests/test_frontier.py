@@ -0,0 +1,21 @@
+"""
+全マス走査とフロンティアの比較のテスト
+"""
+
+from benchmarks.frontier import build_position, format_table, run
+
+
+def test_大きさごとに両方の時間を返す():
+    results = run([8, 40], moves=20, repeat=1)
+
+    assert [r.size for r in results] == [8, 40]
+    assert all(r.scan_ms > 0 and r.calculate_ms > 0 and r.frontier_ms > 0 for r in results)
+    assert all(r.update_ms > 0 for r in results)
+    assert "40x40" in format_table(results)
+
+
+def test_石の数はボードの大きさによらない():
+    small, _ = build_position(40, 30, seed=1)
+    large, _ = build_position(200, 30, seed=1)
+
+    assert small.stone_count == large.stone_count
@@ -0,0 +1,74 @@
+"""
+差分ファジングのテスト
+"""
+
+from benchmarks.corpus import Position
+from benchmarks.engines import Engine, load_engine
+from benchmarks.fuzz import (
+    default_engine_names,
+    find_mismatch,
+    generate_positions,
+    load_fuzz_engine,
+    minimize,
+    run_fuzz,
+)
+
+
+def _corner_blind(engine: Engine) -> Engine:
+    """角 (0, 0) を合法手として返さない、わざと壊したエンジン"""
+    return engine._replace(
+        name="corner_blind",
+        to_moves=lambda result: [m for m in engine.to_moves(result) if m != (0, 0)],
+    )
+
+
+def test_同じ種とチャンク番号なら同じ局面を作る():
+    for kind in ("random", "reachable", "mixed"):
+        first = generate_positions(kind, seed=3, chunk_index=5, count=50)
+        assert first == generate_positions(kind, seed=3, chunk_index=5, count=50)
+        assert first != generate_positions(kind, seed=3, chunk_index=6, count=50)
+        assert all(len(p.rows) == 8 and p.player in "BW" for p in first)
+
+
+def test_対局で現れる局面は初期配置から始まる():
+    positions = generate_positions("reachable", seed=0, chunk_index=0, count=3)
+
+    assert positions[0].rows[3:5] == ("...WB...", "...BW...")
+    assert positions[0].player == "B"
+    assert sum(row.count(".") for row in positions[1].rows) == 59
+
+
+def test_全エンジンが一致すれば不一致なしで局面数を数える():
+    result = run_fuzz(default_engine_names(), positions=120, workers=1, chunk=50)
+
+    assert result.mismatch is None
+    assert result.checked == 120
+    assert result.positions_per_sec > 0
+
+
+def test_ワーカープロセスでも同じように調べる():
+    result = run_fuzz(["plan_driven", "vibe_coding"], positions=200, workers=2, chunk=50)
+
+    assert result.mismatch is None
+    assert result.checked == 200
+
+
+def test_不一致の局面を石を取り除いて最小化する():
+    reference = load_fuzz_engine("plan_driven")
+    broken = _corner_blind(load_engine("vibe_coding"))
+    position = Position(
+        ("..WB....", "WW......", "BW.W....", "B..B....",
+         "..BWWB..", "........", ".....W..", "........"),
+        "B",
+    )
+
+    mismatch = find_mismatch([reference, broken], position)
+    assert mismatch is not None
+
+    minimized = minimize([reference, broken], mismatch)
+
+    # (0, 0) に黒を置いて白を挟める最小の形（白1つと黒1つ）が残る
+    stones = sum(8 - row.count(".") for row in minimized.position.rows)
+    assert stones == 2
+    assert (0, 0) in minimized.results["plan_driven"]
+    assert (0, 0) not in minimized.results["corner_blind"]
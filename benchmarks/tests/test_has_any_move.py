@@ -0,0 +1,18 @@
+"""
+パスの判定（列挙と has_any_legal_move）の比較のテスト
+"""
+
+from benchmarks.has_any_move import format_table, run
+
+
+def test_アプローチとカテゴリごとに判定の時間を返す():
+    results = run(["midgame", "pathological"], repeat=1)
+
+    assert [(r.approach, r.category) for r in results] == [
+        ("plan_driven", "midgame"), ("plan_driven", "pathological"),
+        ("spec_driven", "midgame"), ("spec_driven", "pathological"),
+    ]
+    assert all(r.checks > 0 and r.enumerate_us > 0 and r.probe_us > 0 for r in results)
+    # pathological にはどちらも置けない局面が含まれる
+    assert all(r.without_moves > 0 for r in results if r.category == "pathological")
+    assert "speedup" in format_table(results)
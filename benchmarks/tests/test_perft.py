@@ -0,0 +1,94 @@
+"""
+perft のテスト
+"""
+
+import pytest
+
+from benchmarks.corpus import Position
+from benchmarks.engines import ENGINE_FACTORIES, load_engine
+from benchmarks.perft import INITIAL_POSITION, NATIVE_WALKERS, perft, read_position, run_perft
+
+
+# 初期配置からの葉の数（深さ 0〜5）
+KNOWN_NODES = [1, 4, 12, 56, 244, 1396]
+
+
+@pytest.mark.parametrize("name", list(ENGINE_FACTORIES))
+def test_各エンジンで初期配置からの葉の数が既知の値と一致する(name):
+    engine = load_engine(name)
+
+    for depth, expected in enumerate(KNOWN_NODES[:5]):
+        assert perft(engine, INITIAL_POSITION, depth).nodes == expected
+
+
+@pytest.mark.parametrize("name", list(NATIVE_WALKERS))
+def test_nativeとadapterで初手ごとの葉の数が一致する(name):
+    engine = load_engine(name)
+
+    native = perft(engine, INITIAL_POSITION, 5, divide=True)
+    adapter = perft(engine, INITIAL_POSITION, 5, divide=True, native=False)
+
+    assert (native.mode, adapter.mode) == ("native", "adapter")
+    assert native.divide == adapter.divide
+    assert native.nodes == adapter.nodes == 1396
+
+
+def test_adapterのときだけ盤面の変換の時間を別に報告する():
+    native = perft(load_engine("plan_driven"), INITIAL_POSITION, 4)
+    adapter = perft(load_engine("vibe_coding"), INITIAL_POSITION, 4)
+
+    assert native.adapter_seconds == 0.0
+    assert 0.0 < adapter.adapter_seconds < adapter.seconds
+
+
+def test_初手ごとの葉の数の合計が全体と一致する():
+    engine = load_engine("plan_driven")
+
+    result = perft(engine, INITIAL_POSITION, 5, divide=True)
+
+    assert len(result.divide) == 4
+    assert sum(result.divide.values()) == result.nodes == 1396
+
+
+def test_パスを1手として数える():
+    """
+    黒に合法手がなく白にはある局面では、パスして白の手を展開する
+    """
+    position = Position(
+        ("WB......", "........", "........", "........",
+         "........", "........", "........", "........"),
+        "B",
+    )
+    engine = load_engine("plan_driven")
+
+    result = perft(engine, position, 1, divide=True)
+
+    assert result.nodes == 1
+    assert result.divide == {"pass": 1}
+    assert perft(engine, position, 2).nodes == 1
+
+
+def test_終局した局面は葉として数える():
+    position = Position(("BBBBBBBB",) * 8, "W")
+    engine = load_engine("plan_driven")
+
+    assert perft(engine, position, 3).nodes == 1
+
+
+def test_複数エンジンの結果を照合する():
+    engines = [load_engine(name) for name in ("plan_driven", "vibe_coding")]
+    lines = []
+
+    results = run_perft(engines, INITIAL_POSITION, 3, report=lines.append)
+
+    assert [r.nodes for r in results] == [56, 56]
+    assert len(lines) == 2
+
+
+def test_局面ファイルを読み込める(tmp_path):
+    path = tmp_path / "board.txt"
+    path.write_text("\n".join(INITIAL_POSITION.rows) + "\nW\n", encoding="utf-8")
+
+    position = read_position(str(path))
+
+    assert position == Position(INITIAL_POSITION.rows, "W")
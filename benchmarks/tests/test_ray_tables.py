@@ -0,0 +1,13 @@
+"""
+レイ表の導入前後の比較のテスト
+"""
+
+from benchmarks.ray_tables import format_table, run
+
+
+def test_カテゴリごとに前後の時間を返す():
+    results = run(["opening", "endgame"], repeat=1)
+
+    assert [r.category for r in results] == ["opening", "endgame"]
+    assert all(r.positions > 0 and r.before_us > 0 and r.after_us > 0 for r in results)
+    assert "speedup" in format_table(results)
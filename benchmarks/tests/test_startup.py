@@ -0,0 +1,43 @@
+"""
+起動時間の計測のテスト
+"""
+
+from benchmarks.startup import BASELINE, measure_startup, parse_importtime
+
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | io
+import time:        80 |         80 |     domain.move_record
+import time:       200 |        280 |   domain.game_rules
+Traceback は無視する
+"""
+
+
+def test_importtimeの出力からモジュールごとの時間と入れ子の深さを読み取る():
+    entries = parse_importtime(IMPORTTIME_SAMPLE)
+
+    assert [e.module for e in entries] == [
+        "_io", "io", "domain.move_record", "domain.game_rules"
+    ]
+    assert [e.depth for e in entries] == [1, 0, 2, 1]
+    assert entries[1].self_us == 300
+    assert entries[1].cumulative_us == 420
+
+
+def test_plan_drivenのCLIはtypingとimportlib_utilを読み込まずに出力する():
+    result = measure_startup("plan_driven", runs=1, top=100)
+
+    modules = {entry.module for entry in result.top_imports}
+    assert "input_reader" in modules
+    assert "typing" not in modules
+    assert "importlib.util" not in modules
+    assert result.first_output_p50_ms > 0
+
+
+def test_インタプリタだけの起動時間も計測できる():
+    result = measure_startup(BASELINE, runs=1)
+
+    assert result.name == BASELINE
+    assert result.first_output_min_ms > 0